@@ -12,24 +12,14 @@ from bpy_extras.io_utils import (
     orientation_helper,
     axis_conversion,
 )
-if "blender_io" in locals():
-    print('reload', 'blender_io')
-    import importlib
-    importlib.reload(blender_io)  # pylint: disable=E0601
-
-    importlib.reload(glb)  # pylint: disable=E0601
-    importlib.reload(gltftypes)  # pylint: disable=E0601
-    importlib.reload(gltf_buffer)  # pylint: disable=E0601
-    importlib.reload(texture_io)  # pylint: disable=E0601
-    importlib.reload(material_io)  # pylint: disable=E0601
-    importlib.reload(mesh_io)  # pylint: disable=E0601
-    importlib.reload(node_io)  # pylint: disable=E0601
-    importlib.reload(node)  # pylint: disable=E0601
-    importlib.reload(import_manager)  # pylint: disable=E0601
-
-from . import blender_io  # pylint: disable=C0413
-from .blender_io import (texture_io, material_io, mesh_io, node_io,
-                         node, import_manager, gltf_buffer, gltftypes, glb)
+if "ImportGLTF" in locals():
+    # blender_io is imported on first execute. drop it to reload on next use.
+    # the package attribute too, or `from . import blender_io` returns it
+    import sys
+    for name in [name for name in sys.modules
+                 if name.startswith(__name__ + '.blender_io')]:
+        del sys.modules[name]
+    globals().pop('blender_io', None)
 
 
 bl_info = {
@@ -64,6 +54,139 @@ class ImportGLTF(bpy.types.Operator):
 
     yup_to_zup = BoolProperty(default=True)
 
+    metadata_mode = EnumProperty(
+        name="Metadata",
+        description="How to keep the gltf json of nodes and materials",
+        items=(
+            ('NONE', 'None', 'Do not store gltf json'),
+            ('COMPACT', 'Compact',
+             'Store unmapped keys as compact json per object'),
+            ('TEXT', 'Text',
+             'Store all json in one Text datablock indexed by gltf index'),
+        ),
+        default='NONE',
+    )
+
+    scene_index = IntProperty(
+        name="Scene",
+        description="Index of the gltf scene to import. -1 is glTF.scene",
+        default=-1,
+        min=-1,
+    )
+
+    extract_images = BoolProperty(
+        name="Extract Images",
+        description="Write embedded images next to the .blend instead of packing them",
+        default=False,
+    )
+
+    lazy_textures = BoolProperty(
+        name="Lazy Textures",
+        description="Do not decode textures on import. External files load on first draw, embedded ones with Load GLTF Source Textures",
+        default=False,
+    )
+
+    proxy_size = IntProperty(
+        name="Proxy Texture Size",
+        description="Downscale textures larger than this. 0 is full resolution",
+        default=0,
+        min=0,
+    )
+
+    import_animation = BoolProperty(
+        name="Animation",
+        description="Import animations as actions",
+        default=True,
+    )
+
+    keyframe_tolerance = FloatProperty(
+        name="Keyframe Tolerance",
+        description="Remove keyframes that move the curve less than this. 0 keeps all keyframes",
+        default=0.0,
+        min=0.0,
+        precision=4,
+    )
+
+    bake_animation = BoolProperty(
+        name="Bake Animation",
+        description="Resample animation at the scene frame rate. Rotations are slerped, cubic splines evaluated exactly",
+        default=False,
+    )
+
+    vrm_blend_shapes = EnumProperty(
+        name="VRM Blend Shapes",
+        description="How VRM blend shape groups are bound to shape keys",
+        items=(
+            ('DRIVERS', 'Drivers',
+             'Group weight properties drive the bound shape keys'),
+            ('PROPERTIES', 'Properties',
+             'Only store group weights and binds as custom properties'),
+        ),
+        default='DRIVERS',
+    )
+
+    instancing = EnumProperty(
+        name="Instancing",
+        description="How EXT_mesh_gpu_instancing and repeated meshes are instanced",
+        items=(
+            ('FACES', 'Instancer Faces',
+             'One mesh whose faces place the instances. Non-uniform scale falls back to collections'),
+            ('COLLECTION', 'Collection Instances',
+             'One empty per instance of a shared collection'),
+        ),
+        default='FACES',
+    )
+
+    instance_repeated = BoolProperty(
+        name="Instance Repeated Meshes",
+        description="Instance static mesh leaf nodes that share a parent and a mesh",
+        default=False,
+    )
+
+    flatten_static = BoolProperty(
+        name="Merge Static Meshes",
+        description="Bake transforms of static meshes and merge them into one mesh per material",
+        default=False,
+    )
+
+    bounds_only = BoolProperty(
+        name="Bounding Box Proxies",
+        description="Only read the json. Meshes become boxes from accessor min/max",
+        default=False,
+    )
+
+    node_filter = StringProperty(
+        name="Node Filter",
+        description="Import only nodes matching this glob, with their children. Empty imports all",
+        default="",
+    )
+
+    mesh_filter = StringProperty(
+        name="Mesh Filter",
+        description="Import only nodes whose mesh name matches this glob. Empty imports all",
+        default="",
+    )
+
+    root_nodes = StringProperty(
+        name="Root Nodes",
+        description="Comma separated gltf node indices to import with their children",
+        default="",
+    )
+
+    lod_level = IntProperty(
+        name="LOD Level",
+        description="MSFT_lod level to import. 0 is the most detailed",
+        default=0,
+        min=0,
+    )
+
+    memory_budget = IntProperty(
+        name="Memory Budget (MB)",
+        description="Use proxy textures and skip animation to fit, or cancel. 0 is unlimited",
+        default=0,
+        min=0,
+    )
+
     def invoke(self, context, _event):
         context.window_manager.fileselect_add(self)
         return {'RUNNING_MODAL'}
@@ -76,9 +199,54 @@ class ImportGLTF(bpy.types.Operator):
                 'axis_up'
             )
         )
+        # heavy modules are loaded on first use, not on register
+        from . import blender_io
         return blender_io.load(context, **keywords)
 
 
+class LoadSourceTextures(bpy.types.Operator):
+    """Load full resolution pixels of lazy or proxy GLTF textures"""
+    bl_idname = "image.iogltf_load_source_textures"
+    bl_label = "Load GLTF Source Textures"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    selected_only = BoolProperty(
+        name="Selected Only",
+        description="Only textures used by the materials of selected objects",
+        default=False,
+    )
+
+    def execute(self, context):
+        from .blender_io import texture_io
+        if self.selected_only:
+            images = set()
+            for obj in context.selected_objects:
+                for slot in obj.material_slots:
+                    if slot.material and slot.material.node_tree:
+                        for node in slot.material.node_tree.nodes:
+                            if node.type == 'TEX_IMAGE' and node.image:
+                                images.add(node.image)
+        else:
+            images = bpy.data.images
+        texture_io.load_source_images(images)
+        return {'FINISHED'}
+
+
+class LoadFullGeometry(bpy.types.Operator):
+    """Replace GLTF bounding box proxies of selected objects with full meshes"""
+    bl_idname = "object.iogltf_load_full_geometry"
+    bl_label = "Load GLTF Full Geometry"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        from . import blender_io
+        _, skipped = blender_io.load_geometry(context, context.selected_objects)
+        if skipped:
+            self.report({'WARNING'},
+                        f'{skipped} skinned proxies kept, their armature is missing')
+        return {'FINISHED'}
+
+
 def menu_func_import(self, _context):
     self.layout.operator(ImportGLTF.bl_idname,
                          text="GL Transmission Format (.gltf)")
@@ -90,6 +258,8 @@ def menu_func_import(self, _context):
 
 CLASSES = (
     ImportGLTF,
+    LoadSourceTextures,
+    LoadFullGeometry,
 )
 
 
@@ -1,6 +1,5 @@
-import json
 import pathlib
-from typing import Set, List
+from typing import Set, List, Dict, Any, Iterable, Tuple
 
 from progress_report import ProgressReport  # , ProgressReportSubstep
 import bpy
@@ -10,10 +9,15 @@ from . import glb
 from .import_manager import ImportManager
 from .texture_io import load_textures
 from .material_io import load_materials
-from .mesh_io import load_meshes
+from .mesh_io import load_meshes, load_proxy_meshes
 from .node_io import load_objects
+from .animation_io import load_animations
+from .vrm_io import load_vrm
+from . import flatten
 from .node import Node
 from . import gltf_buffer
+from . import selection
+from . import planner
 
 
 from logging import getLogger  # pylint: disable=C0411
@@ -50,11 +54,11 @@ def _setup_skinning(blender_object: bpy.types.Object,
             for joint_idx in attributes.joints[vert_idx]:
                 if cpt > 3:
                     break
-                weight_val = attributes.weights[vert_idx][cpt]
+                weight_val = float(attributes.weights[vert_idx][cpt])
                 if weight_val != 0.0:
                     # It can be a problem to assign weights of 0
                     # for bone index 0, if there is always 4 indices in joint_ tuple
-                    bone_name = bone_names[joint_idx]
+                    bone_name = bone_names[int(joint_idx)]
                     if bone_name:
                         group = blender_object.vertex_groups[bone_name]
                         group.add([vert_idx], weight_val, 'REPLACE')
@@ -70,31 +74,95 @@ def _setup_skinning(blender_object: bpy.types.Object,
     modifier.object = armature_object
 
 
-def _remove_empty(node: Node):
-    for i in range(len(node.children)-1, -1, -1):
-        child = node.children[i]
-        _remove_empty(child)
+def _remove_empty(root: Node)->None:
+    # flatten to pre-order index arrays
+    nodes: List[Node] = []
+    parents: List[int] = []
+    stack = [(root, -1)]
+    while stack:
+        node, parent = stack.pop()
+        index = len(nodes)
+        nodes.append(node)
+        parents.append(parent)
+        for child in reversed(node.children):
+            stack.append((child, index))
+    child_count = [len(node.children) for node in nodes]
 
-    if node.children:
-        print(f'{node} children {len(node.children)}')
-        return
-    if node.blender_armature:
-        print(f'{node} has {node.blender_armature}')
-        return
-    if node.blender_object.data:
-        print(f'{node} has {node.blender_object}')
+    # bottom-up. children always come after their parent in pre-order
+    remove = [False] * len(nodes)
+    for i in range(len(nodes)-1, -1, -1):
+        node = nodes[i]
+        if child_count[i]:
+            logger.debug('%s children %d', node, child_count[i])
+            continue
+        if node.blender_armature:
+            logger.debug('%s has %s', node, node.blender_armature)
+            continue
+        if node.instance_count:
+            logger.debug('%s has %d instances', node, node.instance_count)
+            continue
+        if node.blender_object.data:
+            logger.debug('%s has %s', node, node.blender_object)
+            continue
+        if node.blender_object.animation_data:
+            logger.debug('%s is animated', node)
+            continue
+        remove[i] = True
+        if parents[i] != -1:
+            child_count[parents[i]] -= 1
+
+    removed = [node for node, is_removed in zip(nodes, remove) if is_removed]
+    if not removed:
         return
+    logger.debug('remove %d empties', len(removed))
+    bpy.data.batch_remove([node.blender_object for node in removed])
+
+    for node in removed:
+        node.blender_object = None
 
-    # remove empty
-    print('remove', node)
-    bpy.data.objects.remove(node.blender_object, do_unlink=True)
-    if node.parent:
-        node.parent.children.remove(node)
+    # rebuild children once
+    for i, node in enumerate(nodes):
+        if not remove[i] and len(node.children) != child_count[i]:
+            node.children = [child for child in node.children
+                             if child.blender_object]
+
+
+def _log_stats(stats: Dict[str, Any])->None:
+    for k, v in stats.items():
+        if isinstance(v, dict):
+            values = list(v.values())
+            if values and all(isinstance(x, (int, float)) for x in values):
+                logger.info('%s: %d items, total %s, max %s',
+                            k, len(values), sum(values), max(values))
+            else:
+                logger.info('%s: %s', k, v)
+            for name, x in v.items():
+                logger.debug('    %s: %s', name, x)
+        else:
+            logger.info('%s: %s', k, v)
 
 
 def load(context,
          filepath: str,
-         yup_to_zup: bool
+         yup_to_zup: bool,
+         metadata_mode: str = 'NONE',
+         scene_index: int = -1,
+         extract_images: bool = False,
+         lazy_textures: bool = False,
+         proxy_size: int = 0,
+         import_animation: bool = True,
+         keyframe_tolerance: float = 0.0,
+         bake_animation: bool = False,
+         vrm_blend_shapes: str = 'DRIVERS',
+         instancing: str = 'FACES',
+         instance_repeated: bool = False,
+         flatten_static: bool = False,
+         bounds_only: bool = False,
+         node_filter: str = '',
+         mesh_filter: str = '',
+         root_nodes: str = '',
+         lod_level: int = 0,
+         memory_budget: int = 0
          )->Set[str]:
 
     path = pathlib.Path(filepath)
@@ -104,49 +172,176 @@ def load(context,
     with ProgressReport(context.window_manager) as progress:
         progress.enter_substeps(5, "Importing GLTF %r..." % path.name)
 
-        body = b''
         try:
-            with path.open('rb') as f:
-                ext = path.suffix.lower()
-                if ext == '.gltf':
-                    gltf = gltftypes.from_json(json.load(f))
-                elif ext == '.glb' or ext == '.vrm':
-                    gltf, body = glb.parse_glb(f.read())
-                else:
-                    logger.error("%s is not supported", ext)
-                    return {'CANCELLED'}
+            if bounds_only:
+                gltf, body = glb.parse_path_json(path), b''
+            else:
+                gltf, body = glb.parse_path(path)
         except Exception as ex:  # pylint: disable=w0703
             logger.error("%s", ex)
             return {'CANCELLED'}
 
-        manager = ImportManager(path, gltf, body, yup_to_zup)
-        manager.textures.extend(load_textures(progress, manager))
-        manager.materials.extend(load_materials(progress, manager))
-        manager.meshes.extend(load_meshes(progress, manager))
+        manager = ImportManager(path, gltf, body, yup_to_zup,
+                                metadata_mode=metadata_mode,
+                                scene_index=scene_index,
+                                extract_images=extract_images,
+                                lazy_textures=lazy_textures,
+                                proxy_size=proxy_size,
+                                import_animation=import_animation,
+                                keyframe_tolerance=keyframe_tolerance,
+                                bake_animation=bake_animation,
+                                vrm_blend_shapes=vrm_blend_shapes,
+                                instancing=instancing,
+                                instance_repeated=instance_repeated,
+                                flatten_static=flatten_static,
+                                bounds_only=bounds_only,
+                                node_filter=node_filter,
+                                mesh_filter=mesh_filter,
+                                root_nodes=root_nodes,
+                                lod_level=lod_level)
+
+        # MB. 0 is unlimited
+        if memory_budget > 0:
+            options = {
+                'import_animation': manager.import_animation,
+                'proxy_size': manager.proxy_size,
+                'lazy_textures': manager.lazy_textures,
+                'bounds_only': manager.bounds_only,
+            }
+            plan, changed = planner.fit_budget(gltf, manager.selection,
+                                               memory_budget << 20, options,
+                                               body, manager.base_dir)
+            if changed is None:
+                logger.error('%s needs %dMB, over the budget of %dMB',
+                             path.name, plan.memory >> 20, memory_budget)
+                return {'CANCELLED'}
+            for k, v in changed.items():
+                setattr(manager, k, v)
+            manager.stats['plan'] = str(plan)
+            if changed:
+                manager.stats['budget'] = ', '.join(
+                    f'{k}={v}' for k, v in changed.items())
+        if manager.bounds_only:
+            manager.meshes.extend(load_proxy_meshes(progress, manager))
+        else:
+            manager.textures.extend(load_textures(progress, manager))
+            manager.materials.extend(load_materials(progress, manager))
+            manager.meshes.extend(load_meshes(progress, manager))
         nodes, root = load_objects(context, progress, manager)
 
-        # skinning
+        if manager.bounds_only:
+            for node in nodes:
+                if node and node.blender_object and node.blender_object.type == 'MESH':
+                    node.blender_object.display_type = 'WIRE'
+
+        # skinning. proxies have no vertex weights, load_geometry skins them
         armature_object = next(
-            node for node in root.traverse() if node.blender_armature)
+            (node for node in root.traverse() if node.blender_armature), None)
 
         for node in nodes:
-            if node.gltf_node.mesh != -1 and node.gltf_node.skin != -1:
-                _, attributes = manager.meshes[node.gltf_node.mesh]
-
+            if not node or not armature_object:
+                continue
+            if node.gltf_node.mesh in manager.selection.meshes \
+                    and node.gltf_node.skin != -1:
                 skin = gltf.skins[node.gltf_node.skin]
                 bone_names = [
-                    nodes[joint].bone_name for joint in skin.joints]
+                    nodes[joint].bone_name if nodes[joint] else ''
+                    for joint in skin.joints]
 
                 #armature_object =nodes[skin.skeleton].blender_armature
 
+                if manager.bounds_only:
+                    node.blender_object['gltf_bones'] = bone_names
+                    node.blender_object['gltf_armature'] = \
+                        armature_object.blender_armature.name
+                    continue
+
+                _, attributes = manager.meshes[node.gltf_node.mesh]
                 _setup_skinning(node.blender_object, attributes,
                                 bone_names,
                                 armature_object.blender_armature)
 
-        # remove empties
-        _remove_empty(root)
+        if manager.import_animation and not manager.bounds_only:
+            load_animations(context, progress, manager, nodes)
+
+        load_vrm(progress, manager, nodes, root)
+
+        if manager.flatten_static and not manager.bounds_only:
+            flatten.flatten_static(manager, root)
+
+        # remove empties. flatten_static may have merged the root too
+        if root.blender_object:
+            _remove_empty(root)
+
+        manager.metadata.finish()
+
+        _log_stats(manager.stats)
 
         # done
         context.scene.update()
         progress.leave_substeps("Finished")
         return {'FINISHED'}
+
+
+def load_geometry(context, objects: Iterable[bpy.types.Object])->Tuple[int, int]:
+    '''
+    replace bounding box proxies of objects with the full meshes.
+    each source file is read once for all of its objects.
+    skinned proxies get vertex groups and an armature modifier, or are
+    skipped if their armature is gone. returns replaced and skipped counts
+    '''
+    by_file: Dict[Tuple[str, bool], Dict[int, List[bpy.types.Object]]] = {}
+    for obj in objects:
+        if obj.type != 'MESH' or 'gltf_proxy' not in obj.data:
+            continue
+        mesh = obj.data
+        key = (mesh['gltf_source_file'], bool(mesh['gltf_yup_to_zup']))
+        by_file.setdefault(key, {}).setdefault(
+            mesh['gltf_proxy'], []).append(obj)
+
+    count = 0
+    skipped = 0
+    with ProgressReport(context.window_manager) as progress:
+        progress.enter_substeps(len(by_file), "Loading GLTF geometry...")
+        for (filepath, yup_to_zup), mesh_objects in by_file.items():
+            path = pathlib.Path(filepath)
+            try:
+                gltf, body = glb.parse_path(path)
+            except Exception as ex:  # pylint: disable=w0703
+                logger.error("%s", ex)
+                progress.step()
+                continue
+
+            manager = ImportManager(path, gltf, body, yup_to_zup)
+            manager.selection = selection.from_meshes(gltf, mesh_objects.keys())
+            manager.textures.extend(load_textures(progress, manager))
+            manager.materials.extend(load_materials(progress, manager))
+            manager.meshes.extend(load_meshes(progress, manager))
+
+            proxies = set()
+            for index, objs in mesh_objects.items():
+                blender_mesh, attributes = manager.meshes[index]
+                for obj in objs:
+                    armature = None
+                    if 'gltf_bones' in obj:
+                        armature = bpy.data.objects.get(obj['gltf_armature'])
+                        if not armature or armature.type != 'ARMATURE':
+                            logger.warning('%s: armature %s not found, keep the proxy',
+                                           obj.name, obj['gltf_armature'])
+                            skipped += 1
+                            continue
+                    proxies.add(obj.data)
+                    obj.data = blender_mesh
+                    obj.display_type = 'TEXTURED'
+                    if armature:
+                        _setup_skinning(obj, attributes,
+                                        list(obj['gltf_bones']), armature)
+                        del obj['gltf_bones']
+                        del obj['gltf_armature']
+                    count += 1
+            bpy.data.batch_remove([mesh for mesh in proxies if not mesh.users])
+            progress.step()
+        progress.leave_substeps()
+
+    logger.info('replaced %d proxies, skipped %d', count, skipped)
+    return count, skipped
@@ -0,0 +1,288 @@
+from typing import List, Optional, Dict, Any
+
+import bpy
+import numpy
+from progress_report import ProgressReport
+
+from . import gltftypes
+from .import_manager import ImportManager
+from .node import Node, escape_identifier
+from .animation_math import (AxisConversion, quat_mul, quat_conjugate,
+                             quat_make_continuous, quat_to_matrix)
+from .keyframe_reduction import reduce_keys
+from .animation_sampler import Track, frame_times, resample
+
+from logging import getLogger  # pylint: disable=C0411
+logger = getLogger(__name__)
+
+Path = gltftypes.AnimationChannelTarget_path
+Interpolation = gltftypes.AnimationSampler_interpolation
+
+# Keyframe.interpolation enum values
+KEYFRAME_INTERPOLATION = {
+    Interpolation.STEP: 0,  # CONSTANT
+    Interpolation.LINEAR: 1,
+    Interpolation.CUBICSPLINE: 2,  # BEZIER
+}
+
+# Keyframe.handle_left_type/handle_right_type
+HANDLE_FREE = 0
+
+PROPERTY_NAMES = {
+    Path.translation: 'location',
+    Path.rotation: 'rotation_quaternion',
+    Path.scale: 'scale',
+}
+
+
+def decode_track(manager: ImportManager,
+                 sampler: gltftypes.AnimationSampler)->Track:
+    times = manager.get_float_ndarray(sampler.input)[:, 0]
+    output = manager.get_float_ndarray(sampler.output)
+    return Track.from_output(times, output, sampler.interpolation)
+
+
+class BoneSpace:
+    '''
+    node local TRS to pose bone basis.
+
+    basis = C^-1 @ L_rest^-1 @ L(t) @ C, where C is the bone orientation
+    relative to the node frame. rest scale is assumed to be uniform.
+    '''
+
+    def __init__(self, manager: ImportManager, node: Node,
+                 bone: bpy.types.Bone)->None:
+        t0, r0, s0 = node.get_local_trs(manager)
+        c = (node.get_world_matrix(manager).inverted_safe() @ bone.matrix_local
+             ).to_3x3().normalized().to_quaternion()
+
+        self.t0 = numpy.array(t0, numpy.float32)
+        self.s0 = numpy.array(s0, numpy.float32)
+        self.c = numpy.array(c, numpy.float32)
+        c_inv_r0_inv = c.inverted() @ r0.inverted()
+        self.left = numpy.array(c_inv_r0_inv, numpy.float32)
+        self.loc_matrix = quat_to_matrix(
+            self.left).astype(numpy.float32)
+        self.scale_matrix = numpy.abs(quat_to_matrix(
+            quat_conjugate(self.c))).astype(numpy.float32)
+
+    def translation(self, v: numpy.ndarray)->numpy.ndarray:
+        return (v - self.t0) @ self.loc_matrix.T
+
+    def translation_tangent(self, v: numpy.ndarray)->numpy.ndarray:
+        return v @ self.loc_matrix.T
+
+    def rotation(self, q: numpy.ndarray)->numpy.ndarray:
+        return quat_mul(quat_mul(self.left, q), self.c)
+
+    def scale(self, s: numpy.ndarray)->numpy.ndarray:
+        return (s / self.s0) @ self.scale_matrix.T
+
+
+def _add_fcurve(action: bpy.types.Action, data_path: str, index: int,
+                group: str, interpolation: Interpolation,
+                times: numpy.ndarray, frames: numpy.ndarray,
+                values: numpy.ndarray, in_tangents: Optional[numpy.ndarray],
+                out_tangents: Optional[numpy.ndarray])->int:
+    '''
+    fill one fcurve with a single add + foreach_set
+    '''
+    count = len(frames)
+    fcurve = action.fcurves.new(data_path, index=index, action_group=group)
+    points = fcurve.keyframe_points
+    points.add(count)
+
+    co = numpy.empty((count, 2), numpy.float32)
+    co[:, 0] = frames
+    co[:, 1] = values
+    points.foreach_set('co', co.ravel())
+    points.foreach_set('interpolation', numpy.full(
+        count, KEYFRAME_INTERPOLATION[interpolation], numpy.int32))
+
+    if interpolation == Interpolation.CUBICSPLINE and count > 1:
+        # hermite to bezier. tangents are per second
+        dt = numpy.diff(times)
+        dframe = numpy.diff(frames)
+        left = co.copy()
+        right = co.copy()
+        left[1:, 0] -= dframe / 3
+        left[1:, 1] -= in_tangents[1:] * dt / 3
+        right[:-1, 0] += dframe / 3
+        right[:-1, 1] += out_tangents[:-1] * dt / 3
+        handle_types = numpy.full(count, HANDLE_FREE, numpy.int32)
+        points.foreach_set('handle_left_type', handle_types)
+        points.foreach_set('handle_right_type', handle_types)
+        points.foreach_set('handle_left', left.ravel())
+        points.foreach_set('handle_right', right.ravel())
+    else:
+        fcurve.update()
+
+    return count
+
+
+class ActionBuilder:
+    def __init__(self, name: str, is_active: bool, fps: float,
+                 tolerance: float = 0.0)->None:
+        self.name = name
+        self.is_active = is_active
+        self.fps = fps
+        # 0 keeps all keys
+        self.tolerance = tolerance
+        self.actions: Dict[Any, bpy.types.Action] = {}
+        # before and after reduction
+        self.source_count = 0
+        self.keyframe_count = 0
+        self.last_frame = 0.0
+
+    def get_action(self, id_data: bpy.types.ID)->bpy.types.Action:
+        action = self.actions.get(id_data)
+        if not action:
+            action = bpy.data.actions.new(f'{self.name}_{id_data.name}')
+            if not id_data.animation_data:
+                id_data.animation_data_create()
+            if self.is_active:
+                id_data.animation_data.action = action
+            else:
+                action.use_fake_user = True
+            self.actions[id_data] = action
+        return action
+
+    def add_track(self, id_data: bpy.types.ID, data_path: str, group: str,
+                  track: Track)->None:
+        action = self.get_action(id_data)
+        if len(track.times):
+            self.last_frame = max(self.last_frame,
+                                  float(track.times[-1]) * self.fps)
+        for i in range(track.values.shape[1]):
+            times = track.times
+            values = track.values[:, i]
+            in_tangents = track.in_tangents[:, i] \
+                if track.in_tangents is not None else None
+            out_tangents = track.out_tangents[:, i] \
+                if track.out_tangents is not None else None
+            self.source_count += len(times)
+            if self.tolerance > 0:
+                keys = reduce_keys(track.interpolation, times, values,
+                                   self.tolerance, in_tangents, out_tangents)
+                times = times[keys]
+                values = values[keys]
+                if in_tangents is not None:
+                    in_tangents = in_tangents[keys]
+                    out_tangents = out_tangents[keys]
+            self.keyframe_count += _add_fcurve(
+                action, data_path, i, group, track.interpolation,
+                times, times * self.fps, values, in_tangents, out_tangents)
+
+
+def _get_armature_object(nodes: List[Optional[Node]])->Optional[bpy.types.Object]:
+    for node in nodes:
+        if node and node.blender_armature:
+            return node.blender_armature
+    return None
+
+
+def _load_channel(manager: ImportManager, builder: ActionBuilder,
+                  animation: gltftypes.Animation,
+                  channel: gltftypes.AnimationChannel,
+                  node: Node, armature_object: Optional[bpy.types.Object],
+                  bone_spaces: Dict[int, BoneSpace])->None:
+    path = channel.target.path
+    track = decode_track(manager, animation.samplers[channel.sampler])
+    if manager.bake_animation:
+        track = resample(track, frame_times(track.times, builder.fps),
+                         path == Path.rotation)
+    axis = AxisConversion(manager.yup_to_zup)
+
+    if path == Path.weights:
+        if node.gltf_node.mesh not in manager.selection.meshes \
+                or not node.blender_object:
+            return
+        shape_keys = node.blender_object.data.shape_keys
+        if not shape_keys:
+            logger.debug('%s has no shape keys', node)
+            return
+        for i in range(track.values.shape[1]):
+            # key_blocks[0] is basis
+            builder.add_track(shape_keys, f'key_blocks[{i+1}].value', 'Shape Keys',
+                              track.map(lambda v, i=i: v[:, i:i+1]))
+        return
+
+    if path == Path.translation:
+        track = track.map(axis.translation)
+    elif path == Path.rotation:
+        track = track.map(axis.rotation)
+    elif path == Path.scale:
+        track = track.map(axis.scale)
+
+    if node.bone_name and armature_object:
+        space = bone_spaces.get(node.index)
+        if not space:
+            space = BoneSpace(manager, node,
+                              armature_object.data.bones[node.bone_name])
+            bone_spaces[node.index] = space
+        if path == Path.translation:
+            track = track.map(space.translation, space.translation_tangent)
+        elif path == Path.rotation:
+            track = track.map(space.rotation)
+        elif path == Path.scale:
+            track = track.map(space.scale)
+        pose_bone = armature_object.pose.bones[node.bone_name]
+        pose_bone.rotation_mode = 'QUATERNION'
+        if path == Path.rotation and track.interpolation != Interpolation.CUBICSPLINE:
+            track.values = quat_make_continuous(track.values)
+        builder.add_track(armature_object,
+                          f'pose.bones["{escape_identifier(node.bone_name)}"].{PROPERTY_NAMES[path]}',
+                          node.bone_name, track)
+        return
+
+    if not node.blender_object:
+        # removed empty
+        return
+    if path == Path.rotation:
+        node.blender_object.rotation_mode = 'QUATERNION'
+        if track.interpolation != Interpolation.CUBICSPLINE:
+            track.values = quat_make_continuous(track.values)
+    builder.add_track(node.blender_object, PROPERTY_NAMES[path],
+                      'Object Transforms', track)
+
+
+def load_animations(context, progress: ProgressReport, manager: ImportManager,
+                    nodes: List[Optional[Node]])->List[Dict[Any, bpy.types.Action]]:
+    animations = [(i, animation) for i, animation in enumerate(manager.gltf.animations)
+                  if any(nodes[channel.target.node] for channel in animation.channels
+                         if channel.target and channel.target.node != -1)]
+    progress.enter_substeps(len(animations), "Loading animations...")
+
+    render = context.scene.render
+    fps = render.fps / render.fps_base
+    armature_object = _get_armature_object(nodes)
+    bone_spaces: Dict[int, BoneSpace] = {}
+
+    result = []
+    last_frame = 0.0
+    for n, (i, animation) in enumerate(animations):
+        name = animation.name if animation.name else f'animation_{i}'
+        builder = ActionBuilder(name, n == 0, fps, manager.keyframe_tolerance)
+        for channel in animation.channels:
+            if not channel.target or channel.target.node == -1:
+                continue
+            node = nodes[channel.target.node]
+            if not node:
+                continue
+            _load_channel(manager, builder, animation, channel, node,
+                          armature_object, bone_spaces)
+        manager.stats.setdefault('keyframes', {})[name] = builder.keyframe_count
+        if builder.tolerance > 0:
+            manager.stats.setdefault('keyframes_source', {})[
+                name] = builder.source_count
+            logger.info('%s: %d -> %d keyframes', name,
+                        builder.source_count, builder.keyframe_count)
+        last_frame = max(last_frame, builder.last_frame)
+        result.append(builder.actions)
+        progress.step()
+
+    if last_frame > context.scene.frame_end:
+        context.scene.frame_end = int(numpy.ceil(last_frame))
+
+    progress.leave_substeps()
+    return result
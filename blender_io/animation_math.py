@@ -0,0 +1,123 @@
+'''
+vectorized conversions for animation channels. no bpy.
+
+quaternions are (N, 4) arrays in blender order (w, x, y, z).
+'''
+import numpy
+
+
+def xyzw_to_wxyz(q: numpy.ndarray)->numpy.ndarray:
+    return q[..., [3, 0, 1, 2]]
+
+
+def quat_mul(a: numpy.ndarray, b: numpy.ndarray)->numpy.ndarray:
+    '''
+    hamilton product. a and b are broadcast
+    '''
+    aw, ax, ay, az = a[..., 0], a[..., 1], a[..., 2], a[..., 3]
+    bw, bx, by, bz = b[..., 0], b[..., 1], b[..., 2], b[..., 3]
+    return numpy.stack((
+        aw * bw - ax * bx - ay * by - az * bz,
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by - ax * bz + ay * bw + az * bx,
+        aw * bz + ax * by - ay * bx + az * bw,
+    ), axis=-1)
+
+
+def quat_conjugate(q: numpy.ndarray)->numpy.ndarray:
+    return q * numpy.array((1, -1, -1, -1), q.dtype)
+
+
+def quat_normalize(q: numpy.ndarray)->numpy.ndarray:
+    length = numpy.linalg.norm(q, axis=-1, keepdims=True)
+    return q / numpy.where(length > 0, length, 1)
+
+
+def quat_make_continuous(q: numpy.ndarray)->numpy.ndarray:
+    '''
+    flip signs so that neighbouring keys are in the same hemisphere.
+    otherwise per-channel interpolation takes the long way.
+    '''
+    if len(q) < 2:
+        return q
+    dots = numpy.sum(q[1:] * q[:-1], axis=-1)
+    flips = numpy.cumprod(numpy.where(dots < 0, -1, 1))
+    result = q.copy()
+    result[1:] *= flips[:, numpy.newaxis]
+    return result
+
+
+def hermite(p0: numpy.ndarray, m0: numpy.ndarray,
+            p1: numpy.ndarray, m1: numpy.ndarray,
+            dt: numpy.ndarray, s: numpy.ndarray)->numpy.ndarray:
+    '''
+    gltf CUBICSPLINE segment at s in [0, 1]. tangents are per second
+    '''
+    s2 = s * s
+    s3 = s2 * s
+    return ((2 * s3 - 3 * s2 + 1) * p0 + (s3 - 2 * s2 + s) * dt * m0
+            + (-2 * s3 + 3 * s2) * p1 + (s3 - s2) * dt * m1)
+
+
+def quat_to_matrix(q: numpy.ndarray)->numpy.ndarray:
+    '''
+    3x3 rotation matrix of a single quaternion
+    '''
+    w, x, y, z = q
+    return numpy.array((
+        (1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)),
+        (2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)),
+        (2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)),
+    ))
+
+
+class AxisConversion:
+    '''
+    gltf values to blender values in bulk. same as ImportManager.mod_v/mod_q
+    '''
+
+    def __init__(self, yup_to_zup: bool)->None:
+        self.yup_to_zup = yup_to_zup
+
+    def translation(self, v: numpy.ndarray)->numpy.ndarray:
+        if self.yup_to_zup:
+            return v[..., [0, 2, 1]] * numpy.array((1, -1, 1), v.dtype)
+        return v
+
+    def rotation(self, q: numpy.ndarray)->numpy.ndarray:
+        '''
+        gltf (x, y, z, w) to blender (w, x, y, z)
+        '''
+        if self.yup_to_zup:
+            return q[..., [3, 0, 2, 1]] * numpy.array((1, 1, -1, 1), q.dtype)
+        return xyzw_to_wxyz(q)
+
+    def scale(self, s: numpy.ndarray)->numpy.ndarray:
+        return s[..., [0, 2, 1]]
+
+
+def quat_nlerp(a: numpy.ndarray, b: numpy.ndarray,
+               s: numpy.ndarray)->numpy.ndarray:
+    '''
+    normalized lerp along the shorter arc. s is (N, 1)
+    '''
+    dot = numpy.sum(a * b, axis=-1, keepdims=True)
+    b = numpy.where(dot < 0, -b, b)
+    return quat_normalize(a + (b - a) * s)
+
+
+def quat_slerp(a: numpy.ndarray, b: numpy.ndarray,
+               s: numpy.ndarray)->numpy.ndarray:
+    '''
+    spherical lerp along the shorter arc. s is (N, 1)
+    '''
+    dot = numpy.sum(a * b, axis=-1, keepdims=True)
+    b = numpy.where(dot < 0, -b, b)
+    theta = numpy.arccos(numpy.clip(numpy.abs(dot), 0, 1))
+    sin_theta = numpy.sin(theta)
+    # nearly parallel. fall back to lerp
+    small = sin_theta < 1e-6
+    safe = numpy.where(small, 1, sin_theta)
+    wa = numpy.where(small, 1 - s, numpy.sin((1 - s) * theta) / safe)
+    wb = numpy.where(small, s, numpy.sin(s * theta) / safe)
+    return quat_normalize(wa * a + wb * b)
@@ -0,0 +1,114 @@
+'''
+evaluate gltf animation samplers at arbitrary times. no bpy.
+
+    track = Track.from_output(times, output, interpolation)
+    values = evaluate(track, numpy.array([0.0, 0.5, 1.0]), rotation=True)
+'''
+from typing import Optional
+
+import numpy
+
+from .gltftypes import AnimationSampler_interpolation as Interpolation
+from .animation_math import hermite, quat_normalize, quat_nlerp, quat_slerp
+
+
+class Track:
+    '''
+    decoded sampler. values are (keys, components).
+    in_tangents/out_tangents only for CUBICSPLINE
+    '''
+
+    def __init__(self, times: numpy.ndarray, values: numpy.ndarray,
+                 interpolation: Interpolation,
+                 in_tangents: Optional[numpy.ndarray] = None,
+                 out_tangents: Optional[numpy.ndarray] = None)->None:
+        self.times = times
+        self.values = values
+        self.interpolation = interpolation
+        self.in_tangents = in_tangents
+        self.out_tangents = out_tangents
+
+    @staticmethod
+    def from_output(times: numpy.ndarray, output: numpy.ndarray,
+                    interpolation: Interpolation)->'Track':
+        '''
+        split the sampler output accessor. weights are SCALAR * targets per key
+        '''
+        count = len(times)
+        if interpolation == Interpolation.CUBICSPLINE:
+            output = output.reshape(count, 3, -1)
+            return Track(times, output[:, 1], interpolation,
+                         output[:, 0], output[:, 2])
+        return Track(times, output.reshape(count, -1), interpolation)
+
+    def map(self, value_func, tangent_func=None)->'Track':
+        '''
+        apply a linear (+ offset) conversion to values and tangents
+        '''
+        if not tangent_func:
+            tangent_func = value_func
+        return Track(self.times, value_func(self.values), self.interpolation,
+                     tangent_func(self.in_tangents)
+                     if self.in_tangents is not None else None,
+                     tangent_func(self.out_tangents)
+                     if self.out_tangents is not None else None)
+
+
+def evaluate(track: Track, t: numpy.ndarray, rotation: bool = False,
+             spherical: bool = True)->numpy.ndarray:
+    '''
+    (len(t), components) values at t. t outside the keys is clamped.
+    rotation tracks are interpolated as unit quaternions with slerp,
+    or nlerp if not spherical
+    '''
+    t = numpy.asarray(t, numpy.float64)
+    times = track.times
+    values = track.values
+    if len(times) < 2:
+        return numpy.repeat(values[:1], len(t), axis=0)
+
+    segment = numpy.clip(numpy.searchsorted(times, t, 'right') - 1,
+                         0, len(times) - 2)
+    t0 = times[segment]
+    dt = times[segment + 1] - t0
+    dt = numpy.where(dt > 0, dt, 1)[:, numpy.newaxis]
+    s = numpy.clip((t - t0)[:, numpy.newaxis] / dt, 0, 1)
+    v0 = values[segment]
+    v1 = values[segment + 1]
+
+    if track.interpolation == Interpolation.STEP:
+        return numpy.where(s >= 1, v1, v0)
+
+    if track.interpolation == Interpolation.CUBICSPLINE:
+        result = hermite(v0, track.out_tangents[segment],
+                         v1, track.in_tangents[segment + 1], dt, s)
+        return quat_normalize(result) if rotation else result
+
+    if rotation:
+        return quat_slerp(v0, v1, s) if spherical else quat_nlerp(v0, v1, s)
+    return v0 + (v1 - v0) * s
+
+
+def frame_times(times: numpy.ndarray, fps: float)->numpy.ndarray:
+    '''
+    times of the whole frames within the keys, plus the first and last key
+    '''
+    if not len(times):
+        return times
+    start = float(times[0])
+    end = float(times[-1])
+    frames = numpy.arange(numpy.ceil(start * fps), numpy.floor(end * fps) + 1)
+    # unique after the cast. a frame close to a key rounds to the same float32
+    return numpy.unique(numpy.concatenate(
+        ([start], frames / fps, [end])).astype(times.dtype))
+
+
+def resample(track: Track, times: numpy.ndarray,
+             rotation: bool = False)->Track:
+    '''
+    bake track at times. STEP stays STEP, everything else becomes LINEAR
+    '''
+    interpolation = Interpolation.STEP \
+        if track.interpolation == Interpolation.STEP else Interpolation.LINEAR
+    values = evaluate(track, times, rotation).astype(track.values.dtype)
+    return Track(times, values, interpolation)
@@ -1,5 +1,16 @@
+import json
+import time
+import hashlib
+from typing import Dict, Tuple
+
 import bpy
 from logging import getLogger
+
+try:
+    from . import groupnode_compiler
+except ImportError:
+    # run as script in the text editor
+    import groupnode_compiler
 logger = getLogger()
 
 
@@ -163,6 +174,61 @@ def import_groups(src):
     return groups
 
 
+def get_groups_hash(src)->str:
+    return hashlib.sha1(json.dumps(src, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def find_or_import_groups(src, src_hash: str = '')->Dict[str, bpy.types.NodeTree]:
+    '''
+    reuse node_groups that were imported from the same src.
+    groups are tagged by gltf_name and gltf_hash.
+    '''
+    if not src_hash:
+        src_hash = get_groups_hash(src)
+    found: Dict[str, bpy.types.NodeTree] = {}
+    for group in bpy.data.node_groups:
+        if group.get('gltf_hash') == src_hash:
+            found[group['gltf_name']] = group
+    if all(g['name'] in found for g in src):
+        logger.debug('reuse groups: %s', src_hash)
+        return found
+
+    start = time.perf_counter()
+    groups = groupnode_compiler.get_builder(src, src_hash)(bpy)
+    logger.info('build groups: %.2f ms', (time.perf_counter() - start) * 1000)
+    for name, group in groups.items():
+        group['gltf_name'] = name
+        group['gltf_hash'] = src_hash
+    return groups
+
+
+def benchmark_groups(src, count: int = 10)->Tuple[float, float]:
+    '''
+    compare import_groups and the compiled builder.
+    returns seconds per build (interpreted, compiled).
+    '''
+    def measure(build)->float:
+        start = time.perf_counter()
+        for _ in range(count):
+            groups = build()
+            for group in groups.values():
+                bpy.data.node_groups.remove(group)
+        return (time.perf_counter() - start) / count
+
+    root = getLogger('')
+    disabled = root.disabled
+    root.disabled = True
+    try:
+        interpreted = measure(lambda: import_groups(src))
+    finally:
+        root.disabled = disabled
+    builder = groupnode_compiler.get_builder(src)
+    compiled = measure(lambda: builder(bpy))
+    logger.info('import_groups: %.2f ms, compiled: %.2f ms',
+                interpreted * 1000, compiled * 1000)
+    return interpreted, compiled
+
+
 if __name__ == '__main__':
     logger.debug('####')
     size = 0.0
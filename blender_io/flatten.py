@@ -0,0 +1,209 @@
+'''
+merge static mesh objects into one mesh per material.
+
+world transforms are baked into the vertices. the gltf node index of each
+face is kept in the 'gltf_node' face int layer, and mesh['gltf_node_names']
+maps it back to the node name.
+'''
+from typing import List, Optional, Dict, Tuple
+
+import bpy
+import numpy
+
+from .import_manager import ImportManager
+from .node import Node
+
+from logging import getLogger  # pylint: disable=C0411
+logger = getLogger(__name__)
+
+NODE_LAYER = 'gltf_node'
+
+
+def _find_static(root: Node)->List[Node]:
+    '''
+    mesh nodes that can be merged and have only mergeable descendants.
+    nothing above them is animated or a bone. root is one of them if the
+    whole hierarchy is a static tree of meshes
+    '''
+    # pre-order with parent index
+    nodes: List[Node] = []
+    parents: List[int] = []
+    stack = [(root, -1)]
+    while stack:
+        node, parent = stack.pop()
+        nodes.append(node)
+        parents.append(parent)
+        for child in reversed(node.children):
+            stack.append((child, len(nodes) - 1))
+
+    # top-down
+    static = [False] * len(nodes)
+    for i, node in enumerate(nodes):
+        obj = node.blender_object
+        static[i] = ((parents[i] == -1 or static[parents[i]])
+                     and not node.bone_name
+                     and not node.blender_armature
+                     and not (obj and obj.animation_data))
+
+    # bottom-up
+    kept_children = [len(node.children) for node in nodes]
+    result = []
+    for i in range(len(nodes) - 1, -1, -1):
+        node = nodes[i]
+        obj = node.blender_object
+        if (static[i] and not kept_children[i]
+                and obj and obj.type == 'MESH'
+                and node.gltf_node.skin == -1
+                and not node.instance_count
+                and not obj.modifiers
+                and not obj.data.shape_keys):
+            result.append(node)
+            if parents[i] >= 0:
+                kept_children[parents[i]] -= 1
+    return result
+
+
+def _get_ranges(manager: ImportManager,
+                mesh_index: int)->List[Tuple[int, int, int, int, int]]:
+    '''
+    (material, vertex start, vertex end, index start, index end) per primitive
+    '''
+    mesh = manager.gltf.meshes[mesh_index]
+    _, attributes = manager.meshes[mesh_index]
+    result = []
+    vertex = 0
+    index = 0
+    for prim, index_count in zip(mesh.primitives, attributes.submesh_index_count):
+        vertex_count = manager.gltf.accessors[prim.attributes['POSITION']].count
+        material = manager.material_map[prim.material] \
+            if prim.material != -1 else -1
+        result.append((material, vertex, vertex + vertex_count,
+                       index, index + index_count))
+        vertex += vertex_count
+        index += index_count
+    return result
+
+
+class MergedMesh:
+    def __init__(self, material: Optional[bpy.types.Material])->None:
+        self.material = material
+        self.positions: List[numpy.ndarray] = []
+        self.normals: List[numpy.ndarray] = []
+        self.uvs: List[numpy.ndarray] = []
+        self.triangles: List[numpy.ndarray] = []
+        self.node_indices: List[numpy.ndarray] = []
+        self.node_names: Dict[str, str] = {}
+        self.vertex_count = 0
+
+    def add(self, node: Node, matrix: numpy.ndarray, normal_matrix: numpy.ndarray,
+            mirrored: bool, pos: numpy.ndarray, nom: numpy.ndarray,
+            uv: numpy.ndarray, triangles: numpy.ndarray)->None:
+        self.positions.append(pos @ matrix[:3, :3].T + matrix[:3, 3])
+        n = nom @ normal_matrix.T
+        length = numpy.linalg.norm(n, axis=1, keepdims=True)
+        self.normals.append(n / numpy.where(length > 0, length, 1))
+        self.uvs.append(uv)
+        if mirrored:
+            # keep faces pointing outwards
+            triangles = triangles[:, [0, 2, 1]]
+        self.triangles.append(triangles + self.vertex_count)
+        self.node_indices.append(
+            numpy.full(len(triangles), node.index, numpy.int32))
+        self.node_names[str(node.index)] = node.name
+        self.vertex_count += len(pos)
+
+    def create(self, collection: bpy.types.Collection)->bpy.types.Object:
+        name = f'{self.material.name}_merged' if self.material else 'merged'
+        positions = numpy.concatenate(self.positions).astype(numpy.float32)
+        normals = numpy.concatenate(self.normals).astype(numpy.float32)
+        uvs = numpy.concatenate(self.uvs).astype(numpy.float32)
+        loops = numpy.concatenate(self.triangles).astype(numpy.int32).ravel()
+        triangle_count = len(loops) // 3
+
+        mesh = bpy.data.meshes.new(name)
+        mesh.vertices.add(len(positions))
+        mesh.vertices.foreach_set('co', positions.ravel())
+        mesh.vertices.foreach_set('normal', normals.ravel())
+        mesh.loops.add(len(loops))
+        mesh.loops.foreach_set('vertex_index', loops)
+        mesh.polygons.add(triangle_count)
+        mesh.polygons.foreach_set(
+            'loop_start', numpy.arange(0, len(loops), 3, dtype=numpy.int32))
+        mesh.polygons.foreach_set(
+            'loop_total', numpy.full(triangle_count, 3, numpy.int32))
+        mesh.polygons.foreach_set(
+            'use_smooth', numpy.ones(triangle_count, bool))
+
+        uv_layer = mesh.uv_layers.new()
+        uv_layer.data.foreach_set('uv', uvs[loops].ravel())
+        node_layer = mesh.polygon_layers_int.new(name=NODE_LAYER)
+        node_layer.data.foreach_set('value', numpy.concatenate(self.node_indices))
+        mesh['gltf_node_names'] = self.node_names
+
+        if self.material:
+            mesh.materials.append(self.material)
+        mesh.validate(clean_customdata=False)
+        mesh.update()
+
+        obj = bpy.data.objects.new(name, mesh)
+        collection.objects.link(obj)
+        return obj
+
+
+def flatten_static(manager: ImportManager, root: Node)->None:
+    static = _find_static(root)
+    if not static:
+        return
+    collection = root.blender_object.users_collection[0]
+
+    merged: Dict[int, MergedMesh] = {}
+    ranges: Dict[int, List[Tuple[int, int, int, int, int]]] = {}
+    for node in static:
+        mesh_index = node.gltf_node.mesh
+        if mesh_index not in ranges:
+            ranges[mesh_index] = _get_ranges(manager, mesh_index)
+        _, attributes = manager.meshes[mesh_index]
+        pos = numpy.frombuffer(attributes.pos, numpy.float32).reshape(-1, 3)
+        nom = numpy.frombuffer(attributes.nom, numpy.float32).reshape(-1, 3)
+        uv = numpy.frombuffer(attributes.uv, numpy.float32).reshape(-1, 2)
+        indices = numpy.frombuffer(attributes.indices, numpy.int32)
+
+        matrix = numpy.array(node.get_world_matrix(manager), numpy.float64)
+        basis = matrix[:3, :3]
+        normal_matrix = numpy.linalg.inv(basis).T \
+            if numpy.linalg.det(basis) != 0 else basis
+        mirrored = numpy.linalg.det(basis) < 0
+
+        for material, v0, v1, i0, i1 in ranges[mesh_index]:
+            target = merged.get(material)
+            if not target:
+                target = MergedMesh(manager.materials[material]
+                                    if material != -1 else None)
+                merged[material] = target
+            target.add(node, matrix, normal_matrix, mirrored,
+                       pos[v0:v1], nom[v0:v1], uv[v0:v1],
+                       indices[i0:i1].reshape(-1, 3) - v0)
+
+    for target in merged.values():
+        target.create(collection)
+
+    # drop the merged objects and their meshes if nothing else uses them
+    meshes = {node.blender_object.data for node in static}
+    bpy.data.batch_remove([node.blender_object for node in static])
+    removed = set(static)
+    for node in static:
+        node.blender_object = None
+    for node in root.traverse():
+        if any(child in removed for child in node.children):
+            node.children = [child for child in node.children
+                             if child not in removed]
+    orphans = [mesh for mesh in meshes if not mesh.users]
+    for i, entry in enumerate(manager.meshes):
+        if entry and entry[0] in orphans:
+            manager.meshes[i] = None
+    bpy.data.batch_remove(orphans)
+
+    manager.stats['flatten'] = (f'{len(static)} objects merged into'
+                                f' {len(merged)} meshes')
+    logger.info('flatten: removed %d objects, added %d',
+                len(static) - len(merged), len(merged))
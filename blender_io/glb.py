@@ -1,6 +1,7 @@
 import struct
 import json
-from typing import Tuple
+import pathlib
+from typing import Tuple, BinaryIO
 try:
     from . import gltftypes
 except:
@@ -65,3 +66,45 @@ def parse_glb(data: bytes)->Tuple[gltftypes.glTF, bytes]:
     # print(json_str)
     gltf = gltftypes.from_json(json.loads(json_str))
     return gltf, body
+
+
+def parse_glb_json(f: BinaryIO)->gltftypes.glTF:
+    '''
+    read up to the end of the JSON chunk. the BIN chunk is not read
+    '''
+    magic, version, _size = struct.unpack('<4sII', f.read(12))
+    if magic != b'glTF':
+        raise Exception(f'magic not found: #{magic}')
+    if version != 2:
+        raise Exception(f'version:#{version} is not 2')
+    # the first chunk must be JSON
+    chunk_size, chunk_type = struct.unpack('<I4s', f.read(8))
+    if chunk_type != b'JSON':
+        raise Exception(f'first chunk is not JSON: {chunk_type}')
+    return gltftypes.from_json(json.loads(f.read(chunk_size)))
+
+
+def parse_path_json(path: pathlib.Path)->gltftypes.glTF:
+    '''
+    json of .gltf or .glb(.vrm) without reading any buffer
+    '''
+    ext = path.suffix.lower()
+    with path.open('rb') as f:
+        if ext == '.gltf':
+            return gltftypes.from_json(json.load(f))
+        elif ext == '.glb' or ext == '.vrm':
+            return parse_glb_json(f)
+    raise NotImplementedError(f'{ext} is not supported')
+
+
+def parse_path(path: pathlib.Path)->Tuple[gltftypes.glTF, bytes]:
+    '''
+    .gltf or .glb(.vrm)
+    '''
+    ext = path.suffix.lower()
+    with path.open('rb') as f:
+        if ext == '.gltf':
+            return gltftypes.from_json(json.load(f)), b''
+        elif ext == '.glb' or ext == '.vrm':
+            return parse_glb(f.read())
+    raise NotImplementedError(f'{ext} is not supported')
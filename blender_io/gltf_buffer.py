@@ -1,140 +1,87 @@
-import ctypes
-from typing import Dict
+from typing import List
+
+import numpy
 
 from . import gltftypes
 from . import import_manager
+from .animation_math import AxisConversion
 
 
 class VertexBuffer:
+    '''
+    primitives merged into one vertex array.
+    attributes are read by get_float_ndarray, so byte/short (normalized or
+    KHR_mesh_quantization), sparse and EXT_meshopt_compression accessors work
+    '''
+
     def __init__(self,
                  manager: import_manager.ImportManager,
                  mesh: gltftypes.Mesh)->None:
-        # check shared attributes
-        attributes: Dict[str, int] = {}
-        shared = True
-        for prim in mesh.primitives:
-            # print(prim.attributes)
-            if not attributes:
-                attributes = prim.attributes
-            else:
-                if attributes != prim.attributes:
-                    shared = False
-                    break
-        print(shared)
-
-        #submeshes = [Submesh(path, gltf, prim) for prim in mesh.primitives]
+        accessors = manager.gltf.accessors
+        axis = AxisConversion(manager.yup_to_zup)
 
         # merge submesh
-        def position_count(prim):
-            accessor_index = prim.attributes['POSITION']
-            return manager.gltf.accessors[accessor_index].count
-        pos_count = sum((position_count(prim) for prim in mesh.primitives), 0)
-        self.pos = (ctypes.c_float * (pos_count * 3))()
-        self.nom = (ctypes.c_float * (pos_count * 3))()
-        self.uv = (import_manager.Float2 * pos_count)()
-        self.joints = (import_manager.UShort4 * pos_count)()
-        self.weights = (import_manager.Float4 * pos_count)()
-
-        def index_count(prim: gltftypes.MeshPrimitive)->int:
-            return manager.gltf.accessors[prim.indices].count
-        index_count = sum((index_count(prim)  # type: ignore
-                           for prim in mesh.primitives), 0)
-        self.indices = (ctypes.c_int * index_count)()  # type: ignore
+        pos_count = sum(accessors[prim.attributes['POSITION']].count
+                        for prim in mesh.primitives)
+        # flat float32 for foreach_set
+        self.pos = numpy.zeros(pos_count * 3, numpy.float32)
+        self.nom = numpy.zeros(pos_count * 3, numpy.float32)
+        self.uv = numpy.zeros((pos_count, 2), numpy.float32)
+        self.joints = numpy.zeros((pos_count, 4), numpy.int32)
+        self.weights = numpy.zeros((pos_count, 4), numpy.float32)
+
+        indices_list: List[numpy.ndarray] = []
         self.submesh_index_count: List[int] = []
 
-        pos_index = 0
-        nom_index = 0
-        uv_index = 0
-        indices_index = 0
+        def get_attribute(prim: gltftypes.MeshPrimitive, key: str,
+                          count: int, as_float: bool = True)->numpy.ndarray:
+            if as_float:
+                array = manager.get_float_ndarray(prim.attributes[key])
+            else:
+                array = manager.get_ndarray(prim.attributes[key])
+            if len(array) != count:
+                raise Exception(f"len({key}) different from len(POSITION)")
+            return array
+
         offset = 0
-        joint_index = 0
         for prim in mesh.primitives:
             #
             # attributes
             #
-            pos = manager.get_array(prim.attributes['POSITION'])
+            pos = manager.get_float_ndarray(prim.attributes['POSITION'])
+            count = len(pos)
+            end = offset + count
+            self.pos[offset * 3:end * 3] = axis.translation(pos).ravel()
 
-            nom = None
             if 'NORMAL' in prim.attributes:
-                nom = manager.get_array(prim.attributes['NORMAL'])
-                if len(nom) != len(pos):
-                    raise Exception("len(nom) different from len(pos)")
+                nom = get_attribute(prim, 'NORMAL', count)
+                self.nom[offset * 3:end * 3] = axis.translation(nom).ravel()
 
-            uv = None
             if 'TEXCOORD_0' in prim.attributes:
-                uv = manager.get_array(prim.attributes['TEXCOORD_0'])
-                if len(uv) != len(pos):
-                    raise Exception("len(uv) different from len(pos)")
-
-            joints = None
-            if 'JOINTS_0' in prim.attributes:
-                joints = manager.get_array(prim.attributes['JOINTS_0'])
-                if len(joints) != len(pos):
-                    raise Exception("len(joints) different from len(pos)")
-
-            weights = None
-            if 'WEIGHTS_0' in prim.attributes:
-                weights = manager.get_array(prim.attributes['WEIGHTS_0'])
-                if len(weights) != len(pos):
-                    raise Exception("len(weights) different from len(pos)")
-
-            if manager.yup_to_zup:
-                for p in pos:
-                    self.pos[pos_index] = p.x
-                    pos_index += 1
-                    self.pos[pos_index] = -p.z
-                    pos_index += 1
-                    self.pos[pos_index] = p.y
-                    pos_index += 1
-
-                if nom:
-                    for n in nom:
-                        self.nom[nom_index] = n.x
-                        nom_index += 1
-                        self.nom[nom_index] = -n.z
-                        nom_index += 1
-                        self.nom[nom_index] = n.y
-                        nom_index += 1
-            else:
-                for p in pos:
-                    self.pos[pos_index] = p.x
-                    pos_index += 1
-                    self.pos[pos_index] = p.y
-                    pos_index += 1
-                    self.pos[pos_index] = p.z
-                    pos_index += 1
-
-                if nom:
-                    for n in nom:
-                        self.nom[nom_index] = n.x
-                        nom_index += 1
-                        self.nom[nom_index] = n.y
-                        nom_index += 1
-                        self.nom[nom_index] = n.z
-                        nom_index += 1
-
-            if uv:
-                for xy in uv:
-                    xy.y = 1.0 - xy.y  # flip vertical
-                    self.uv[uv_index] = xy
-                    uv_index += 1
-
-            if joints and weights:
-                for joint, weight in zip(joints, weights):
-                    self.joints[joint_index] = joint
-                    self.weights[joint_index] = weight
-                    joint_index += 1
+                uv = get_attribute(prim, 'TEXCOORD_0', count)
+                self.uv[offset:end, 0] = uv[:, 0]
+                self.uv[offset:end, 1] = 1.0 - uv[:, 1]  # flip vertical
+
+            if 'JOINTS_0' in prim.attributes and 'WEIGHTS_0' in prim.attributes:
+                self.joints[offset:end] = get_attribute(
+                    prim, 'JOINTS_0', count, as_float=False)
+                self.weights[offset:end] = get_attribute(
+                    prim, 'WEIGHTS_0', count)
 
             #
             # indices
             #
-            indices = manager.get_array(prim.indices)
-            for i in indices:
-                self.indices[indices_index] = offset + i
-                indices_index += 1
+            if prim.indices != -1:
+                indices = manager.get_ndarray(prim.indices)[:, 0]
+            else:
+                indices = numpy.arange(count)
+            indices_list.append(indices.astype(numpy.int32) + offset)
 
             self.submesh_index_count.append(len(indices))
-            offset += len(pos)
+            offset = end
+
+        self.indices = numpy.concatenate(indices_list) \
+            if indices_list else numpy.zeros(0, numpy.int32)
 
     def get_submesh_from_face(self, face_index)->int:
         target = face_index*3
@@ -144,3 +91,11 @@ class VertexBuffer:
             if target < n:
                 return i
         return -1
+
+    def get_face_submeshes(self)->numpy.ndarray:
+        '''
+        get_submesh_from_face for all faces
+        '''
+        return numpy.repeat(
+            numpy.arange(len(self.submesh_index_count), dtype=numpy.int32),
+            numpy.array(self.submesh_index_count) // 3)
@@ -1 +1,32 @@
-groups = [{'outputs': [{'bl_socket_idname': 'NodeSocketShader', 'name': 'Shader'}], 'name': 'AlphaMask.001', 'links': [{'to_socket': 2, 'from_node': 2, 'from_socket': 0, 'to_node': 4}, {'to_socket': 1, 'from_node': 3, 'from_socket': 0, 'to_node': 4}, {'to_socket': 0, 'from_node': 3, 'from_socket': 1, 'to_node': 1}, {'to_socket': 1, 'from_node': 3, 'from_socket': 2, 'to_node': 1}, {'to_socket': 0, 'from_node': 4, 'from_socket': 0, 'to_node': 0}, {'to_socket': 0, 'from_node': 1, 'from_socket': 0, 'to_node': 4}], 'nodes': [{'inputs': [{'link_limit': 1, 'name': 'Shader', 'bl_idname': 'NodeSocketShader', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'SHADER', 'hide_value': False}, {'link_limit': 1, 'name': '', 'bl_idname': 'NodeSocketVirtual', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'CUSTOM', 'hide_value': False}], 'outputs': [], 'attr': {'name': 'Group Output', 'is_active_output': True, 'bl_idname': 'NodeGroupOutput', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'GROUP_OUTPUT', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 80.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_custom_color': False, 'show_preview': False, 'bl_label': 'Group Output', 'bl_width_max': 400.0, 'show_texture': False, 'location': [307.67681884765625, -58.37359619140625], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 80.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'GROUP_OUTPUT', 'bl_idname': 'NodeGroupOutput'}, {'inputs': [{'link_limit': 1, 'name': 'Value', 'default_value': 1.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Value', 'default_value': 0.5, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}], 'outputs': [{'link_limit': 4095, 'name': 'Value', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}], 'attr': {'name': 'Math', 'bl_idname': 'ShaderNodeMath', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'MATH', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'operation': 'LESS_THAN', 'use_clamp': False, 'show_preview': False, 'use_custom_color': False, 'bl_label': 'Math', 'bl_width_max': 700.0, 'show_texture': False, 'location': [-117.1951675415039, 182.2685546875], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 100.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'MATH', 'bl_idname': 'ShaderNodeMath'}, {'inputs': [{'link_limit': 1, 'name': 'Color', 'default_value': [1.0, 1.0, 1.0, 1.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}], 'outputs': [{'link_limit': 4095, 'name': 'BSDF', 'bl_idname': 'NodeSocketShader', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'SHADER', 'hide_value': False}], 'attr': {'name': 'Transparent BSDF', 'bl_idname': 'ShaderNodeBsdfTransparent', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'BSDF_TRANSPARENT', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_custom_color': False, 'show_preview': False, 'bl_label': 'Transparent BSDF', 'bl_width_max': 700.0, 'show_texture': False, 'location': [-124.3338623046875, -163.20779418945312], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 100.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'BSDF_TRANSPARENT', 'bl_idname': 'ShaderNodeBsdfTransparent'}, {'inputs': [], 'outputs': [{'link_limit': 4095, 'name': 'Shader', 'bl_idname': 'NodeSocketShader', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'SHADER', 'hide_value': False}, {'link_limit': 4095, 'name': 'Alpha', 'default_value': 0.30000001192092896, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 4095, 'name': 'AlphaCutoff', 'default_value': 0.5, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 4095, 'name': '', 'bl_idname': 'NodeSocketVirtual', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'CUSTOM', 'hide_value': False}], 'attr': {'name': 'Group Input', 'bl_idname': 'NodeGroupInput', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'GROUP_INPUT', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 80.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_custom_color': False, 'show_preview': False, 'bl_label': 'Group Input', 'bl_width_max': 400.0, 'show_texture': False, 'location': [-363.5972900390625, 22.634662628173828], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 80.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'GROUP_INPUT', 'bl_idname': 'NodeGroupInput'}, {'inputs': [{'link_limit': 1, 'name': 'Fac', 'default_value': 0.5, 'bl_idname': 'NodeSocketFloatFactor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Shader', 'bl_idname': 'NodeSocketShader', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'SHADER', 'hide_value': False}, {'link_limit': 1, 'name': 'Shader', 'bl_idname': 'NodeSocketShader', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'SHADER', 'hide_value': False}], 'outputs': [{'link_limit': 4095, 'name': 'Shader', 'bl_idname': 'NodeSocketShader', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'SHADER', 'hide_value': False}], 'attr': {'name': 'Mix Shader', 'bl_idname': 'ShaderNodeMixShader', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'MIX_SHADER', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_custom_color': False, 'show_preview': False, 'bl_label': 'Mix Shader', 'bl_width_max': 700.0, 'show_texture': False, 'location': [105.29721069335938, -44.077980041503906], 'bl_width_default': 140.0, 'height': 100.0, 'select': True, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 100.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'MIX_SHADER', 'bl_idname': 'ShaderNodeMixShader'}], 'bl_idname': 'ShaderNodeTree', 'tree_attr': {'tag': False, 'bl_label': 'Shader', 'name': 'AlphaMask.001', 'bl_idname': 'ShaderNodeTree', 'bl_icon': 'MATERIAL', 'grease_pencil': None, 'bl_description': 'Shader nodes'}, 'inputs': [{'bl_socket_idname': 'NodeSocketShader', 'name': 'Shader'}, {'bl_socket_idname': 'NodeSocketFloat', 'min_value': 0.0, 'name': 'Alpha', 'default_value': 1.0, 'max_value': 1.0}, {'bl_socket_idname': 'NodeSocketFloat', 'min_value': 0.0, 'name': 'AlphaCutoff', 'default_value': 0.5, 'max_value': 1.0}]}, {'outputs': [{'bl_socket_idname': 'NodeSocketShader', 'name': 'Emission'}], 'name': 'Emissive.001', 'links': [{'to_socket': 0, 'from_node': 3, 'from_socket': 0, 'to_node': 0}, {'to_socket': 0, 'from_node': 2, 'from_socket': 0, 'to_node': 3}, {'to_socket': 1, 'from_node': 1, 'from_socket': 0, 'to_node': 2}, {'to_socket': 2, 'from_node': 1, 'from_socket': 1, 'to_node': 2}], 'nodes': [{'inputs': [{'link_limit': 1, 'name': 'Emission', 'bl_idname': 'NodeSocketShader', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'SHADER', 'hide_value': False}, {'link_limit': 1, 'name': '', 'bl_idname': 'NodeSocketVirtual', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'CUSTOM', 'hide_value': False}], 'outputs': [], 'attr': {'name': 'Group Output', 'is_active_output': True, 'bl_idname': 'NodeGroupOutput', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'GROUP_OUTPUT', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 80.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_custom_color': False, 'show_preview': False, 'bl_label': 'Group Output', 'bl_width_max': 400.0, 'show_texture': False, 'location': [260.6797180175781, -8.339085578918457], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 80.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'GROUP_OUTPUT', 'bl_idname': 'NodeGroupOutput'}, {'inputs': [], 'outputs': [{'link_limit': 4095, 'name': 'Color', 'default_value': [0.800000011920929, 0.800000011920929, 0.800000011920929, 1.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}, {'link_limit': 4095, 'name': 'Factor', 'default_value': [0.0, 0.0, 0.0, 1.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}, {'link_limit': 4095, 'name': '', 'bl_idname': 'NodeSocketVirtual', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'CUSTOM', 'hide_value': False}], 'attr': {'name': 'Group Input', 'bl_idname': 'NodeGroupInput', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'GROUP_INPUT', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 80.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_custom_color': False, 'show_preview': False, 'bl_label': 'Group Input', 'bl_width_max': 400.0, 'show_texture': False, 'location': [-483.1720275878906, 16.678173065185547], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 80.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'GROUP_INPUT', 'bl_idname': 'NodeGroupInput'}, {'inputs': [{'link_limit': 1, 'name': 'Fac', 'default_value': 1.0, 'bl_idname': 'NodeSocketFloatFactor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Color1', 'default_value': [0.0, 0.0, 0.0, 1.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}, {'link_limit': 1, 'name': 'Color2', 'default_value': [0.0, 0.0, 0.0, 1.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}], 'outputs': [{'link_limit': 4095, 'name': 'Color', 'default_value': [0.0, 0.0, 0.0, 0.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}], 'attr': {'name': 'Mix', 'bl_idname': 'ShaderNodeMixRGB', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'MIX_RGB', 'bl_height_max': 30.0, 'mute': False, 'blend_type': 'MULTIPLY', 'width_hidden': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_clamp': False, 'show_preview': False, 'use_custom_color': False, 'bl_label': 'Mix', 'bl_width_max': 700.0, 'show_texture': False, 'use_alpha': False, 'location': [-211.18919372558594, 5.956470489501953], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'bl_width_min': 100.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'MIX_RGB', 'bl_idname': 'ShaderNodeMixRGB'}, {'inputs': [{'link_limit': 1, 'name': 'Color', 'default_value': [0.800000011920929, 0.800000011920929, 0.800000011920929, 1.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}, {'link_limit': 1, 'name': 'Strength', 'default_value': 1.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}], 'outputs': [{'link_limit': 4095, 'name': 'Emission', 'bl_idname': 'NodeSocketShader', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'SHADER', 'hide_value': False}], 'attr': {'name': 'Emission', 'bl_idname': 'ShaderNodeEmission', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'EMISSION', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_custom_color': False, 'show_preview': False, 'bl_label': 'Emission', 'bl_width_max': 700.0, 'show_texture': False, 'location': [5.9489922523498535, 9.530383110046387], 'bl_width_default': 140.0, 'height': 100.0, 'select': True, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 100.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'EMISSION', 'bl_idname': 'ShaderNodeEmission'}], 'bl_idname': 'ShaderNodeTree', 'tree_attr': {'tag': False, 'bl_label': 'Shader', 'name': 'Emissive.001', 'bl_idname': 'ShaderNodeTree', 'bl_icon': 'MATERIAL', 'grease_pencil': None, 'bl_description': 'Shader nodes'}, 'inputs': [{'bl_socket_idname': 'NodeSocketColor', 'name': 'Color', 'default_value': [0.800000011920929, 0.800000011920929, 0.800000011920929, 1.0]}, {'bl_socket_idname': 'NodeSocketColor', 'name': 'Factor', 'default_value': [0.0, 0.0, 0.0, 1.0]}]}, {'outputs': [{'bl_socket_idname': 'NodeSocketShader', 'name': 'Shader'}], 'name': 'AlphaBlend.001', 'links': [{'to_socket': 1, 'from_node': 0, 'from_socket': 0, 'to_node': 3}, {'to_socket': 0, 'from_node': 3, 'from_socket': 0, 'to_node': 2}, {'to_socket': 2, 'from_node': 1, 'from_socket': 0, 'to_node': 3}, {'to_socket': 0, 'from_node': 1, 'from_socket': 1, 'to_node': 3}], 'nodes': [{'inputs': [{'link_limit': 1, 'name': 'Color', 'default_value': [1.0, 1.0, 1.0, 1.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}], 'outputs': [{'link_limit': 4095, 'name': 'BSDF', 'bl_idname': 'NodeSocketShader', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'SHADER', 'hide_value': False}], 'attr': {'name': 'Transparent BSDF', 'bl_idname': 'ShaderNodeBsdfTransparent', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'BSDF_TRANSPARENT', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_custom_color': False, 'show_preview': False, 'bl_label': 'Transparent BSDF', 'bl_width_max': 700.0, 'show_texture': False, 'location': [-146.94003295898438, -60.75620651245117], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 100.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'BSDF_TRANSPARENT', 'bl_idname': 'ShaderNodeBsdfTransparent'}, {'inputs': [], 'outputs': [{'link_limit': 4095, 'name': 'Shader', 'bl_idname': 'NodeSocketShader', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'SHADER', 'hide_value': False}, {'link_limit': 4095, 'name': 'Alpha', 'default_value': 0.5, 'bl_idname': 'NodeSocketFloatFactor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 4095, 'name': '', 'bl_idname': 'NodeSocketVirtual', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'CUSTOM', 'hide_value': False}], 'attr': {'name': 'Group Input', 'bl_idname': 'NodeGroupInput', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'GROUP_INPUT', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 80.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_custom_color': False, 'show_preview': False, 'bl_label': 'Group Input', 'bl_width_max': 400.0, 'show_texture': False, 'location': [-291.0195007324219, 146.52963256835938], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 80.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'GROUP_INPUT', 'bl_idname': 'NodeGroupInput'}, {'inputs': [{'link_limit': 1, 'name': 'Shader', 'bl_idname': 'NodeSocketShader', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'SHADER', 'hide_value': False}, {'link_limit': 1, 'name': '', 'bl_idname': 'NodeSocketVirtual', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'CUSTOM', 'hide_value': False}], 'outputs': [], 'attr': {'name': 'Group Output', 'is_active_output': True, 'bl_idname': 'NodeGroupOutput', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'GROUP_OUTPUT', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 80.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_custom_color': False, 'show_preview': False, 'bl_label': 'Group Output', 'bl_width_max': 400.0, 'show_texture': False, 'location': [344.5605163574219, -28.591150283813477], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 80.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'GROUP_OUTPUT', 'bl_idname': 'NodeGroupOutput'}, {'inputs': [{'link_limit': 1, 'name': 'Fac', 'default_value': 1.0, 'bl_idname': 'NodeSocketFloatFactor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Shader', 'bl_idname': 'NodeSocketShader', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'SHADER', 'hide_value': False}, {'link_limit': 1, 'name': 'Shader', 'bl_idname': 'NodeSocketShader', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'SHADER', 'hide_value': False}], 'outputs': [{'link_limit': 4095, 'name': 'Shader', 'bl_idname': 'NodeSocketShader', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'SHADER', 'hide_value': False}], 'attr': {'name': 'Mix Shader', 'bl_idname': 'ShaderNodeMixShader', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'MIX_SHADER', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_custom_color': False, 'show_preview': False, 'bl_label': 'Mix Shader', 'bl_width_max': 700.0, 'show_texture': False, 'location': [137.4217071533203, -23.825958251953125], 'bl_width_default': 140.0, 'height': 100.0, 'select': True, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 100.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'MIX_SHADER', 'bl_idname': 'ShaderNodeMixShader'}], 'bl_idname': 'ShaderNodeTree', 'tree_attr': {'tag': False, 'bl_label': 'Shader', 'name': 'AlphaBlend.001', 'bl_idname': 'ShaderNodeTree', 'bl_icon': 'MATERIAL', 'grease_pencil': None, 'bl_description': 'Shader nodes'}, 'inputs': [{'bl_socket_idname': 'NodeSocketShader', 'name': 'Shader'}, {'bl_socket_idname': 'NodeSocketFloatFactor', 'min_value': 0.0, 'name': 'Alpha', 'default_value': 1.0, 'max_value': 1.0}]}, {'outputs': [{'bl_socket_idname': 'NodeSocketShader', 'name': 'Shader'}], 'name': 'glTF Metallic Roughness', 'links': [{'to_socket': 1, 'from_node': 7, 'from_socket': 0, 'to_node': 5}, {'to_socket': 0, 'from_node': 31, 'from_socket': 9, 'to_node': 7}, {'to_socket': 1, 'from_node': 31, 'from_socket': 10, 'to_node': 7}, {'to_socket': 0, 'from_node': 5, 'from_socket': 0, 'to_node': 6}, {'to_socket': 1, 'from_node': 31, 'from_socket': 0, 'to_node': 27}, {'to_socket': 1, 'from_node': 31, 'from_socket': 3, 'to_node': 8}, {'to_socket': 1, 'from_node': 31, 'from_socket': 4, 'to_node': 11}, {'to_socket': 0, 'from_node': 5, 'from_socket': 0, 'to_node': 9}, {'to_socket': 1, 'from_node': 31, 'from_socket': 11, 'to_node': 6}, {'to_socket': 1, 'from_node': 31, 'from_socket': 11, 'to_node': 9}, {'to_socket': 2, 'from_node': 31, 'from_socket': 12, 'to_node': 9}, {'to_socket': 1, 'from_node': 6, 'from_socket': 0, 'to_node': 19}, {'to_socket': 2, 'from_node': 9, 'from_socket': 0, 'to_node': 19}, {'to_socket': 0, 'from_node': 31, 'from_socket': 13, 'to_node': 10}, {'to_socket': 0, 'from_node': 10, 'from_socket': 0, 'to_node': 19}, {'to_socket': 0, 'from_node': 14, 'from_socket': 0, 'to_node': 13}, {'to_socket': 1, 'from_node': 31, 'from_socket': 6, 'to_node': 16}, {'to_socket': 0, 'from_node': 17, 'from_socket': 0, 'to_node': 16}, {'to_socket': 0, 'from_node': 16, 'from_socket': 0, 'to_node': 14}, {'to_socket': 2, 'from_node': 17, 'from_socket': 2, 'to_node': 14}, {'to_socket': 1, 'from_node': 15, 'from_socket': 0, 'to_node': 14}, {'to_socket': 0, 'from_node': 17, 'from_socket': 1, 'to_node': 15}, {'to_socket': 1, 'from_node': 31, 'from_socket': 6, 'to_node': 15}, {'to_socket': 0, 'from_node': 31, 'from_socket': 2, 'to_node': 12}, {'to_socket': 0, 'from_node': 18, 'from_socket': 0, 'to_node': 17}, {'to_socket': 1, 'from_node': 31, 'from_socket': 5, 'to_node': 18}, {'to_socket': 0, 'from_node': 31, 'from_socket': 7, 'to_node': 33}, {'to_socket': 0, 'from_node': 12, 'from_socket': 1, 'to_node': 11}, {'to_socket': 0, 'from_node': 12, 'from_socket': 2, 'to_node': 8}, {'to_socket': 0, 'from_node': 31, 'from_socket': 14, 'to_node': 24}, {'to_socket': 0, 'from_node': 22, 'from_socket': 0, 'to_node': 20}, {'to_socket': 2, 'from_node': 19, 'from_socket': 0, 'to_node': 22}, {'to_socket': 1, 'from_node': 21, 'from_socket': 0, 'to_node': 22}, {'to_socket': 0, 'from_node': 24, 'from_socket': 0, 'to_node': 23}, {'to_socket': 0, 'from_node': 23, 'from_socket': 0, 'to_node': 22}, {'to_socket': 1, 'from_node': 25, 'from_socket': 0, 'to_node': 23}, {'to_socket': 1, 'from_node': 26, 'from_socket': 6, 'to_node': 25}, {'to_socket': 1, 'from_node': 31, 'from_socket': 1, 'to_node': 30}, {'to_socket': 2, 'from_node': 30, 'from_socket': 0, 'to_node': 27}, {'to_socket': 1, 'from_node': 28, 'from_socket': 0, 'to_node': 32}, {'to_socket': 2, 'from_node': 32, 'from_socket': 0, 'to_node': 30}, {'to_socket': 0, 'from_node': 31, 'from_socket': 15, 'to_node': 29}, {'to_socket': 0, 'from_node': 29, 'from_socket': 0, 'to_node': 32}, {'to_socket': 2, 'from_node': 31, 'from_socket': 16, 'to_node': 32}, {'to_socket': 17, 'from_node': 13, 'from_socket': 0, 'to_node': 34}, {'to_socket': 4, 'from_node': 8, 'from_socket': 0, 'to_node': 34}, {'to_socket': 7, 'from_node': 11, 'from_socket': 0, 'to_node': 34}, {'to_socket': 1, 'from_node': 27, 'from_socket': 0, 'to_node': 35}, {'to_socket': 0, 'from_node': 35, 'from_socket': 0, 'to_node': 34}, {'to_socket': 0, 'from_node': 34, 'from_socket': 0, 'to_node': 5}, {'to_socket': 0, 'from_node': 33, 'from_socket': 0, 'to_node': 36}, {'to_socket': 1, 'from_node': 33, 'from_socket': 0, 'to_node': 36}, {'to_socket': 2, 'from_node': 33, 'from_socket': 0, 'to_node': 36}, {'to_socket': 2, 'from_node': 36, 'from_socket': 0, 'to_node': 35}, {'to_socket': 0, 'from_node': 31, 'from_socket': 8, 'to_node': 35}], 'nodes': [{'inputs': [], 'outputs': [], 'attr': {'name': 'Frame.001', 'bl_idname': 'NodeFrame', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'FRAME', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': 'Final Metallic', 'show_texture': False, 'show_preview': False, 'use_custom_color': False, 'bl_label': 'Frame', 'bl_width_max': 3.4028234663852886e+38, 'label_size': 20, 'location': [-1584.0823974609375, -185.23541259765625], 'bl_width_default': 150.0, 'height': 205.93206787109375, 'select': False, 'bl_icon': 'NONE', 'width': 200.0, 'width_hidden': 100.0, 'text': None, 'bl_height_min': 30.0, 'hide': False, 'shrink': True, 'bl_description': ''}, 'type': 'FRAME', 'bl_idname': 'NodeFrame'}, {'inputs': [], 'outputs': [], 'attr': {'name': 'Frame.002', 'bl_idname': 'NodeFrame', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'FRAME', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': 'Final Rougness', 'show_texture': False, 'show_preview': False, 'use_custom_color': False, 'bl_label': 'Frame', 'bl_width_max': 3.4028234663852886e+38, 'label_size': 20, 'location': [-1582.4742431640625, -469.21337890625], 'bl_width_default': 150.0, 'height': 205.84051513671875, 'select': False, 'bl_icon': 'NONE', 'width': 200.0, 'width_hidden': 100.0, 'text': None, 'bl_height_min': 30.0, 'hide': False, 'shrink': True, 'bl_description': ''}, 'type': 'FRAME', 'bl_idname': 'NodeFrame'}, {'inputs': [], 'outputs': [], 'attr': {'name': 'Frame.005', 'bl_idname': 'NodeFrame', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'FRAME', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': 'Final Normal', 'show_texture': False, 'show_preview': False, 'use_custom_color': False, 'bl_label': 'Frame', 'bl_width_max': 3.4028234663852886e+38, 'label_size': 20, 'location': [-1752.0587158203125, 226.65196228027344], 'bl_width_default': 150.0, 'height': 387.17742919921875, 'select': False, 'bl_icon': 'NONE', 'width': 1085.137451171875, 'width_hidden': 100.0, 'text': None, 'bl_height_min': 30.0, 'hide': False, 'shrink': True, 'bl_description': ''}, 'type': 'FRAME', 'bl_idname': 'NodeFrame'}, {'inputs': [], 'outputs': [], 'attr': {'name': 'Frame', 'bl_idname': 'NodeFrame', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'FRAME', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': 'Final Base Color', 'show_texture': False, 'show_preview': False, 'use_custom_color': False, 'bl_label': 'Frame', 'bl_width_max': 3.4028234663852886e+38, 'label_size': 20, 'location': [-1914.0579833984375, 759.8992309570312], 'bl_width_default': 150.0, 'height': 547.2410888671875, 'select': False, 'bl_icon': 'NONE', 'width': 993.4537353515625, 'width_hidden': 100.0, 'text': None, 'bl_height_min': 30.0, 'hide': False, 'shrink': True, 'bl_description': ''}, 'type': 'FRAME', 'bl_idname': 'NodeFrame'}, {'inputs': [], 'outputs': [], 'attr': {'name': 'Frame  Lambert Cook Torrance', 'bl_idname': 'NodeFrame', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'FRAME', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': 'Frame  Lambert Cook Torrance', 'show_texture': False, 'show_preview': False, 'use_custom_color': False, 'bl_label': 'Frame', 'bl_width_max': 3.4028234663852886e+38, 'label_size': 20, 'location': [-329.4680480957031, 221.0568084716797], 'bl_width_default': 150.0, 'height': 578.1168823242188, 'select': False, 'bl_icon': 'NONE', 'width': 853.9675903320312, 'width_hidden': 100.0, 'text': None, 'bl_height_min': 30.0, 'hide': False, 'shrink': True, 'bl_description': ''}, 'type': 'FRAME', 'bl_idname': 'NodeFrame'}, {'inputs': [{'link_limit': 1, 'name': 'Shader', 'bl_idname': 'NodeSocketShader', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'SHADER', 'hide_value': False}, {'link_limit': 1, 'name': 'Shader', 'bl_idname': 'NodeSocketShader', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'SHADER', 'hide_value': False}], 'outputs': [{'link_limit': 4095, 'name': 'Shader', 'bl_idname': 'NodeSocketShader', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'SHADER', 'hide_value': False}], 'attr': {'name': 'Add Shader.001', 'bl_idname': 'ShaderNodeAddShader', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'ADD_SHADER', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_custom_color': False, 'show_preview': False, 'bl_label': 'Add Shader', 'bl_width_max': 700.0, 'show_texture': False, 'location': [1126.6632080078125, -150.905517578125], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 100.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'ADD_SHADER', 'bl_idname': 'ShaderNodeAddShader'}, {'attr': {'name': 'Group.001', 'bl_idname': 'ShaderNodeGroup', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'GROUP', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 60.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_custom_color': False, 'show_preview': False, 'bl_label': 'Group', 'bl_width_max': 400.0, 'show_texture': False, 'location': [1447.8125, -6.6367034912109375], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 224.4757080078125, 'width_hidden': 60.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'GROUP_NAME': 'AlphaBlend.001', 'bl_idname': 'ShaderNodeGroup', 'outputs': [{'link_limit': 4095, 'name': 'Shader', 'bl_idname': 'NodeSocketShader', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'SHADER', 'hide_value': False}], 'type': 'GROUP', 'inputs': [{'link_limit': 1, 'name': 'Shader', 'bl_idname': 'NodeSocketShader', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'SHADER', 'hide_value': False}, {'link_limit': 1, 'name': 'Alpha', 'default_value': 1.0, 'bl_idname': 'NodeSocketFloatFactor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}]}, {'attr': {'name': 'Group.003', 'bl_idname': 'ShaderNodeGroup', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'GROUP', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 60.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_custom_color': False, 'show_preview': False, 'bl_label': 'Group', 'bl_width_max': 400.0, 'show_texture': False, 'location': [43.54606628417969, -487.15155029296875], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 228.6951904296875, 'width_hidden': 60.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'GROUP_NAME': 'Emissive.001', 'bl_idname': 'ShaderNodeGroup', 'outputs': [{'link_limit': 4095, 'name': 'Emission', 'bl_idname': 'NodeSocketShader', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'SHADER', 'hide_value': False}], 'type': 'GROUP', 'inputs': [{'link_limit': 1, 'name': 'Color', 'default_value': [0.0, 0.0, 0.0, 1.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}, {'link_limit': 1, 'name': 'Factor', 'default_value': [0.0, 0.0, 0.0, 1.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}]}, {'inputs': [{'link_limit': 1, 'name': 'Value', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Value', 'default_value': 1.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}], 'outputs': [{'link_limit': 4095, 'name': 'Value', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}], 'attr': {'name': 'Math', 'bl_idname': 'ShaderNodeMath', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'MATH', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'operation': 'MULTIPLY', 'use_clamp': True, 'show_preview': False, 'use_custom_color': False, 'bl_label': 'Math', 'bl_width_max': 700.0, 'show_texture': False, 'location': [12.130615234375, 14.16748046875], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 100.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'MATH', 'bl_idname': 'ShaderNodeMath'}, {'attr': {'name': 'Group.002', 'bl_idname': 'ShaderNodeGroup', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'GROUP', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 60.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_custom_color': False, 'show_preview': False, 'bl_label': 'Group', 'bl_width_max': 400.0, 'show_texture': False, 'location': [1552.7491455078125, -296.4447937011719], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 228.045166015625, 'width_hidden': 60.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'GROUP_NAME': 'AlphaMask.001', 'bl_idname': 'ShaderNodeGroup', 'outputs': [{'link_limit': 4095, 'name': 'Shader', 'bl_idname': 'NodeSocketShader', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'SHADER', 'hide_value': False}], 'type': 'GROUP', 'inputs': [{'link_limit': 1, 'name': 'Shader', 'bl_idname': 'NodeSocketShader', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'SHADER', 'hide_value': False}, {'link_limit': 1, 'name': 'Alpha', 'default_value': 1.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'AlphaCutoff', 'default_value': 0.5, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}]}, {'inputs': [{'link_limit': 1, 'name': 'Value', 'default_value': 0.5, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Value', 'default_value': 0.5, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}], 'outputs': [{'link_limit': 4095, 'name': 'Value', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}], 'attr': {'name': 'Math.002', 'bl_idname': 'ShaderNodeMath', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'MATH', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'operation': 'GREATER_THAN', 'use_clamp': True, 'show_preview': False, 'use_custom_color': False, 'bl_label': 'Math', 'bl_width_max': 700.0, 'show_texture': False, 'location': [1293.96240234375, -206.8525390625], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 100.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'MATH', 'bl_idname': 'ShaderNodeMath'}, {'inputs': [{'link_limit': 1, 'name': 'Value', 'default_value': 0.5, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Value', 'default_value': 0.5, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}], 'outputs': [{'link_limit': 4095, 'name': 'Value', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}], 'attr': {'name': 'Math.001', 'bl_idname': 'ShaderNodeMath', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'MATH', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'operation': 'MULTIPLY', 'use_clamp': True, 'show_preview': False, 'use_custom_color': False, 'bl_label': 'Math', 'bl_width_max': 700.0, 'show_texture': False, 'location': [4.8922119140625, -17.94610595703125], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 100.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'MATH', 'bl_idname': 'ShaderNodeMath'}, {'inputs': [{'link_limit': 1, 'name': 'Image', 'default_value': [0.0, 0.0, 0.0, 1.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}], 'outputs': [{'link_limit': 4095, 'name': 'R', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 4095, 'name': 'G', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 4095, 'name': 'B', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}], 'attr': {'name': 'Separate RGB', 'bl_idname': 'ShaderNodeSeparateRGB', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'SEPRGB', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_custom_color': False, 'show_preview': False, 'bl_label': 'Separate RGB', 'bl_width_max': 700.0, 'show_texture': False, 'location': [-1989.39453125, -150.02886962890625], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 100.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'SEPRGB', 'bl_idname': 'ShaderNodeSeparateRGB'}, {'inputs': [{'link_limit': 1, 'name': 'Vector', 'default_value': [0.5, 0.5, 0.5], 'bl_idname': 'NodeSocketVector', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VECTOR', 'hide_value': False}, {'link_limit': 1, 'name': 'Vector', 'default_value': [0.5, 0.5, 0.5], 'bl_idname': 'NodeSocketVector', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VECTOR', 'hide_value': False}], 'outputs': [{'link_limit': 4095, 'name': 'Vector', 'default_value': [0.0, 0.0, 0.0], 'bl_idname': 'NodeSocketVector', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VECTOR', 'hide_value': False}, {'link_limit': 4095, 'name': 'Value', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}], 'attr': {'name': 'Vector Math', 'bl_idname': 'ShaderNodeVectorMath', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'VECT_MATH', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'operation': 'NORMALIZE', 'use_custom_color': False, 'show_preview': False, 'bl_label': 'Vector Math', 'bl_width_max': 700.0, 'show_texture': False, 'location': [825.2493896484375, -110.62825775146484], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 100.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'VECT_MATH', 'bl_idname': 'ShaderNodeVectorMath'}, {'inputs': [{'link_limit': 1, 'name': 'X', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Y', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Z', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}], 'outputs': [{'link_limit': 4095, 'name': 'Vector', 'default_value': [0.0, 0.0, 0.0], 'bl_idname': 'NodeSocketVector', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VECTOR', 'hide_value': False}], 'attr': {'name': 'Combine XYZ', 'bl_idname': 'ShaderNodeCombineXYZ', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'COMBXYZ', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_custom_color': False, 'show_preview': False, 'bl_label': 'Combine XYZ', 'bl_width_max': 700.0, 'show_texture': False, 'location': [623.1748046875, -148.63827514648438], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 100.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'COMBXYZ', 'bl_idname': 'ShaderNodeCombineXYZ'}, {'inputs': [{'link_limit': 1, 'name': 'Value', 'default_value': 0.5, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Value', 'default_value': 0.5, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}], 'outputs': [{'link_limit': 4095, 'name': 'Value', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}], 'attr': {'name': 'Math.004', 'bl_idname': 'ShaderNodeMath', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'MATH', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'operation': 'MULTIPLY', 'use_clamp': False, 'show_preview': False, 'use_custom_color': False, 'bl_label': 'Math', 'bl_width_max': 700.0, 'show_texture': False, 'location': [403.1748046875, -157.00732421875], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 100.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'MATH', 'bl_idname': 'ShaderNodeMath'}, {'inputs': [{'link_limit': 1, 'name': 'Value', 'default_value': 0.5, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Value', 'default_value': 0.5, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}], 'outputs': [{'link_limit': 4095, 'name': 'Value', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}], 'attr': {'name': 'Math.003', 'bl_idname': 'ShaderNodeMath', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'MATH', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'operation': 'MULTIPLY', 'use_clamp': False, 'show_preview': False, 'use_custom_color': False, 'bl_label': 'Math', 'bl_width_max': 700.0, 'show_texture': False, 'location': [404.3687744140625, 23.525436401367188], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 100.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'MATH', 'bl_idname': 'ShaderNodeMath'}, {'inputs': [{'link_limit': 1, 'name': 'Vector', 'default_value': [0.0, 0.0, 0.0], 'bl_idname': 'NodeSocketVector', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VECTOR', 'hide_value': False}], 'outputs': [{'link_limit': 4095, 'name': 'X', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 4095, 'name': 'Y', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 4095, 'name': 'Z', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}], 'attr': {'name': 'Separate XYZ', 'bl_idname': 'ShaderNodeSeparateXYZ', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'SEPXYZ', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_custom_color': False, 'show_preview': False, 'bl_label': 'Separate XYZ', 'bl_width_max': 700.0, 'show_texture': False, 'location': [183.1748046875, -178.52780151367188], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 100.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'SEPXYZ', 'bl_idname': 'ShaderNodeSeparateXYZ'}, {'inputs': [{'link_limit': 1, 'name': 'Strength', 'default_value': 1.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Color', 'default_value': [0.5, 0.5, 1.0, 1.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}], 'outputs': [{'link_limit': 4095, 'name': 'Normal', 'default_value': [0.0, 0.0, 0.0], 'bl_idname': 'NodeSocketVector', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VECTOR', 'hide_value': False}], 'attr': {'name': 'Normal Map', 'bl_idname': 'ShaderNodeNormalMap', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'NORMAL_MAP', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 120.0, 'uv_map': '', 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_custom_color': False, 'show_preview': False, 'bl_label': 'Normal Map', 'bl_width_max': 700.0, 'show_texture': False, 'location': [-59.8880615234375, -148.28164672851562], 'bl_width_default': 150.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 150.0, 'width_hidden': 120.0, 'bl_height_min': 30.0, 'hide': False, 'space': 'TANGENT', 'bl_description': ''}, 'type': 'NORMAL_MAP', 'bl_idname': 'ShaderNodeNormalMap'}, {'inputs': [{'link_limit': 1, 'name': 'Fac', 'default_value': 0.5181818008422852, 'bl_idname': 'NodeSocketFloatFactor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Shader', 'bl_idname': 'NodeSocketShader', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'SHADER', 'hide_value': False}, {'link_limit': 1, 'name': 'Shader', 'bl_idname': 'NodeSocketShader', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'SHADER', 'hide_value': False}], 'outputs': [{'link_limit': 4095, 'name': 'Shader', 'bl_idname': 'NodeSocketShader', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'SHADER', 'hide_value': False}], 'attr': {'name': 'Mix Shader.003', 'bl_idname': 'ShaderNodeMixShader', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'MIX_SHADER', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_custom_color': False, 'show_preview': False, 'bl_label': 'Mix Shader', 'bl_width_max': 700.0, 'show_texture': False, 'location': [1896.7586669921875, -139.0824737548828], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 100.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'MIX_SHADER', 'bl_idname': 'ShaderNodeMixShader'}, {'inputs': [{'link_limit': 1, 'name': 'Shader', 'bl_idname': 'NodeSocketShader', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'SHADER', 'hide_value': False}, {'link_limit': 1, 'name': '', 'bl_idname': 'NodeSocketVirtual', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'CUSTOM', 'hide_value': False}], 'outputs': [], 'attr': {'name': 'Group Output', 'is_active_output': True, 'bl_idname': 'NodeGroupOutput', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'GROUP_OUTPUT', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 80.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_custom_color': False, 'show_preview': False, 'bl_label': 'Group Output', 'bl_width_max': 400.0, 'show_texture': False, 'location': [2613.734130859375, -154.20947265625], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 80.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'GROUP_OUTPUT', 'bl_idname': 'NodeGroupOutput'}, {'attr': {'name': 'Group', 'bl_idname': 'ShaderNodeGroup', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'GROUP', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 60.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_custom_color': False, 'show_preview': False, 'bl_label': 'Group', 'bl_width_max': 400.0, 'show_texture': False, 'location': [2082.906005859375, -695.5881958007812], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 60.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'GROUP_NAME': 'AlphaMask.001', 'bl_idname': 'ShaderNodeGroup', 'outputs': [{'link_limit': 4095, 'name': 'Shader', 'bl_idname': 'NodeSocketShader', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'SHADER', 'hide_value': False}], 'type': 'GROUP', 'inputs': [{'link_limit': 1, 'name': 'Shader', 'bl_idname': 'NodeSocketShader', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'SHADER', 'hide_value': False}, {'link_limit': 1, 'name': 'Alpha', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'AlphaCutoff', 'default_value': 0.5, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}]}, {'inputs': [{'link_limit': 1, 'name': 'Fac', 'default_value': 1.0, 'bl_idname': 'NodeSocketFloatFactor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Shader', 'bl_idname': 'NodeSocketShader', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'SHADER', 'hide_value': False}, {'link_limit': 1, 'name': 'Shader', 'bl_idname': 'NodeSocketShader', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'SHADER', 'hide_value': False}], 'outputs': [{'link_limit': 4095, 'name': 'Shader', 'bl_idname': 'NodeSocketShader', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'SHADER', 'hide_value': False}], 'attr': {'name': 'Mix Shader.001', 'bl_idname': 'ShaderNodeMixShader', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'MIX_SHADER', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_custom_color': False, 'show_preview': False, 'bl_label': 'Mix Shader', 'bl_width_max': 700.0, 'show_texture': False, 'location': [2334.755126953125, -398.73394775390625], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 100.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'MIX_SHADER', 'bl_idname': 'ShaderNodeMixShader'}, {'inputs': [{'link_limit': 1, 'name': 'Value', 'default_value': 0.5, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Value', 'default_value': 7.09999942779541, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}], 'outputs': [{'link_limit': 4095, 'name': 'Value', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}], 'attr': {'name': 'Math.010', 'bl_idname': 'ShaderNodeMath', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'MATH', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'operation': 'MAXIMUM', 'use_clamp': True, 'show_preview': False, 'use_custom_color': False, 'bl_label': 'Math', 'bl_width_max': 700.0, 'show_texture': False, 'location': [1866.9962158203125, -485.6181945800781], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 100.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'MATH', 'bl_idname': 'ShaderNodeMath'}, {'inputs': [{'link_limit': 1, 'name': 'Value', 'default_value': 0.5, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Value', 'default_value': 0.5, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}], 'outputs': [{'link_limit': 4095, 'name': 'Value', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}], 'attr': {'name': 'Math.009', 'bl_idname': 'ShaderNodeMath', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'MATH', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'operation': 'GREATER_THAN', 'use_clamp': True, 'show_preview': False, 'use_custom_color': False, 'bl_label': 'Math', 'bl_width_max': 700.0, 'show_texture': False, 'location': [1426.772216796875, -529.56103515625], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 100.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'MATH', 'bl_idname': 'ShaderNodeMath'}, {'inputs': [{'link_limit': 1, 'name': 'Value', 'default_value': 1.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Value', 'default_value': 0.5, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}], 'outputs': [{'link_limit': 4095, 'name': 'Value', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}], 'attr': {'name': 'Math.011', 'bl_idname': 'ShaderNodeMath', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'MATH', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'operation': 'SUBTRACT', 'use_clamp': True, 'show_preview': False, 'use_custom_color': False, 'bl_label': 'Math', 'bl_width_max': 700.0, 'show_texture': False, 'location': [1654.940673828125, -682.8173217773438], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 100.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'MATH', 'bl_idname': 'ShaderNodeMath'}, {'inputs': [], 'outputs': [{'link_limit': 4095, 'name': 'Position', 'default_value': [0.0, 0.0, 0.0], 'bl_idname': 'NodeSocketVector', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VECTOR', 'hide_value': False}, {'link_limit': 4095, 'name': 'Normal', 'default_value': [0.0, 0.0, 0.0], 'bl_idname': 'NodeSocketVector', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VECTOR', 'hide_value': False}, {'link_limit': 4095, 'name': 'Tangent', 'default_value': [0.0, 0.0, 0.0], 'bl_idname': 'NodeSocketVector', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VECTOR', 'hide_value': False}, {'link_limit': 4095, 'name': 'True Normal', 'default_value': [0.0, 0.0, 0.0], 'bl_idname': 'NodeSocketVector', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VECTOR', 'hide_value': False}, {'link_limit': 4095, 'name': 'Incoming', 'default_value': [0.0, 0.0, 0.0], 'bl_idname': 'NodeSocketVector', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VECTOR', 'hide_value': False}, {'link_limit': 4095, 'name': 'Parametric', 'default_value': [0.0, 0.0, 0.0], 'bl_idname': 'NodeSocketVector', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VECTOR', 'hide_value': False}, {'link_limit': 4095, 'name': 'Backfacing', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 4095, 'name': 'Pointiness', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}], 'attr': {'name': 'Geometry', 'bl_idname': 'ShaderNodeNewGeometry', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'NEW_GEOMETRY', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_custom_color': False, 'show_preview': False, 'bl_label': 'Geometry', 'bl_width_max': 700.0, 'show_texture': False, 'location': [1432.1038818359375, -730.3104858398438], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 100.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'NEW_GEOMETRY', 'bl_idname': 'ShaderNodeNewGeometry'}, {'inputs': [{'link_limit': 1, 'name': 'Fac', 'default_value': 1.0, 'bl_idname': 'NodeSocketFloatFactor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Color1', 'default_value': [1.0, 1.0, 1.0, 1.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}, {'link_limit': 1, 'name': 'Color2', 'default_value': [1.0, 1.0, 1.0, 1.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}], 'outputs': [{'link_limit': 4095, 'name': 'Color', 'default_value': [0.0, 0.0, 0.0, 0.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}], 'attr': {'name': 'Mix', 'bl_idname': 'ShaderNodeMixRGB', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'MIX_RGB', 'bl_height_max': 30.0, 'mute': False, 'blend_type': 'MULTIPLY', 'width_hidden': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_clamp': True, 'show_preview': False, 'use_custom_color': False, 'bl_label': 'Mix', 'bl_width_max': 700.0, 'show_texture': False, 'use_alpha': False, 'location': [106.8974609375, 2.0283203125], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'bl_width_min': 100.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'MIX_RGB', 'bl_idname': 'ShaderNodeMixRGB'}, {'inputs': [], 'outputs': [{'link_limit': 4095, 'name': 'Color', 'default_value': [1.0, 1.0, 1.0, 1.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}], 'attr': {'name': 'RGB', 'bl_idname': 'ShaderNodeRGB', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'RGB', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_custom_color': False, 'show_preview': False, 'bl_label': 'RGB', 'bl_width_max': 700.0, 'show_texture': False, 'location': [-686.5562744140625, 246.34185791015625], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 100.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'RGB', 'bl_idname': 'ShaderNodeRGB'}, {'inputs': [{'link_limit': 1, 'name': 'Value', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Value', 'default_value': 0.4000000059604645, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}], 'outputs': [{'link_limit': 4095, 'name': 'Value', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}], 'attr': {'name': 'Math.013', 'bl_idname': 'ShaderNodeMath', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'MATH', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'operation': 'GREATER_THAN', 'use_clamp': True, 'show_preview': False, 'use_custom_color': False, 'bl_label': 'Math', 'bl_width_max': 700.0, 'show_texture': False, 'location': [-537.4019775390625, -93.07781982421875], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 100.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'MATH', 'bl_idname': 'ShaderNodeMath'}, {'inputs': [{'link_limit': 1, 'name': 'Fac', 'default_value': 1.0, 'bl_idname': 'NodeSocketFloatFactor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Color1', 'default_value': [0.5, 0.5, 0.5, 1.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}, {'link_limit': 1, 'name': 'Color2', 'default_value': [1.0, 1.0, 1.0, 1.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}], 'outputs': [{'link_limit': 4095, 'name': 'Color', 'default_value': [0.0, 0.0, 0.0, 0.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}], 'attr': {'name': 'Mix.001', 'bl_idname': 'ShaderNodeMixRGB', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'MIX_RGB', 'bl_height_max': 30.0, 'mute': False, 'blend_type': 'MULTIPLY', 'width_hidden': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_clamp': True, 'show_preview': False, 'use_custom_color': False, 'bl_label': 'Mix', 'bl_width_max': 700.0, 'show_texture': False, 'use_alpha': False, 'location': [-119.661376953125, -32.52740478515625], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'bl_width_min': 100.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'MIX_RGB', 'bl_idname': 'ShaderNodeMixRGB'}, {'inputs': [], 'outputs': [{'link_limit': 4095, 'name': 'BaseColor', 'default_value': [1.0, 1.0, 1.0, 1.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}, {'link_limit': 4095, 'name': 'BaseColorFactor', 'default_value': [1.0, 1.0, 1.0, 1.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}, {'link_limit': 4095, 'name': 'MetallicRoughness', 'default_value': [0.5, 0.5, 0.5, 1.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}, {'link_limit': 4095, 'name': 'MetallicFactor', 'default_value': 1.0, 'bl_idname': 'NodeSocketFloatFactor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 4095, 'name': 'RoughnessFactor', 'default_value': 0.5, 'bl_idname': 'NodeSocketFloatFactor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 4095, 'name': 'Normal', 'default_value': [0.5, 0.5, 1.0, 1.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}, {'link_limit': 4095, 'name': 'NormalScale', 'default_value': 0.5, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 4095, 'name': 'Occlusion', 'default_value': [1.0, 1.0, 1.0, 1.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}, {'link_limit': 4095, 'name': 'OcclusionStrength', 'default_value': 1.0, 'bl_idname': 'NodeSocketFloatFactor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 4095, 'name': 'Emissive', 'default_value': [0.0, 0.0, 0.0, 1.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}, {'link_limit': 4095, 'name': 'EmissiveFactor', 'default_value': [0.0, 0.0, 0.0, 1.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}, {'link_limit': 4095, 'name': 'Alpha', 'default_value': 1.0, 'bl_idname': 'NodeSocketFloatFactor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 4095, 'name': 'AlphaCutoff', 'default_value': 0.5, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 4095, 'name': 'AlphaMode', 'default_value': 0.5181818008422852, 'bl_idname': 'NodeSocketFloatFactor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 4095, 'name': 'DoubleSided', 'default_value': 0.5, 'bl_idname': 'NodeSocketFloatFactor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 4095, 'name': 'Use COLOR_0', 'default_value': 0.5, 'bl_idname': 'NodeSocketFloatFactor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 4095, 'name': 'COLOR_0', 'default_value': [0.5, 0.5, 0.5, 1.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}, {'link_limit': 4095, 'name': '', 'bl_idname': 'NodeSocketVirtual', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'CUSTOM', 'hide_value': False}], 'attr': {'name': 'Group Input', 'bl_idname': 'NodeGroupInput', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'GROUP_INPUT', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 80.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_custom_color': False, 'show_preview': False, 'bl_label': 'Group Input', 'bl_width_max': 400.0, 'show_texture': False, 'location': [-2667.22265625, -3.4456253051757812], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 80.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'GROUP_INPUT', 'bl_idname': 'NodeGroupInput'}, {'inputs': [{'link_limit': 1, 'name': 'Fac', 'default_value': 1.0, 'bl_idname': 'NodeSocketFloatFactor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Color1', 'default_value': [0.5, 0.5, 0.5, 1.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}, {'link_limit': 1, 'name': 'Color2', 'default_value': [0.5, 0.5, 0.5, 1.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}], 'outputs': [{'link_limit': 4095, 'name': 'Color', 'default_value': [0.0, 0.0, 0.0, 0.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}], 'attr': {'name': 'Mix.002', 'bl_idname': 'ShaderNodeMixRGB', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'MIX_RGB', 'bl_height_max': 30.0, 'mute': False, 'blend_type': 'MULTIPLY', 'width_hidden': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_clamp': True, 'show_preview': False, 'use_custom_color': False, 'bl_label': 'Mix', 'bl_width_max': 700.0, 'show_texture': False, 'use_alpha': False, 'location': [-358.7894287109375, 103.55322265625], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'bl_width_min': 100.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'MIX_RGB', 'bl_idname': 'ShaderNodeMixRGB'}, {'inputs': [{'link_limit': 1, 'name': 'Image', 'default_value': [1.0, 1.0, 1.0, 1.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}], 'outputs': [{'link_limit': 4095, 'name': 'R', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 4095, 'name': 'G', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 4095, 'name': 'B', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}], 'attr': {'name': 'Separate RGB.001', 'bl_idname': 'ShaderNodeSeparateRGB', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'SEPRGB', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_custom_color': False, 'show_preview': False, 'bl_label': 'Separate RGB', 'bl_width_max': 700.0, 'show_texture': False, 'location': [-2102.466064453125, -468.2144775390625], 'bl_width_default': 140.0, 'height': 100.0, 'select': False, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 100.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'SEPRGB', 'bl_idname': 'ShaderNodeSeparateRGB'}, {'inputs': [{'link_limit': 1, 'name': 'Base Color', 'default_value': [0.800000011920929, 0.800000011920929, 0.800000011920929, 1.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}, {'link_limit': 1, 'name': 'Subsurface', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloatFactor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Subsurface Radius', 'default_value': [1.0, 1.0, 1.0], 'bl_idname': 'NodeSocketVector', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VECTOR', 'hide_value': False}, {'link_limit': 1, 'name': 'Subsurface Color', 'default_value': [0.0, 0.0, 0.0, 1.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}, {'link_limit': 1, 'name': 'Metallic', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloatFactor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Specular', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloatFactor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Specular Tint', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloatFactor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Roughness', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloatFactor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Anisotropic', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloatFactor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Anisotropic Rotation', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloatFactor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Sheen', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloatFactor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Sheen Tint', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloatFactor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Clearcoat', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloatFactor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Clearcoat Roughness', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloatFactor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'IOR', 'default_value': 1.4500000476837158, 'bl_idname': 'NodeSocketFloat', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Transmission', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloatFactor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Transmission Roughness', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloatFactor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Normal', 'default_value': [0.0, 0.0, 0.0], 'bl_idname': 'NodeSocketVector', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VECTOR', 'hide_value': True}, {'link_limit': 1, 'name': 'Clearcoat Normal', 'default_value': [0.0, 0.0, 0.0], 'bl_idname': 'NodeSocketVector', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VECTOR', 'hide_value': True}, {'link_limit': 1, 'name': 'Tangent', 'default_value': [0.0, 0.0, 0.0], 'bl_idname': 'NodeSocketVector', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VECTOR', 'hide_value': True}], 'outputs': [{'link_limit': 4095, 'name': 'BSDF', 'bl_idname': 'NodeSocketShader', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'SHADER', 'hide_value': False}], 'attr': {'name': 'Principled BSDF', 'bl_idname': 'ShaderNodeBsdfPrincipled', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'BSDF_PRINCIPLED', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 120.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_custom_color': False, 'show_preview': False, 'bl_label': 'Principled BSDF', 'bl_width_max': 700.0, 'show_texture': False, 'location': [756.3221435546875, 321.06005859375], 'bl_width_default': 150.0, 'height': 100.0, 'select': True, 'bl_icon': 'NONE', 'width': 150.0, 'width_hidden': 120.0, 'distribution': 'GGX', 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'BSDF_PRINCIPLED', 'bl_idname': 'ShaderNodeBsdfPrincipled'}, {'inputs': [{'link_limit': 1, 'name': 'Fac', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloatFactor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'Color1', 'default_value': [0.5, 0.5, 0.5, 1.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}, {'link_limit': 1, 'name': 'Color2', 'default_value': [1.0, 1.0, 1.0, 1.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}], 'outputs': [{'link_limit': 4095, 'name': 'Color', 'default_value': [0.0, 0.0, 0.0, 0.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}], 'attr': {'name': 'Mix.003', 'bl_idname': 'ShaderNodeMixRGB', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'MIX_RGB', 'bl_height_max': 30.0, 'mute': False, 'blend_type': 'MULTIPLY', 'width_hidden': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_clamp': True, 'show_preview': False, 'use_custom_color': False, 'bl_label': 'Mix', 'bl_width_max': 700.0, 'show_texture': False, 'use_alpha': False, 'location': [432.3741760253906, 318.28192138671875], 'bl_width_default': 140.0, 'height': 100.0, 'select': True, 'bl_icon': 'NONE', 'width': 140.0, 'bl_width_min': 100.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'MIX_RGB', 'bl_idname': 'ShaderNodeMixRGB'}, {'inputs': [{'link_limit': 1, 'name': 'R', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloatUnsigned', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'G', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloatUnsigned', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}, {'link_limit': 1, 'name': 'B', 'default_value': 0.0, 'bl_idname': 'NodeSocketFloatUnsigned', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'VALUE', 'hide_value': False}], 'outputs': [{'link_limit': 4095, 'name': 'Image', 'default_value': [0.0, 0.0, 0.0, 0.0], 'bl_idname': 'NodeSocketColor', 'show_expanded': False, 'enabled': True, 'hide': False, 'type': 'RGBA', 'hide_value': False}], 'attr': {'name': 'Combine RGB', 'bl_idname': 'ShaderNodeCombineRGB', 'bl_height_default': 100.0, 'show_options': True, 'bl_static_type': 'COMBRGB', 'bl_height_max': 30.0, 'mute': False, 'bl_width_min': 100.0, 'color': [0.6079999804496765, 0.6079999804496765, 0.6079999804496765], 'label': '', 'use_custom_color': False, 'show_preview': False, 'bl_label': 'Combine RGB', 'bl_width_max': 700.0, 'show_texture': False, 'location': [112.35455322265625, 159.4531707763672], 'bl_width_default': 140.0, 'height': 100.0, 'select': True, 'bl_icon': 'NONE', 'width': 140.0, 'width_hidden': 100.0, 'bl_height_min': 30.0, 'hide': False, 'bl_description': ''}, 'type': 'COMBRGB', 'bl_idname': 'ShaderNodeCombineRGB'}], 'bl_idname': 'ShaderNodeTree', 'tree_attr': {'tag': False, 'bl_label': 'Shader', 'name': 'glTF Metallic Roughness', 'bl_idname': 'ShaderNodeTree', 'bl_icon': 'MATERIAL', 'grease_pencil': None, 'bl_description': 'Shader nodes'}, 'inputs': [{'bl_socket_idname': 'NodeSocketColor', 'name': 'BaseColor', 'default_value': [1.0, 1.0, 1.0, 1.0]}, {'bl_socket_idname': 'NodeSocketColor', 'name': 'BaseColorFactor', 'default_value': [1.0, 1.0, 1.0, 1.0]}, {'bl_socket_idname': 'NodeSocketColor', 'name': 'MetallicRoughness', 'default_value': [1.0, 1.0, 1.0, 1.0]}, {'bl_socket_idname': 'NodeSocketFloatFactor', 'min_value': 0.0, 'name': 'MetallicFactor', 'default_value': 1.0, 'max_value': 1.0}, {'bl_socket_idname': 'NodeSocketFloatFactor', 'min_value': 0.0, 'name': 'RoughnessFactor', 'default_value': 1.0, 'max_value': 1.0}, {'bl_socket_idname': 'NodeSocketColor', 'name': 'Normal', 'default_value': [0.5, 0.5, 1.0, 1.0]}, {'bl_socket_idname': 'NodeSocketFloat', 'min_value': -10000.0, 'name': 'NormalScale', 'default_value': 1.0, 'max_value': 10000.0}, {'bl_socket_idname': 'NodeSocketColor', 'name': 'Occlusion', 'default_value': [1.0, 1.0, 1.0, 1.0]}, {'bl_socket_idname': 'NodeSocketFloatFactor', 'min_value': 0.0, 'name': 'OcclusionStrength', 'default_value': 1.0, 'max_value': 1.0}, {'bl_socket_idname': 'NodeSocketColor', 'name': 'Emissive', 'default_value': [1.0, 1.0, 1.0, 1.0]}, {'bl_socket_idname': 'NodeSocketColor', 'name': 'EmissiveFactor', 'default_value': [0.0, 0.0, 0.0, 1.0]}, {'bl_socket_idname': 'NodeSocketFloatFactor', 'min_value': 0.0, 'name': 'Alpha', 'default_value': 1.0, 'max_value': 1.0}, {'bl_socket_idname': 'NodeSocketFloat', 'min_value': 0.0, 'name': 'AlphaCutoff', 'default_value': 0.5, 'max_value': 1.100000023841858}, {'bl_socket_idname': 'NodeSocketFloatFactor', 'min_value': 0.0, 'name': 'AlphaMode', 'default_value': 0.0, 'max_value': 1.0}, {'bl_socket_idname': 'NodeSocketFloatFactor', 'min_value': 0.0, 'name': 'DoubleSided', 'default_value': 0.0, 'max_value': 1.0}, {'bl_socket_idname': 'NodeSocketFloatFactor', 'min_value': 0.0, 'name': 'Use COLOR_0', 'default_value': 0.0, 'max_value': 1.0}, {'bl_socket_idname': 'NodeSocketColor', 'name': 'COLOR_0', 'default_value': [0.0, 0.0, 0.0, 1.0]}]}]
+'''
+'glTF Metallic Roughness' node groups exported by blender_groupnode_io.
+
+stored as compact json and loaded on first use.
+'''
+import json
+import hashlib
+import pathlib
+from typing import List, Optional
+
+JSON_PATH = pathlib.Path(__file__).absolute().parent / 'gltf_pbr_node.json'
+
+_data: Optional[bytes] = None
+_groups: Optional[List[dict]] = None
+
+
+def _read()->bytes:
+    global _data  # pylint: disable=W0603
+    if _data is None:
+        _data = JSON_PATH.read_bytes()
+    return _data
+
+
+def get_hash()->str:
+    return hashlib.sha1(_read()).hexdigest()
+
+
+def get_groups()->List[dict]:
+    global _groups  # pylint: disable=W0603
+    if _groups is None:
+        _groups = json.loads(_read().decode('utf-8'))
+    return _groups
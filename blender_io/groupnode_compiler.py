@@ -0,0 +1,218 @@
+'''
+compile node group json (blender_groupnode_io.export_groups) into a python
+function that builds the groups with plain RNA calls.
+
+the compiled code object is cached on disk by the content hash of the json,
+in a per user directory because it is exec-ed.
+'''
+import sys
+import json
+import time
+import marshal
+import hashlib
+import pathlib
+from typing import List, Dict, Any, Callable, Optional, Tuple
+
+try:
+    from . import user_cache
+except ImportError:
+    # run as script in the text editor
+    import user_cache
+
+from logging import getLogger  # pylint: disable=C0411
+logger = getLogger(__name__)
+
+# bump when generated code changes
+COMPILER_VERSION = 1
+
+# attributes that are equal to the blender default are not emitted
+NODE_DEFAULTS: Dict[str, Any] = {
+    'mute': False,
+    'hide': False,
+    'use_custom_color': False,
+    'label': '',
+    'show_options': True,
+    'show_preview': False,
+    'show_texture': False,
+    'text': None,
+}
+
+SOCKET_DEFAULTS: Dict[str, Any] = {
+    'enabled': True,
+    'hide': False,
+    'hide_value': False,
+    'show_expanded': False,
+}
+
+# not settable or not meaningful on a new instance
+NODE_SKIP = {'name', 'bl_idname', 'select', 'width_hidden', 'is_active_output'}
+SOCKET_SKIP = {'name', 'bl_idname', 'bl_socket_idname', 'type', 'link_limit'}
+
+
+def get_hash(src: List[dict])->str:
+    js = json.dumps(src, sort_keys=True)
+    return hashlib.sha1(
+        f'{COMPILER_VERSION}:{js}'.encode('utf-8')).hexdigest()
+
+
+def _is_default(k: str, v: Any, defaults: Dict[str, Any])->bool:
+    return k in defaults and defaults[k] == v
+
+
+def _socket_lines(var: str, src: dict)->List[str]:
+    lines = []
+    for k, v in src.items():
+        if k in SOCKET_SKIP or k.startswith('bl_'):
+            continue
+        if _is_default(k, v, SOCKET_DEFAULTS):
+            continue
+        lines.append(f'    {var}.{k} = {v!r}')
+    return lines
+
+
+def _group_lines(i: int, g: dict)->List[str]:
+    if g['bl_idname'] != 'ShaderNodeTree':
+        raise Exception('not ShaderNodeTree')
+
+    lines = [
+        f'    g = node_groups.new({g["name"]!r}, {g["bl_idname"]!r})',
+        '    g.use_fake_user = True',
+        f'    groups[{g["name"]!r}] = g',
+    ]
+
+    # interface
+    for inout in ('inputs', 'outputs'):
+        for src in g[inout]:
+            t = src.get('bl_socket_idname', src.get('bl_idname'))
+            lines.append(f'    s = g.{inout}.new({t!r}, {src["name"]!r})')
+            lines.extend(_socket_lines('s', src))
+
+    # nodes
+    lines.append('    new = g.nodes.new')
+    for j, n in enumerate(g['nodes']):
+        var = f'n{j}'
+        lines.append(f'    {var} = new({n["bl_idname"]!r})')
+        if 'GROUP_NAME' in n:
+            lines.append(f'    {var}.node_tree = groups[{n["GROUP_NAME"]!r}]')
+
+        # sockets before attributes, same as import_inout
+        for inout in ('inputs', 'outputs'):
+            for k, src in enumerate(n[inout]):
+                socket_lines = _socket_lines('s', src)
+                if socket_lines:
+                    lines.append(f'    s = {var}.{inout}[{k}]')
+                    lines.extend(socket_lines)
+
+        attr = n['attr']
+        lines.append(f'    {var}.name = {attr["name"]!r}')
+        for k, v in attr.items():
+            if k in NODE_SKIP or k.startswith('bl_'):
+                continue
+            if _is_default(k, v, NODE_DEFAULTS):
+                continue
+            if k == 'color' and not attr.get('use_custom_color'):
+                continue
+            if k == 'height' and n['bl_idname'] != 'NodeFrame':
+                # only frames have a settable height
+                continue
+            lines.append(f'    {var}.{k} = {v!r}')
+
+    # links
+    if g['links']:
+        lines.append('    link = g.links.new')
+    for l in g['links']:
+        lines.append(f'    link(n{l["from_node"]}.outputs[{l["from_socket"]}],'
+                     f' n{l["to_node"]}.inputs[{l["to_socket"]}], False)')
+
+    return [f'    # {i}: {g["name"]}'] + lines
+
+
+def to_source(src: List[dict])->str:
+    '''
+    generate python source of `def build(bpy)->Dict[str, NodeTree]`
+    '''
+    lines = [
+        'def build(bpy):',
+        '    groups = {}',
+        '    node_groups = bpy.data.node_groups',
+    ]
+    for i, g in enumerate(src):
+        lines.extend(_group_lines(i, g))
+    lines.append('    return groups')
+    return '\n'.join(lines) + '\n'
+
+
+def get_cache_dir()->pathlib.Path:
+    return user_cache.get_cache_dir('groupnode')
+
+
+def _get_cache_path(src_hash: str)->Optional[pathlib.Path]:
+    try:
+        cache_dir = get_cache_dir()
+    except OSError as ex:
+        logger.warning('no code cache: %s', ex)
+        return None
+    return cache_dir / \
+        f'{src_hash}.v{COMPILER_VERSION}.{sys.implementation.cache_tag}.marshal'
+
+
+def _compile(src: List[dict], src_hash: str):
+    return compile(to_source(src), f'<groupnode {src_hash[:8]}>', 'exec')
+
+
+def _load_code(src: List[dict], src_hash: str):
+    cache = _get_cache_path(src_hash)
+    if cache and cache.exists():
+        try:
+            return marshal.loads(cache.read_bytes())
+        except (EOFError, ValueError, TypeError) as ex:
+            logger.warning('broken cache %s: %s', cache, ex)
+
+    code = _compile(src, src_hash)
+    if cache:
+        try:
+            cache.write_bytes(marshal.dumps(code))
+        except OSError as ex:
+            logger.warning('can not write cache %s: %s', cache, ex)
+    return code
+
+
+def benchmark_compile(src: List[dict], count: int = 20)->Tuple[float, float]:
+    '''
+    the bpy free part of get_builder.
+    returns seconds per (generate and compile, load from the marshal cache).
+    building the groups is measured by blender_groupnode_io.benchmark_groups
+    '''
+    src_hash = get_hash(src)
+    start = time.perf_counter()
+    for _ in range(count):
+        code = _compile(src, src_hash)
+    cold = (time.perf_counter() - start) / count
+
+    data = marshal.dumps(code)
+    start = time.perf_counter()
+    for _ in range(count):
+        marshal.loads(data)
+    cached = (time.perf_counter() - start) / count
+    logger.info('generate and compile: %.2f ms, from cache: %.2f ms',
+                cold * 1000, cached * 1000)
+    return cold, cached
+
+
+_builders: Dict[str, Callable[[Any], Dict[str, Any]]] = {}
+
+
+def get_builder(src: List[dict],
+                src_hash: Optional[str] = None)->Callable[[Any], Dict[str, Any]]:
+    '''
+    compiled build(bpy) function for src
+    '''
+    if not src_hash:
+        src_hash = get_hash(src)
+    builder = _builders.get(src_hash)
+    if not builder:
+        namespace: Dict[str, Any] = {}
+        exec(_load_code(src, src_hash), namespace)  # pylint: disable=W0122
+        builder = namespace['build']
+        _builders[src_hash] = builder
+    return builder
@@ -0,0 +1,75 @@
+'''
+read size and alpha from PNG/JPEG headers without decoding pixels
+'''
+import struct
+from typing import Optional
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+class ImageInfo:
+    def __init__(self, image_format: str, width: int, height: int,
+                 has_alpha: bool)->None:
+        self.format = image_format
+        self.width = width
+        self.height = height
+        self.has_alpha = has_alpha
+
+    def __str__(self)->str:
+        alpha = ' alpha' if self.has_alpha else ''
+        return f'<{self.format} {self.width}x{self.height}{alpha}>'
+
+
+def probe_png(data: bytes)->Optional[ImageInfo]:
+    if data[:8] != PNG_SIGNATURE or data[12:16] != b'IHDR' or len(data) < 26:
+        return None
+    width, height, _depth, color_type = struct.unpack('>IIBB', data[16:26])
+    # gray + alpha, rgba
+    has_alpha = color_type in (4, 6)
+    if not has_alpha:
+        # transparency chunk before image data
+        pos = 8
+        while pos + 8 <= len(data):
+            length, chunk_type = struct.unpack('>I4s', data[pos:pos+8])
+            if chunk_type == b'tRNS':
+                has_alpha = True
+                break
+            if chunk_type in (b'IDAT', b'IEND'):
+                break
+            pos += 12 + length
+    return ImageInfo('PNG', width, height, has_alpha)
+
+
+# start of frame markers. C4(DHT), C8(JPG), CC(DAC) are not
+JPEG_SOF = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7,
+            0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+
+def probe_jpeg(data: bytes)->Optional[ImageInfo]:
+    if data[:2] != b'\xff\xd8':
+        return None
+    pos = 2
+    while pos + 4 <= len(data):
+        if data[pos] != 0xFF:
+            return None
+        marker = data[pos+1]
+        if marker == 0xFF:
+            # fill byte
+            pos += 1
+            continue
+        if marker in (0x01, 0xD0, 0xD1, 0xD2, 0xD3, 0xD4, 0xD5, 0xD6, 0xD7):
+            # no length
+            pos += 2
+            continue
+        length = struct.unpack('>H', data[pos+2:pos+4])[0]
+        if marker in JPEG_SOF:
+            if pos + 9 > len(data):
+                return None
+            height, width = struct.unpack('>HH', data[pos+5:pos+9])
+            return ImageInfo('JPEG', width, height, False)
+        pos += 2 + length
+    return None
+
+
+def probe(data: bytes)->Optional[ImageInfo]:
+    return probe_png(data) or probe_jpeg(data)
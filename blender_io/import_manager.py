@@ -1,11 +1,16 @@
 import pathlib
 import ctypes
-from typing import List, Tuple, Dict, Any
+import threading
+from typing import List, Tuple, Dict, Any, Optional
 
 import bpy
 import mathutils  # pylint: disable=E0401
+import numpy
 
 from . import gltftypes
+from .metadata import MetadataWriter
+from . import selection
+from . import meshopt
 
 
 class Float2(ctypes.Structure):
@@ -127,6 +132,30 @@ def get_accessor_component_type_to_len(component_type: gltftypes.Accessor_compon
         raise NotImplementedError()
 
 
+COMPONENT_DTYPE = {
+    gltftypes.Accessor_componentType.BYTE: numpy.int8,
+    gltftypes.Accessor_componentType.UNSIGNED_BYTE: numpy.uint8,
+    gltftypes.Accessor_componentType.SHORT: numpy.int16,
+    gltftypes.Accessor_componentType.UNSIGNED_SHORT: numpy.uint16,
+    gltftypes.Accessor_componentType.UNSIGNED_INT: numpy.uint32,
+    gltftypes.Accessor_componentType.FLOAT: numpy.float32,
+}
+
+SPARSE_INDEX_DTYPE = {
+    gltftypes.AccessorSparseIndices_componentType.UNSIGNED_BYTE: numpy.uint8,
+    gltftypes.AccessorSparseIndices_componentType.UNSIGNED_SHORT: numpy.uint16,
+    gltftypes.AccessorSparseIndices_componentType.UNSIGNED_INT: numpy.uint32,
+}
+
+# normalized integer => float divisor
+NORMALIZE_DIVISOR = {
+    numpy.int8: 127.0,
+    numpy.uint8: 255.0,
+    numpy.int16: 32767.0,
+    numpy.uint16: 65535.0,
+}
+
+
 def get_accessor_byteslen(accessor: gltftypes.Accessor)->int:
     return (accessor.count
             * get_accessor_type_to_count(accessor.type)
@@ -136,14 +165,55 @@ def get_accessor_byteslen(accessor: gltftypes.Accessor)->int:
 class ImportManager:
     def __init__(self, path: pathlib.Path,
                  gltf: gltftypes.glTF, body: bytes,
-                 yup_to_zup: bool)->None:
+                 yup_to_zup: bool, *, metadata_mode: str = 'NONE',
+                 scene_index: int = -1, extract_images: bool = False,
+                 lazy_textures: bool = False, proxy_size: int = 0,
+                 import_animation: bool = True,
+                 keyframe_tolerance: float = 0.0,
+                 bake_animation: bool = False,
+                 vrm_blend_shapes: str = 'DRIVERS',
+                 instancing: str = 'FACES',
+                 instance_repeated: bool = False,
+                 flatten_static: bool = False,
+                 bounds_only: bool = False,
+                 node_filter: str = '', mesh_filter: str = '',
+                 root_nodes: str = '', lod_level: int = 0)->None:
         self.path = path
         self.base_dir = path.parent
         self.gltf = gltf
         self.body = body
-        self.textures: List[bpy.types.Texture] = []
-        self.materials: List[bpy.types.Material] = []
-        self.meshes: List[Tuple[bpy.types.Mesh, Any]] = []
+        # indexed by gltf index. None if not selected
+        self.images: List[Optional[bpy.types.Image]] = []
+        # texture index to the shared image of its source
+        self.textures: List[Optional[bpy.types.Image]] = []
+        self.materials: List[Optional[bpy.types.Material]] = []
+        # gltf material index to the index of the deduplicated material
+        self.material_map: List[int] = []
+        self.meshes: List[Optional[Tuple[bpy.types.Mesh, Any]]] = []
+
+        self.selection = selection.from_filter(
+            gltf, scene_index, lod_level, node_filter, mesh_filter,
+            selection.parse_indices(root_nodes))
+
+        # reported after import
+        self.stats: Dict[str, Any] = {}
+
+        self.extract_images = extract_images
+        self.lazy_textures = lazy_textures
+        # 0 is full resolution
+        self.proxy_size = proxy_size
+        self.import_animation = import_animation
+        # 0 keeps all keys
+        self.keyframe_tolerance = keyframe_tolerance
+        self.bake_animation = bake_animation
+        # DRIVERS or PROPERTIES
+        self.vrm_blend_shapes = vrm_blend_shapes
+        # FACES or COLLECTION
+        self.instancing = instancing
+        self.instance_repeated = instance_repeated
+        self.flatten_static = flatten_static
+        # meshes are boxes from accessor min/max. buffers are never read
+        self.bounds_only = bounds_only
 
         self.yup_to_zup = yup_to_zup
         if self.yup_to_zup:
@@ -155,23 +225,55 @@ class ImportManager:
             self.mod_q = lambda q: q
 
         self._buffer_map: Dict[str, bytes] = {}
+        # decoded EXT_meshopt_compression views
+        self._meshopt_map: Dict[int, bytes] = {}
+        # get_view_bytes is called from texture worker threads
+        self._buffer_lock = threading.Lock()
 
-    def get_view_bytes(self, view_index: int)->bytes:
-        view = self.gltf.bufferViews[view_index]
-        buffer = self.gltf.buffers[view.buffer]
+        self.metadata = MetadataWriter(metadata_mode, f'{path.name}.json')
+
+    def get_material(self, material_index: int)->Optional[bpy.types.Material]:
+        if material_index == -1:
+            return None
+        return self.materials[self.material_map[material_index]]
+
+    def get_buffer_bytes(self, buffer_index: int)->bytes:
+        buffer = self.gltf.buffers[buffer_index]
         if buffer.uri:
-            if buffer.uri in self._buffer_map:
-                return self._buffer_map[buffer.uri][view.byteOffset:view.byteOffset+view.byteLength]
-            else:
-                path = self.base_dir / buffer.uri
-                with path.open('rb') as f:
-                    data = f.read()
+            with self._buffer_lock:
+                data = self._buffer_map.get(buffer.uri)
+                if data is None:
+                    path = self.base_dir / buffer.uri
+                    with path.open('rb') as f:
+                        data = f.read()
                     self._buffer_map[buffer.uri] = data
-                    return data[view.byteOffset:
-                                view.byteOffset+view.byteLength]
+            return data
         else:
-            return self.body[view.byteOffset:
-                             view.byteOffset+view.byteLength]
+            return self.body
+
+    def _get_meshopt_bytes(self, view_index: int, ext: Dict[str, Any])->bytes:
+        with self._buffer_lock:
+            data = self._meshopt_map.get(view_index)
+        if data is None:
+            offset = ext.get('byteOffset', 0)
+            src = self.get_buffer_bytes(ext['buffer'])[
+                offset:offset + ext['byteLength']]
+            data = meshopt.decode(ext['mode'], ext.get('filter', 'NONE'),
+                                  ext['count'], ext['byteStride'], src)
+            with self._buffer_lock:
+                self._meshopt_map[view_index] = data
+        return data
+
+    def get_view_bytes(self, view_index: int)->bytes:
+        view = self.gltf.bufferViews[view_index]
+        ext = view.extensions.get(meshopt.EXTENSION_NAME) \
+            if view.extensions else None
+        if ext:
+            # the view's own buffer is only a fallback. usually without data
+            return self._get_meshopt_bytes(view_index, ext)
+        data = self.get_buffer_bytes(view.buffer)
+        return data[view.byteOffset:
+                    view.byteOffset+view.byteLength]
 
     def get_array(self, accessor_index: int):
         accessor = self.gltf.accessors[accessor_index]
@@ -213,3 +315,57 @@ class ImportManager:
                         accessor.count).from_buffer_copy(segment)
 
         raise NotImplementedError()
+
+    def _view_ndarray(self, view_index: int, byte_offset: int, dtype,
+                      count: int, components: int)->numpy.ndarray:
+        view = self.gltf.bufferViews[view_index]
+        data = self.get_view_bytes(view_index)
+        itemsize = numpy.dtype(dtype).itemsize
+        if view.byteStride > 0 and view.byteStride != itemsize * components:
+            # interleaved
+            return numpy.ndarray((count, components), dtype, buffer=data,
+                                 offset=byte_offset,
+                                 strides=(view.byteStride, itemsize)).copy()
+        return numpy.frombuffer(data, dtype, count * components,
+                                byte_offset).reshape(count, components).copy()
+
+    def get_ndarray(self, accessor_index: int)->numpy.ndarray:
+        '''
+        (count, components) array of the componentType.
+        resolves byteStride and sparse.
+        '''
+        accessor = self.gltf.accessors[accessor_index]
+        dtype = COMPONENT_DTYPE[accessor.componentType]
+        components = get_accessor_type_to_count(accessor.type)
+        if accessor.bufferView == -1:
+            array = numpy.zeros((accessor.count, components), dtype)
+        else:
+            array = self._view_ndarray(accessor.bufferView, accessor.byteOffset,
+                                       dtype, accessor.count, components)
+
+        sparse = accessor.sparse
+        if sparse:
+            indices = self._view_ndarray(
+                sparse.indices.bufferView, sparse.indices.byteOffset,
+                SPARSE_INDEX_DTYPE[sparse.indices.componentType],
+                sparse.count, 1)[:, 0]
+            values = self._view_ndarray(
+                sparse.values.bufferView, sparse.values.byteOffset,
+                dtype, sparse.count, components)
+            array[indices] = values
+
+        return array
+
+    def get_float_ndarray(self, accessor_index: int)->numpy.ndarray:
+        '''
+        get_ndarray as float32. normalized integers are mapped to [0, 1] or [-1, 1]
+        '''
+        accessor = self.gltf.accessors[accessor_index]
+        array = self.get_ndarray(accessor_index)
+        if array.dtype == numpy.float32:
+            return array
+        result = array.astype(numpy.float32)
+        if accessor.normalized:
+            result /= NORMALIZE_DIVISOR[array.dtype.type]
+            numpy.maximum(result, -1.0, out=result)
+        return result
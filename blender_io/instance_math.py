@@ -0,0 +1,64 @@
+'''
+instance transforms and the triangles that place them. no bpy.
+'''
+import numpy
+
+# gltf to blender axis
+YUP_TO_ZUP = numpy.array((
+    (1, 0, 0, 0),
+    (0, 0, -1, 0),
+    (0, 1, 0, 0),
+    (0, 0, 0, 1),
+), numpy.float32)
+
+# triangle of area 1 with its centroid at the origin, normal +Z and first
+# edge +X. face instancing derives rotation from these and scale from
+# sqrt(area), and places the instance at the centroid
+FACE = (numpy.array((
+    (0.0, 0.0, 0.0),
+    (1.0, 0.0, 0.0),
+    (0.0, 1.0, 0.0),
+), numpy.float32) - numpy.array((1 / 3, 1 / 3, 0), numpy.float32)) \
+    * numpy.float32(numpy.sqrt(2))
+
+
+def compose(t: numpy.ndarray, q: numpy.ndarray, s: numpy.ndarray)->numpy.ndarray:
+    '''
+    (N, 4, 4) from gltf translation, rotation (x, y, z, w) and scale
+    '''
+    x, y, z, w = q[:, 0], q[:, 1], q[:, 2], q[:, 3]
+    m = numpy.zeros((len(t), 4, 4), numpy.float32)
+    m[:, 0, 0] = 1 - 2 * (y * y + z * z)
+    m[:, 0, 1] = 2 * (x * y - z * w)
+    m[:, 0, 2] = 2 * (x * z + y * w)
+    m[:, 1, 0] = 2 * (x * y + z * w)
+    m[:, 1, 1] = 1 - 2 * (x * x + z * z)
+    m[:, 1, 2] = 2 * (y * z - x * w)
+    m[:, 2, 0] = 2 * (x * z - y * w)
+    m[:, 2, 1] = 2 * (y * z + x * w)
+    m[:, 2, 2] = 1 - 2 * (x * x + y * y)
+    m[:, :3, :3] *= s[:, numpy.newaxis, :]
+    m[:, :3, 3] = t
+    m[:, 3, 3] = 1
+    return m
+
+
+def is_similarity(m: numpy.ndarray)->numpy.ndarray:
+    '''
+    rotation * uniform positive scale. what a face can express
+    '''
+    basis = m[:, :3, :3]
+    gram = numpy.swapaxes(basis, 1, 2) @ basis
+    scale2 = numpy.trace(gram, axis1=1, axis2=2) / 3
+    expected = scale2[:, numpy.newaxis, numpy.newaxis] * numpy.eye(3)
+    error = numpy.abs(gram - expected).max(axis=(1, 2))
+    return (error <= 1e-4 * numpy.maximum(scale2, 1e-12)) \
+        & (numpy.linalg.det(basis) > 0)
+
+
+def face_corners(m: numpy.ndarray)->numpy.ndarray:
+    '''
+    (N, 3 vertices, 3). FACE transformed by each matrix
+    '''
+    return FACE @ numpy.swapaxes(m[:, :3, :3], 1, 2) \
+        + m[:, numpy.newaxis, :3, 3]
@@ -0,0 +1,240 @@
+'''
+EXT_mesh_gpu_instancing and repeated mesh leaves as instances.
+
+* FACES: one instancer mesh per (parent, mesh). each triangle places one
+  instance (position, rotation and uniform scale from the face).
+  instances that need non-uniform scale or mirroring fall back to COLLECTION
+* COLLECTION: one empty per instance that instances a shared collection
+'''
+from typing import List, Optional, Dict, Tuple
+
+import bpy
+import mathutils  # pylint: disable=E0401
+import numpy
+
+from .import_manager import ImportManager
+from .node import Node, GPU_INSTANCING
+from .instance_math import YUP_TO_ZUP, compose, is_similarity, face_corners
+
+from logging import getLogger  # pylint: disable=C0411
+logger = getLogger(__name__)
+
+# leaves sharing a parent and a mesh are instanced from this count
+MIN_REPEAT = 4
+
+
+def _to_blender(manager: ImportManager, m: numpy.ndarray)->numpy.ndarray:
+    if not manager.yup_to_zup:
+        return m
+    return YUP_TO_ZUP @ m @ YUP_TO_ZUP.T
+
+
+def _node_matrices(manager: ImportManager, nodes: List[Node])->numpy.ndarray:
+    '''
+    local matrices of nodes in blender space
+    '''
+    t = numpy.array([n.gltf_node.translation or (0, 0, 0) for n in nodes],
+                    numpy.float32).reshape(-1, 3)
+    q = numpy.array([n.gltf_node.rotation or (0, 0, 0, 1) for n in nodes],
+                    numpy.float32).reshape(-1, 4)
+    s = numpy.array([n.gltf_node.scale or (1, 1, 1) for n in nodes],
+                    numpy.float32).reshape(-1, 3)
+    m = compose(t, q, s)
+    for i, node in enumerate(nodes):
+        if node.gltf_node.matrix:
+            # column major
+            m[i] = numpy.array(node.gltf_node.matrix, numpy.float32).reshape(4, 4).T
+    return _to_blender(manager, m)
+
+
+def _gpu_instance_matrices(manager: ImportManager, node: Node)->numpy.ndarray:
+    attributes = node.gltf_node.extensions[GPU_INSTANCING].get('attributes', {})
+    arrays = {k: manager.get_float_ndarray(v) for k, v in attributes.items()
+              if k in ('TRANSLATION', 'ROTATION', 'SCALE')}
+    if not arrays:
+        return numpy.zeros((0, 4, 4), numpy.float32)
+    count = len(next(iter(arrays.values())))
+    t = arrays.get('TRANSLATION', numpy.zeros((count, 3), numpy.float32))
+    q = arrays.get('ROTATION')
+    if q is None:
+        q = numpy.tile(numpy.array((0, 0, 0, 1), numpy.float32), (count, 1))
+    s = arrays.get('SCALE', numpy.ones((count, 3), numpy.float32))
+    return _to_blender(manager, compose(t, q, s))
+
+
+class InstanceSet:
+    '''
+    instances of one mesh, local to parent
+    '''
+
+    def __init__(self, parent: Node, mesh: int, matrices: numpy.ndarray,
+                 names: Optional[List[str]] = None)->None:
+        self.parent = parent
+        self.mesh = mesh
+        self.matrices = matrices
+        self.names = names
+
+
+def _get_animated_nodes(manager: ImportManager)->set:
+    if not manager.import_animation:
+        return set()
+    return {channel.target.node
+            for animation in manager.gltf.animations
+            for channel in animation.channels
+            if channel.target and channel.target.node != -1}
+
+
+def _is_instance_leaf(node: Node, animated: set)->bool:
+    gltf_node = node.gltf_node
+    return (node.parent is not None
+            and gltf_node.mesh != -1
+            and gltf_node.skin == -1
+            and not gltf_node.children
+            and not gltf_node.weights
+            and not node.children
+            and GPU_INSTANCING not in gltf_node.extensions
+            and node.index not in animated)
+
+
+def collect_instances(manager: ImportManager,
+                      nodes: List[Optional[Node]])->List[InstanceSet]:
+    '''
+    call before create_object. repeated leaves are detached from their
+    parents and get no object of their own
+    '''
+    result = []
+
+    # EXT_mesh_gpu_instancing. the node object itself becomes an empty.
+    # instance transforms are in buffers, so bounds_only keeps one proxy
+    for node in nodes:
+        if node and GPU_INSTANCING in node.gltf_node.extensions \
+                and node.gltf_node.mesh in manager.selection.meshes \
+                and not manager.bounds_only:
+            result.append(InstanceSet(node, node.gltf_node.mesh,
+                                      _gpu_instance_matrices(manager, node)))
+
+    if not manager.instance_repeated:
+        return result
+
+    animated = _get_animated_nodes(manager)
+    groups: Dict[Tuple[int, int], List[Node]] = {}
+    for node in nodes:
+        if node and node.gltf_node.mesh in manager.selection.meshes \
+                and _is_instance_leaf(node, animated):
+            groups.setdefault((node.parent.index, node.gltf_node.mesh),
+                              []).append(node)
+
+    for (_, mesh), leaves in groups.items():
+        if len(leaves) < MIN_REPEAT:
+            continue
+        parent = leaves[0].parent
+        instanced = set(leaves)
+        parent.children = [child for child in parent.children
+                           if child not in instanced]
+        for leaf in leaves:
+            leaf.parent = None
+        result.append(InstanceSet(parent, mesh, _node_matrices(manager, leaves),
+                                  [leaf.name for leaf in leaves]))
+    return result
+
+
+class InstanceBuilder:
+    def __init__(self, collection: bpy.types.Collection,
+                 manager: ImportManager)->None:
+        self.collection = collection
+        self.manager = manager
+        self._prototypes: Dict[int, bpy.types.Collection] = {}
+        self.object_count = 0
+        self.instance_count = 0
+
+    def _get_prototype(self, mesh: int)->bpy.types.Collection:
+        '''
+        collection with one object of mesh. not linked to the scene
+        '''
+        prototype = self._prototypes.get(mesh)
+        if not prototype:
+            blender_mesh = self.manager.meshes[mesh][0]
+            prototype = bpy.data.collections.new(f'{blender_mesh.name}_instance')
+            prototype.objects.link(
+                bpy.data.objects.new(blender_mesh.name, blender_mesh))
+            self._prototypes[mesh] = prototype
+        return prototype
+
+    def add_collection_instances(self, instance_set: InstanceSet,
+                                 indices: numpy.ndarray)->None:
+        prototype = self._get_prototype(instance_set.mesh)
+        parent = instance_set.parent.blender_object
+        link = self.collection.objects.link
+        for i in indices:
+            name = instance_set.names[i] if instance_set.names \
+                else f'{prototype.name}.{i}'
+            obj = bpy.data.objects.new(name, None)
+            obj.instance_type = 'COLLECTION'
+            obj.instance_collection = prototype
+            obj.parent = parent
+            obj.matrix_basis = mathutils.Matrix(
+                instance_set.matrices[i].tolist())
+            link(obj)
+        self.object_count += len(indices)
+
+    def add_face_instances(self, instance_set: InstanceSet,
+                           indices: numpy.ndarray)->None:
+        blender_mesh = self.manager.meshes[instance_set.mesh][0]
+        matrices = instance_set.matrices[indices]
+        count = len(matrices)
+
+        co = face_corners(matrices)
+        instancer_mesh = bpy.data.meshes.new(f'{blender_mesh.name}_instancer')
+        instancer_mesh.vertices.add(count * 3)
+        instancer_mesh.vertices.foreach_set('co', co.astype(numpy.float32).ravel())
+        instancer_mesh.loops.add(count * 3)
+        instancer_mesh.loops.foreach_set(
+            'vertex_index', numpy.arange(count * 3, dtype=numpy.int32))
+        instancer_mesh.polygons.add(count)
+        instancer_mesh.polygons.foreach_set(
+            'loop_start', numpy.arange(0, count * 3, 3, dtype=numpy.int32))
+        instancer_mesh.polygons.foreach_set(
+            'loop_total', numpy.full(count, 3, numpy.int32))
+        instancer_mesh.update(calc_edges=True)
+
+        instancer = bpy.data.objects.new(instancer_mesh.name, instancer_mesh)
+        instancer.instance_type = 'FACES'
+        instancer.use_instance_faces_scale = True
+        instancer.instance_faces_scale = 1.0
+        instancer.show_instancer_for_viewport = False
+        instancer.show_instancer_for_render = False
+        instancer.parent = instance_set.parent.blender_object
+        self.collection.objects.link(instancer)
+
+        # faces instance the children
+        child = bpy.data.objects.new(blender_mesh.name, blender_mesh)
+        child.parent = instancer
+        self.collection.objects.link(child)
+        self.object_count += 2
+
+    def add(self, instance_set: InstanceSet)->None:
+        count = len(instance_set.matrices)
+        if not count:
+            return
+        if self.manager.instancing == 'FACES':
+            faces = is_similarity(instance_set.matrices)
+            if faces.any():
+                self.add_face_instances(instance_set, numpy.flatnonzero(faces))
+            self.add_collection_instances(instance_set, numpy.flatnonzero(~faces))
+        else:
+            self.add_collection_instances(instance_set, numpy.arange(count))
+        instance_set.parent.instance_count += count
+        self.instance_count += count
+
+
+def create_instances(collection: bpy.types.Collection, manager: ImportManager,
+                     instance_sets: List[InstanceSet])->None:
+    if not instance_sets:
+        return
+    builder = InstanceBuilder(collection, manager)
+    for instance_set in instance_sets:
+        builder.add(instance_set)
+    meshes = len({instance_set.mesh for instance_set in instance_sets})
+    manager.stats['instances'] = (f'{builder.instance_count} instances'
+                                  f' of {meshes} meshes'
+                                  f' as {builder.object_count} objects')
@@ -0,0 +1,113 @@
+'''
+error bounded keyframe removal for one animation channel. no bpy.
+
+keys are removed in alternating passes over every other key, so that the
+spans of the candidates do not overlap and each pass is a few array
+operations. a key is removed if the curve through its neighbours stays
+within tolerance of every original sample in the span.
+'''
+from typing import Optional
+
+import numpy
+
+from .gltftypes import AnimationSampler_interpolation as Interpolation
+from .animation_math import hermite
+
+
+def _sample(interpolation: Interpolation, times: numpy.ndarray,
+            values: numpy.ndarray, in_tangents: Optional[numpy.ndarray],
+            out_tangents: Optional[numpy.ndarray]):
+    '''
+    positions (in key index units), times and values of the original curve.
+    a cubic segment can bulge between keys, so midpoints are added
+    '''
+    positions = numpy.arange(len(times), dtype=numpy.float64)
+    if interpolation != Interpolation.CUBICSPLINE:
+        return positions, times, values
+
+    dt = numpy.diff(times)
+    mid_values = hermite(values[:-1], out_tangents[:-1],
+                         values[1:], in_tangents[1:], dt, 0.5)
+    count = len(times) * 2 - 1
+    sample_positions = numpy.arange(count, dtype=numpy.float64) / 2
+    sample_times = numpy.empty(count, times.dtype)
+    sample_times[0::2] = times
+    sample_times[1::2] = times[:-1] + dt / 2
+    sample_values = numpy.empty(count, values.dtype)
+    sample_values[0::2] = values
+    sample_values[1::2] = mid_values
+    return sample_positions, sample_times, sample_values
+
+
+def _evaluate(interpolation: Interpolation, times: numpy.ndarray,
+              values: numpy.ndarray, in_tangents: Optional[numpy.ndarray],
+              out_tangents: Optional[numpy.ndarray],
+              start: numpy.ndarray, end: numpy.ndarray,
+              t: numpy.ndarray)->numpy.ndarray:
+    '''
+    value at t of the segment from key start to key end
+    '''
+    t0 = times[start]
+    dt = times[end] - t0
+    dt = numpy.where(dt > 0, dt, 1)
+    s = (t - t0) / dt
+    v0 = values[start]
+    v1 = values[end]
+    if interpolation == Interpolation.STEP:
+        return numpy.where(s >= 1, v1, v0)
+    if interpolation == Interpolation.CUBICSPLINE:
+        return hermite(v0, out_tangents[start], v1, in_tangents[end], dt, s)
+    return v0 + (v1 - v0) * s
+
+
+def reduce_keys(interpolation: Interpolation, times: numpy.ndarray,
+                values: numpy.ndarray, tolerance: float,
+                in_tangents: Optional[numpy.ndarray] = None,
+                out_tangents: Optional[numpy.ndarray] = None)->numpy.ndarray:
+    '''
+    indices of the keys to keep. values is one component (keys,).
+    the first and last keys are always kept
+    '''
+    count = len(times)
+    if count < 3 or tolerance <= 0:
+        return numpy.arange(count)
+
+    positions, sample_times, sample_values = _sample(
+        interpolation, times, values, in_tangents, out_tangents)
+
+    kept = numpy.arange(count)
+    parity = 1
+    idle = 0
+    while idle < 2 and len(kept) > 2:
+        # candidates kept[j] with j of one parity. span is kept[j-1]..kept[j+1]
+        candidates = numpy.arange(parity, len(kept) - 1, 2)
+        # 1, 2, 1, ...
+        parity = 3 - parity
+        if not len(candidates):
+            idle += 1
+            continue
+        starts = kept[candidates - 1]
+        ends = kept[candidates + 1]
+
+        span = numpy.searchsorted(starts, positions, 'right') - 1
+        inside = (span >= 0)
+        inside[inside] = positions[inside] <= ends[span[inside]]
+        span = span[inside]
+
+        curve = _evaluate(interpolation, times, values,
+                          in_tangents, out_tangents,
+                          starts[span], ends[span], sample_times[inside])
+        error = numpy.zeros(len(candidates), numpy.float64)
+        numpy.maximum.at(error, span,
+                         numpy.abs(curve - sample_values[inside]))
+
+        remove = error <= tolerance
+        if not remove.any():
+            idle += 1
+            continue
+        idle = 0
+        mask = numpy.ones(len(kept), bool)
+        mask[candidates[remove]] = False
+        kept = kept[mask]
+
+    return kept
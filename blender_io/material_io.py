@@ -1,5 +1,6 @@
 import json
-from typing import List
+import hashlib
+from typing import List, Optional, Dict, Any, Tuple
 
 import bpy
 from progress_report import ProgressReport
@@ -7,54 +8,119 @@ from progress_report import ProgressReport
 from . import gltftypes
 from .import_manager import ImportManager
 from . import blender_groupnode_io, gltf_pbr_node
+from . import metadata
 
 from logging import getLogger  # pylint: disable=C0411
 logger = getLogger(__name__)
 
 
+def _canonical(gltf: gltftypes.glTF, js: Any)->Any:
+    '''
+    replace texture index with (image, sampler) to compare materials
+    '''
+    if isinstance(js, list):
+        return [_canonical(gltf, x) for x in js]
+    if not isinstance(js, dict):
+        return js
+    result = {}
+    for k, v in js.items():
+        if k.endswith('Texture') and isinstance(v, dict) and 'index' in v:
+            texture = gltf.textures[v['index']]
+            sampler = gltf.samplers[texture.sampler].js if texture.sampler != -1 else None
+            v = dict(v)
+            v['index'] = {
+                'source': texture.source,
+                'sampler': _canonical(gltf, sampler),
+                'extensions': _canonical(gltf, texture.extensions),
+            }
+        result[k] = _canonical(gltf, v)
+    return result
+
+
+def get_material_hash(gltf: gltftypes.glTF, material: gltftypes.Material)->str:
+    '''
+    hash of material definition except name
+    '''
+    js = {k: v for k, v in (material.js or {}).items() if k != 'name'}
+    canonical = json.dumps(_canonical(gltf, js), sort_keys=True)
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()
+
+
+def _set_sampler(gltf: gltftypes.glTF, image_node, sampler_index: int)->None:
+    if sampler_index == -1:
+        return
+    sampler = gltf.samplers[sampler_index]
+    if sampler.magFilter == gltftypes.Sampler_magFilter.NEAREST:
+        image_node.interpolation = 'Closest'
+    if (sampler.wrapS == gltftypes.Sampler_wrapS.CLAMP_TO_EDGE
+            and sampler.wrapT == gltftypes.Sampler_wrapT.CLAMP_TO_EDGE):
+        image_node.extension = 'EXTEND'
+
+
 def _create_material(progress: ProgressReport, manager: ImportManager,
-                     material: gltftypes.Material)->bpy.types.Material:
+                     groups: Dict[str, bpy.types.NodeTree],
+                     index: int, material: gltftypes.Material)->bpy.types.Material:
     blender_material = bpy.data.materials.new(material.name)
-    blender_material['js'] = json.dumps(material.js, indent=2)
+    manager.metadata.store(blender_material, 'materials', index,
+                           material.js, metadata.MATERIAL_MAPPED_KEYS)
 
     blender_material.use_nodes = True
     tree = blender_material.node_tree
 
     tree.nodes.remove(tree.nodes['Principled BSDF'])
 
-    getLogger('').disabled = True
-    groups = blender_groupnode_io.import_groups(gltf_pbr_node.groups)
-    getLogger('').disabled = False
-
     bsdf = tree.nodes.new('ShaderNodeGroup')
     bsdf.node_tree = groups['glTF Metallic Roughness']
 
     tree.links.new(
         bsdf.outputs['Shader'], tree.nodes['Material Output'].inputs['Surface'])
 
-    def create_image_node(texture_index: int):
+    # one uv node per uv set
+    uv_nodes: Dict[int, Any] = {}
+
+    def get_uv_socket(tex_coord: int):
+        uv_node = uv_nodes.get(tex_coord)
+        if not uv_node:
+            uv_node = tree.nodes.new('ShaderNodeTexCoord')
+            uv_nodes[tex_coord] = uv_node
+        return uv_node.outputs['UV']
+
+    # one image node per (texture, uv set)
+    image_nodes: Dict[Tuple[int, int], Any] = {}
+
+    def create_image_node(texture_index: int, tex_coord: int):
+        if tex_coord != 0:
+            # mesh_io imports TEXCOORD_0 only. sample it, as before uv sets
+            logger.debug('TEXCOORD_%d is not imported', tex_coord)
+            tex_coord = 0
         # uv => tex
-        image_node = tree.nodes.new(
-            type='ShaderNodeTexImage')
-        image_node.image = manager.textures[texture_index]
-        tree.links.new(
-            tree.nodes.new('ShaderNodeTexCoord').outputs['UV'], image_node.inputs['Vector'])
+        key = (texture_index, tex_coord)
+        image_node = image_nodes.get(key)
+        if not image_node:
+            image_node = tree.nodes.new(
+                type='ShaderNodeTexImage')
+            image_node.image = manager.textures[texture_index]
+            _set_sampler(manager.gltf, image_node,
+                         manager.gltf.textures[texture_index].sampler)
+            tree.links.new(
+                get_uv_socket(tex_coord), image_node.inputs['Vector'])
+            image_nodes[key] = image_node
         return image_node
 
-    def bsdf_link_image(texture_index: int, input_name: str):
-        texture = create_image_node(texture_index)
+    def bsdf_link_image(texture_info, input_name: str):
+        texture = create_image_node(texture_info.index, texture_info.texCoord)
         tree.links.new(
             texture.outputs["Color"],
             bsdf.inputs[input_name])
 
     if material.normalTexture:
-        bsdf_link_image(material.normalTexture.index, 'Normal')
+        bsdf_link_image(material.normalTexture, 'Normal')
 
     if material.occlusionTexture:
-        bsdf_link_image(material.occlusionTexture.index, 'Occlusion')
+        bsdf_link_image(material.occlusionTexture, 'Occlusion')
 
     if material.emissiveTexture:
-        bsdf_link_image(material.emissiveTexture.index, 'Emissive')
+        bsdf_link_image(material.emissiveTexture, 'Emissive')
 
     pbr = material.pbrMetallicRoughness
     if pbr:
@@ -65,24 +131,53 @@ def _create_material(progress: ProgressReport, manager: ImportManager,
             mix.inputs[2].default_value = pbr.baseColorFactor
 
         elif pbr.baseColorTexture:
-            bsdf_link_image(pbr.baseColorTexture.index, 'BaseColor')
+            bsdf_link_image(pbr.baseColorTexture, 'BaseColor')
         else:
             # factor
             pass
 
         if pbr.metallicRoughnessTexture:
             bsdf_link_image(
-                pbr.metallicRoughnessTexture.index, 'MetallicRoughness')
+                pbr.metallicRoughnessTexture, 'MetallicRoughness')
+
+    manager.stats.setdefault('material_nodes', {})[
+        blender_material.name] = len(tree.nodes)
 
     progress.step()
     return blender_material
 
 
 def load_materials(progress: ProgressReport,
-                   manager: ImportManager)->List[bpy.types.Material]:
+                   manager: ImportManager)->List[Optional[bpy.types.Material]]:
+
+    selected = manager.selection.materials
+    progress.enter_substeps(len(selected), "Loading materials...")
+
+    # shared by all materials
+    groups: Dict[str, bpy.types.NodeTree] = {}
+    if selected:
+        groups = blender_groupnode_io.find_or_import_groups(
+            gltf_pbr_node.get_groups(), gltf_pbr_node.get_hash())
+
+    # create only the first material of each content hash
+    unique: Dict[str, int] = {}
+    materials: List[Optional[bpy.types.Material]] = []
+    for i, material in enumerate(manager.gltf.materials):
+        if i not in selected:
+            manager.material_map.append(-1)
+            materials.append(None)
+            continue
+        key = get_material_hash(manager.gltf, material)
+        if key in unique:
+            manager.material_map.append(unique[key])
+            materials.append(None)
+            progress.step()
+            continue
+        unique[key] = i
+        manager.material_map.append(i)
+        materials.append(
+            _create_material(progress, manager, groups, i, material))
+    logger.info('materials: %d unique of %d', len(unique), len(selected))
 
-    progress.enter_substeps(len(manager.gltf.textures), "Loading materials...")
-    materials = [_create_material(progress, manager, material)
-                 for material in manager.gltf.materials]
     progress.leave_substeps()
     return materials
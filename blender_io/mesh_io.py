@@ -1,23 +1,84 @@
-from typing import Tuple, List
+from typing import Tuple, List, Optional, Iterator
 
 from . import gltftypes
 from . import gltf_buffer
 from .import_manager import ImportManager
+from .animation_math import AxisConversion
 
 import bpy
+import numpy
 from progress_report import ProgressReport
 
 
+def _get_target_names(mesh: gltftypes.Mesh, count: int)->List[str]:
+    # not in the spec. exporters put it in mesh or primitive extras
+    names = mesh.extras.get('targetNames')
+    if not names and mesh.primitives:
+        names = mesh.primitives[0].extras.get('targetNames')
+    if not names or len(names) != count:
+        names = []
+    return [names[i] if i < len(names) else f'target_{i}'
+            for i in range(count)]
+
+
+def _iter_position_deltas(manager: ImportManager, mesh: gltftypes.Mesh,
+                          count: int)->Iterator[numpy.ndarray]:
+    '''
+    (vertices, 3) delta of each target in VertexBuffer order.
+    primitives are concatenated, missing targets are zero
+    '''
+    axis = AxisConversion(manager.yup_to_zup)
+    vertex_counts = [manager.gltf.accessors[prim.attributes['POSITION']].count
+                     for prim in mesh.primitives]
+    offsets = numpy.cumsum([0] + vertex_counts)
+    for i in range(count):
+        delta = numpy.zeros((offsets[-1], 3), numpy.float32)
+        for prim, start, end in zip(mesh.primitives, offsets[:-1], offsets[1:]):
+            if i >= len(prim.targets) or 'POSITION' not in prim.targets[i]:
+                continue
+            # sparse is resolved by get_ndarray
+            delta[start:end] = manager.get_float_ndarray(
+                prim.targets[i]['POSITION'])
+        yield axis.translation(delta)
+
+
+def _create_shape_keys(manager: ImportManager, mesh: gltftypes.Mesh,
+                       blender_mesh: bpy.types.Mesh,
+                       attributes: gltf_buffer.VertexBuffer)->int:
+    count = max((len(prim.targets) for prim in mesh.primitives), default=0)
+    if not count:
+        return 0
+
+    # shape keys are added through an object. the key stays on the mesh
+    tmp = bpy.data.objects.new(blender_mesh.name, blender_mesh)
+    try:
+        tmp.shape_key_add(name='Basis', from_mix=False)
+        basis = numpy.frombuffer(attributes.pos, numpy.float32).reshape(-1, 3)
+        names = _get_target_names(mesh, count)
+        for i, delta in enumerate(_iter_position_deltas(manager, mesh, count)):
+            key_block = tmp.shape_key_add(name=names[i], from_mix=False)
+            key_block.data.foreach_set('co', (basis + delta).ravel())
+            if i < len(mesh.weights):
+                weight = mesh.weights[i]
+                key_block.slider_min = min(0.0, weight)
+                key_block.slider_max = max(1.0, weight)
+                key_block.value = weight
+    finally:
+        bpy.data.objects.remove(tmp)
+    return count
+
+
 def _create_mesh(progress: ProgressReport, manager: ImportManager,
                  mesh: gltftypes.Mesh)->Tuple[bpy.types.Mesh, gltf_buffer.VertexBuffer]:
     blender_mesh = bpy.data.meshes.new(mesh.name)
-    materials = [manager.materials[prim.material] for prim in mesh.primitives]
+    materials = [manager.get_material(prim.material)
+                 for prim in mesh.primitives]
     for m in materials:
         blender_mesh.materials.append(m)
 
     attributes = gltf_buffer.VertexBuffer(manager, mesh)
 
-    blender_mesh.vertices.add(len(attributes.pos)/3)
+    blender_mesh.vertices.add(len(attributes.pos) // 3)
     blender_mesh.vertices.foreach_set(
         "co", attributes.pos)
     blender_mesh.vertices.foreach_set(
@@ -33,31 +94,88 @@ def _create_mesh(progress: ProgressReport, manager: ImportManager,
     total = [3 for _ in range(triangle_count)]
     blender_mesh.polygons.foreach_set("loop_total", total)
 
+    blender_mesh.polygons.foreach_set("use_smooth", [True] * triangle_count)
+    blender_mesh.polygons.foreach_set(
+        "material_index", attributes.get_face_submeshes())
+
     blen_uvs = blender_mesh.uv_layers.new()
-    for blen_poly in blender_mesh.polygons:
-        blen_poly.use_smooth = True
-        blen_poly.material_index = attributes.get_submesh_from_face(
-            blen_poly.index)
-        for lidx in blen_poly.loop_indices:
-            index = attributes.indices[lidx]
-            # vertex uv to face uv
-            uv = attributes.uv[index]
-            blen_uvs.data[lidx].uv = (
-                uv.x, uv.y)  # vertical flip uv
+    # vertex uv to face uv
+    blen_uvs.data.foreach_set(
+        "uv", attributes.uv[attributes.indices].ravel())
 
     # *Very* important to not remove lnors here!
     blender_mesh.validate(clean_customdata=False)
     blender_mesh.update()
 
+    shape_key_count = _create_shape_keys(
+        manager, mesh, blender_mesh, attributes)
+    if shape_key_count:
+        manager.stats.setdefault('shape_keys', {})[
+            blender_mesh.name] = shape_key_count
+
     progress.step()
     return blender_mesh, attributes
 
 
+# quads of a box. corners are indexed by bits (x, y, z)
+BOX_FACES = (
+    (0, 2, 3, 1), (4, 5, 7, 6),
+    (0, 1, 5, 4), (2, 6, 7, 3),
+    (0, 4, 6, 2), (1, 3, 7, 5),
+)
+
+
+def _create_proxy_mesh(progress: ProgressReport, manager: ImportManager,
+                       index: int, mesh: gltftypes.Mesh)->Tuple[bpy.types.Mesh, None]:
+    '''
+    box from POSITION min/max. no buffer is read
+    '''
+    lo = [float('inf')] * 3
+    hi = [float('-inf')] * 3
+    for prim in mesh.primitives:
+        accessor = manager.gltf.accessors[prim.attributes['POSITION']]
+        if len(accessor.min) == 3 and len(accessor.max) == 3:
+            lo = [min(a, b) for a, b in zip(lo, accessor.min)]
+            hi = [max(a, b) for a, b in zip(hi, accessor.max)]
+    if lo[0] > hi[0]:
+        # min/max are required, but not always there
+        lo = hi = [0.0, 0.0, 0.0]
+
+    corners = [manager.mod_v((hi[0] if i & 1 else lo[0],
+                              hi[1] if i & 2 else lo[1],
+                              hi[2] if i & 4 else lo[2]))
+               for i in range(8)]
+    blender_mesh = bpy.data.meshes.new(mesh.name)
+    blender_mesh.from_pydata(corners, [], BOX_FACES)
+    blender_mesh.validate()
+    # for load_geometry
+    blender_mesh['gltf_proxy'] = index
+    blender_mesh['gltf_source_file'] = str(manager.path)
+    blender_mesh['gltf_yup_to_zup'] = manager.yup_to_zup
+
+    progress.step()
+    return blender_mesh, None
+
+
+def load_proxy_meshes(progress: ProgressReport,
+                      manager: ImportManager)->List[Optional[Tuple[bpy.types.Mesh, None]]]:
+    selected = manager.selection.meshes
+    progress.enter_substeps(len(selected), "Loading mesh bounds...")
+    meshes = [_create_proxy_mesh(progress, manager, i, mesh)
+              if i in selected else None
+              for i, mesh in enumerate(manager.gltf.meshes)]
+    progress.leave_substeps()
+    return meshes
+
+
 def load_meshes(progress: ProgressReport,
-                manager: ImportManager)->List[Tuple[bpy.types.Mesh, gltf_buffer.VertexBuffer]]:
+                manager: ImportManager
+                )->List[Optional[Tuple[bpy.types.Mesh, gltf_buffer.VertexBuffer]]]:
 
-    progress.enter_substeps(len(manager.gltf.meshes), "Loading meshes...")
+    selected = manager.selection.meshes
+    progress.enter_substeps(len(selected), "Loading meshes...")
     meshes = [_create_mesh(progress, manager, mesh)
-              for mesh in manager.gltf.meshes]
+              if i in selected else None
+              for i, mesh in enumerate(manager.gltf.meshes)]
     progress.leave_substeps()
     return meshes
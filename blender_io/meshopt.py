@@ -0,0 +1,442 @@
+'''
+EXT_meshopt_compression decoder. no bpy.
+
+port of the meshoptimizer reference decoder (vertex codec v0, index codec
+v0/v1). the byte group and triangle parsers are sequential by format;
+delta decoding and filters are numpy.
+'''
+import time
+from typing import List, Tuple
+
+import numpy
+
+from logging import getLogger  # pylint: disable=C0411
+logger = getLogger(__name__)
+
+EXTENSION_NAME = 'EXT_meshopt_compression'
+
+VERTEX_HEADER = 0xa0
+INDEX_HEADER = 0xe0
+SEQUENCE_HEADER = 0xd0
+INDEX_VERSION_MAX = 1
+
+VERTEX_BLOCK_SIZE_BYTES = 8192
+VERTEX_BLOCK_MAX_SIZE = 256
+BYTE_GROUP_SIZE = 16
+TAIL_MIN_SIZE = 32
+
+
+class MeshoptError(Exception):
+    pass
+
+
+def _unpack_table(bits: int)->List[Tuple[bytes, int]]:
+    '''
+    byte value to (unpacked values, escape count). high bits come first
+    '''
+    mask = (1 << bits) - 1
+    table = []
+    for b in range(256):
+        values = bytes((b >> (8 - bits * (i + 1))) & mask
+                       for i in range(8 // bits))
+        table.append((values, values.count(mask)))
+    return table
+
+
+_UNPACK = {1: _unpack_table(2), 2: _unpack_table(4)}
+_ZERO_GROUP = bytes(BYTE_GROUP_SIZE)
+
+
+def _decode_bytes(data: bytes, pos: int, size: int, out: bytearray)->int:
+    '''
+    one byte channel of a vertex block. size is a multiple of 16
+    '''
+    groups = size // BYTE_GROUP_SIZE
+    header_pos = pos
+    pos += (groups + 3) // 4
+    for group in range(groups):
+        bitslog2 = (data[header_pos + group // 4] >> ((group % 4) * 2)) & 3
+        if bitslog2 == 0:
+            out += _ZERO_GROUP
+        elif bitslog2 == 3:
+            out += data[pos:pos + BYTE_GROUP_SIZE]
+            pos += BYTE_GROUP_SIZE
+        else:
+            table = _UNPACK[bitslog2]
+            selector_size = 2 << bitslog2
+            selectors = [table[b] for b in data[pos:pos + selector_size]]
+            pos += selector_size
+            if not any(escapes for _, escapes in selectors):
+                out += b''.join(values for values, _ in selectors)
+                continue
+            mask = (1 << (1 << bitslog2)) - 1
+            values = bytearray(b''.join(values for values, _ in selectors))
+            for i, value in enumerate(values):
+                if value == mask:
+                    values[i] = data[pos]
+                    pos += 1
+            out += values
+    return pos
+
+
+def _vertex_block_size(vertex_size: int)->int:
+    result = VERTEX_BLOCK_SIZE_BYTES // vertex_size
+    result &= ~(BYTE_GROUP_SIZE - 1)
+    return min(result, VERTEX_BLOCK_MAX_SIZE)
+
+
+def decode_vertex_buffer(data: bytes, count: int, vertex_size: int)->numpy.ndarray:
+    '''
+    (count, vertex_size) uint8
+    '''
+    if vertex_size % 4 != 0 or not 0 < vertex_size <= 256:
+        raise MeshoptError(f'invalid byteStride {vertex_size}')
+    if len(data) < 1 + vertex_size:
+        raise MeshoptError('truncated vertex data')
+    if data[0] & 0xf0 != VERTEX_HEADER or data[0] & 0x0f != 0:
+        raise MeshoptError(f'unsupported vertex codec header {data[0]:#x}')
+
+    last_vertex = numpy.frombuffer(data, numpy.uint8, vertex_size,
+                                   len(data) - vertex_size)
+    block_size = _vertex_block_size(vertex_size)
+    # zigzag deltas per byte channel, concatenated over blocks
+    channels = [bytearray() for _ in range(vertex_size)]
+    pos = 1
+    try:
+        for offset in range(0, count, block_size):
+            vertices = min(block_size, count - offset)
+            aligned = (vertices + BYTE_GROUP_SIZE - 1) & ~(BYTE_GROUP_SIZE - 1)
+            for channel in channels:
+                start = len(channel)
+                pos = _decode_bytes(data, pos, aligned, channel)
+                del channel[start + vertices:]
+    except IndexError:
+        raise MeshoptError('truncated vertex data')
+    if len(data) - pos != max(vertex_size, TAIL_MIN_SIZE):
+        raise MeshoptError('vertex data size mismatch')
+
+    deltas = numpy.frombuffer(b''.join(channels), numpy.uint8).reshape(
+        vertex_size, count)
+    # unzigzag8 then running sum. uint8 wraps like the reference
+    deltas = (deltas >> 1) ^ (0 - (deltas & 1)).astype(numpy.uint8)
+    result = numpy.cumsum(deltas, axis=1, dtype=numpy.uint8)
+    result += last_vertex[:, numpy.newaxis]
+    return result.T.copy()
+
+
+def _decode_vbyte(data: bytes, pos: int)->Tuple[int, int]:
+    lead = data[pos]
+    pos += 1
+    if lead < 128:
+        return lead, pos
+    result = lead & 127
+    shift = 7
+    for _ in range(4):
+        group = data[pos]
+        pos += 1
+        result |= (group & 127) << shift
+        shift += 7
+        if group < 128:
+            break
+    return result, pos
+
+
+def decode_index_buffer(data: bytes, count: int)->numpy.ndarray:
+    '''
+    TRIANGLES mode. (count,) uint32
+    '''
+    if count % 3 != 0:
+        raise MeshoptError('index count is not a multiple of 3')
+    if len(data) < 1 + count // 3 + 16:
+        raise MeshoptError('truncated index data')
+    if data[0] & 0xf0 != INDEX_HEADER or data[0] & 0x0f > INDEX_VERSION_MAX:
+        raise MeshoptError(f'unsupported index codec header {data[0]:#x}')
+    fecmax = 13 if data[0] & 0x0f >= 1 else 15
+
+    edge_a = [0xffffffff] * 16
+    edge_b = [0xffffffff] * 16
+    vertices = [0xffffffff] * 16
+    edge_offset = 0
+    vertex_offset = 0
+    next_index = 0
+    last = 0
+    result = [0] * count
+
+    code = 1
+    pos = 1 + count // 3
+    safe_end = len(data) - 16
+    codeaux_table = data[safe_end:]
+
+    def free_index(pos: int, last: int)->Tuple[int, int]:
+        if pos >= safe_end:
+            raise MeshoptError('truncated index data')
+        # at most 5 bytes. the 16 byte table keeps the read inside data
+        v, pos = _decode_vbyte(data, pos)
+        if pos > safe_end:
+            raise MeshoptError('truncated index data')
+        delta = (v >> 1) ^ -(v & 1)
+        return (last + delta) & 0xffffffff, pos
+
+    for i in range(0, count, 3):
+        codetri = data[code]
+        code += 1
+
+        if codetri < 0xf0:
+            fe = (edge_offset - 1 - (codetri >> 4)) & 15
+            a = edge_a[fe]
+            b = edge_b[fe]
+            fec = codetri & 15
+            if fec < fecmax:
+                if fec == 0:
+                    c = next_index
+                    next_index += 1
+                    vertices[vertex_offset] = c
+                    vertex_offset = (vertex_offset + 1) & 15
+                else:
+                    c = vertices[(vertex_offset - 1 - fec) & 15]
+                    # pushed without advancing
+                    vertices[vertex_offset] = c
+            else:
+                if fec != 15:
+                    # 13, 14 are -1, +1 from the last free index
+                    c = last = (last + fec - (fec ^ 3)) & 0xffffffff
+                else:
+                    c, pos = free_index(pos, last)
+                    last = c
+                vertices[vertex_offset] = c
+                vertex_offset = (vertex_offset + 1) & 15
+            edge_a[edge_offset] = c
+            edge_b[edge_offset] = b
+            edge_offset = (edge_offset + 1) & 15
+            edge_a[edge_offset] = a
+            edge_b[edge_offset] = c
+            edge_offset = (edge_offset + 1) & 15
+
+        else:
+            if codetri < 0xfe:
+                codeaux = codeaux_table[codetri & 15]
+                feb = codeaux >> 4
+                fec = codeaux & 15
+                a = next_index
+                next_index += 1
+                if feb == 0:
+                    b = next_index
+                    next_index += 1
+                else:
+                    b = vertices[(vertex_offset - feb) & 15]
+                if fec == 0:
+                    c = next_index
+                    next_index += 1
+                else:
+                    c = vertices[(vertex_offset - fec) & 15]
+                push_b = feb == 0
+                push_c = fec == 0
+            else:
+                if pos >= safe_end:
+                    raise MeshoptError('truncated index data')
+                codeaux = data[pos]
+                pos += 1
+                feb = codeaux >> 4
+                fec = codeaux & 15
+                if codeaux == 0:
+                    next_index = 0
+                if codetri == 0xfe:
+                    a = next_index
+                    next_index += 1
+                else:
+                    a = 0
+                if feb == 0:
+                    b = next_index
+                    next_index += 1
+                else:
+                    b = vertices[(vertex_offset - feb) & 15]
+                if fec == 0:
+                    c = next_index
+                    next_index += 1
+                else:
+                    c = vertices[(vertex_offset - fec) & 15]
+                if codetri != 0xfe:
+                    a, pos = free_index(pos, last)
+                    last = a
+                if feb == 15:
+                    b, pos = free_index(pos, last)
+                    last = b
+                if fec == 15:
+                    c, pos = free_index(pos, last)
+                    last = c
+                push_b = feb in (0, 15)
+                push_c = fec in (0, 15)
+
+            vertices[vertex_offset] = a
+            vertex_offset = (vertex_offset + 1) & 15
+            vertices[vertex_offset] = b
+            vertex_offset = (vertex_offset + push_b) & 15
+            vertices[vertex_offset] = c
+            vertex_offset = (vertex_offset + push_c) & 15
+
+            edge_a[edge_offset] = b
+            edge_b[edge_offset] = a
+            edge_offset = (edge_offset + 1) & 15
+            edge_a[edge_offset] = c
+            edge_b[edge_offset] = b
+            edge_offset = (edge_offset + 1) & 15
+            edge_a[edge_offset] = a
+            edge_b[edge_offset] = c
+            edge_offset = (edge_offset + 1) & 15
+
+        result[i] = a
+        result[i + 1] = b
+        result[i + 2] = c
+
+    if pos != safe_end:
+        raise MeshoptError('index data size mismatch')
+    return numpy.array(result, numpy.uint32)
+
+
+def decode_index_sequence(data: bytes, count: int)->numpy.ndarray:
+    '''
+    INDICES mode. (count,) uint32
+    '''
+    if len(data) < 1 + count + 4:
+        raise MeshoptError('truncated index data')
+    if data[0] & 0xf0 != SEQUENCE_HEADER or data[0] & 0x0f > INDEX_VERSION_MAX:
+        raise MeshoptError(f'unsupported index sequence header {data[0]:#x}')
+
+    # vbytes end at bytes < 128. the first count of them are the indices
+    body = numpy.frombuffer(data, numpy.uint8, len(data) - 5, 1)
+    ends = numpy.flatnonzero(body < 128)
+    if len(ends) < count:
+        raise MeshoptError('truncated index data')
+    ends = ends[:count]
+    if count and ends[-1] + 1 != len(body):
+        raise MeshoptError('index data size mismatch')
+    starts = numpy.concatenate(([0], ends[:-1] + 1))
+    if numpy.any(ends - starts > 4):
+        raise MeshoptError('invalid vbyte')
+
+    values = numpy.zeros(count, numpy.uint64)
+    for k in range(5):
+        position = starts + k
+        has = position <= ends
+        values[has] |= (body[position[has]].astype(numpy.uint64) & 127) << (7 * k)
+    values &= 0xffffffff
+
+    # bit 0 selects one of the two baselines, the rest is a zigzag delta
+    baseline = (values & 1).astype(bool)
+    values >>= 1
+    deltas = (values >> 1).astype(numpy.int64) ^ -(values & 1).astype(numpy.int64)
+    result = numpy.empty(count, numpy.int64)
+    for which in (False, True):
+        mask = baseline == which
+        result[mask] = numpy.cumsum(deltas[mask])
+    return (result & 0xffffffff).astype(numpy.uint32)
+
+
+def _filter_octahedral(data: numpy.ndarray, stride: int)->numpy.ndarray:
+    dtype = numpy.int8 if stride == 4 else numpy.int16
+    values = data.view(dtype).reshape(-1, 4)
+    max_value = numpy.float32((1 << (values.itemsize * 8 - 1)) - 1)
+    x = values[:, 0].astype(numpy.float32)
+    y = values[:, 1].astype(numpy.float32)
+    z = values[:, 2].astype(numpy.float32) - numpy.abs(x) - numpy.abs(y)
+    t = numpy.minimum(z, 0)
+    x += numpy.where(x >= 0, t, -t)
+    y += numpy.where(y >= 0, t, -t)
+    scale = max_value / numpy.sqrt(x * x + y * y + z * z)
+    result = values.copy()
+    for i, v in enumerate((x, y, z)):
+        v = v * scale
+        result[:, i] = (v + numpy.where(v >= 0, 0.5, -0.5).astype(
+            numpy.float32)).astype(numpy.int32)
+    return result.view(numpy.uint8)
+
+
+def _filter_quaternion(data: numpy.ndarray)->numpy.ndarray:
+    values = data.view(numpy.int16).reshape(-1, 4)
+    scale = numpy.float32(1 / numpy.sqrt(2))
+    sf = (values[:, 3].astype(numpy.int32) | 3).astype(numpy.float32)
+    ss = scale / sf
+    xyz = values[:, :3].astype(numpy.float32) * ss[:, numpy.newaxis]
+    ww = 1 - numpy.sum(xyz * xyz, axis=1, dtype=numpy.float32)
+    w = numpy.sqrt(numpy.maximum(ww, 0))
+    q = numpy.concatenate((xyz, w[:, numpy.newaxis]), axis=1) * numpy.float32(32767)
+    q = (q + numpy.where(q >= 0, 0.5, -0.5).astype(numpy.float32)
+         ).astype(numpy.int32).astype(numpy.int16)
+    # the dropped component is stored in the low 2 bits
+    qc = values[:, 3].astype(numpy.int32) & 3
+    rows = numpy.arange(len(values))
+    result = numpy.empty_like(values)
+    for i in range(3):
+        result[rows, (qc + 1 + i) & 3] = q[:, i]
+    result[rows, qc] = q[:, 3]
+    return result.view(numpy.uint8)
+
+
+def _filter_exponential(data: numpy.ndarray)->numpy.ndarray:
+    values = data.view(numpy.int32).ravel()
+    mantissa = (values << 8) >> 8
+    exponent = values >> 24
+    result = numpy.ldexp(mantissa.astype(numpy.float32),
+                         exponent).astype(numpy.float32)
+    return result.view(numpy.uint8)
+
+
+def decode(mode: str, filter_name: str, count: int, stride: int,
+           data: bytes)->bytes:
+    '''
+    decoded bufferView bytes (count * stride)
+    '''
+    if mode == 'ATTRIBUTES':
+        result = decode_vertex_buffer(data, count, stride)
+    elif mode == 'TRIANGLES':
+        result = decode_index_buffer(data, count)
+    elif mode == 'INDICES':
+        result = decode_index_sequence(data, count)
+    else:
+        raise MeshoptError(f'unknown mode {mode}')
+
+    if mode != 'ATTRIBUTES':
+        if stride not in (2, 4):
+            raise MeshoptError(f'invalid index byteStride {stride}')
+        return result.astype(numpy.uint16 if stride == 2 else numpy.uint32
+                             ).tobytes()
+
+    if not filter_name or filter_name == 'NONE':
+        pass
+    elif filter_name == 'OCTAHEDRAL':
+        if stride not in (4, 8):
+            raise MeshoptError(f'invalid OCTAHEDRAL byteStride {stride}')
+        result = _filter_octahedral(result, stride)
+    elif filter_name == 'QUATERNION':
+        if stride != 8:
+            raise MeshoptError(f'invalid QUATERNION byteStride {stride}')
+        result = _filter_quaternion(result)
+    elif filter_name == 'EXPONENTIAL':
+        result = _filter_exponential(result)
+    else:
+        raise MeshoptError(f'unknown filter {filter_name}')
+    return result.tobytes()
+
+
+def benchmark(mode: str, filter_name: str, count: int, stride: int,
+              data: bytes, repeat: int = 10)->Tuple[float, float]:
+    '''
+    decoded MB/s of decode and of copying the same amount of
+    uncompressed bytes, which is what a plain bufferView costs
+    '''
+    size = count * stride
+    raw = bytes(size)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        decode(mode, filter_name, count, stride, data)
+    decoded = size * repeat / (time.perf_counter() - start) / 1e6
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        numpy.frombuffer(raw, numpy.uint8).copy()
+    copied = size * repeat / max(time.perf_counter() - start, 1e-9) / 1e6
+
+    logger.info('%s %s %d x %d: %.1f MB/s, uncompressed %.1f MB/s',
+                mode, filter_name, count, stride, decoded, copied)
+    return decoded, copied
@@ -0,0 +1,72 @@
+import json
+from typing import Dict, Any, Set
+
+import bpy
+
+from logging import getLogger  # pylint: disable=C0411
+logger = getLogger(__name__)
+
+# keys that are already converted to blender data
+NODE_MAPPED_KEYS: Set[str] = {
+    'name', 'children', 'mesh', 'skin',
+    'matrix', 'rotation', 'scale', 'translation',
+}
+
+MATERIAL_MAPPED_KEYS: Set[str] = {
+    'name', 'pbrMetallicRoughness',
+    'normalTexture', 'occlusionTexture', 'emissiveTexture',
+}
+
+
+def compact(js: dict, mapped: Set[str])->Dict[str, Any]:
+    if not js:
+        return {}
+    return {k: v for k, v in js.items() if k not in mapped}
+
+
+class MetadataWriter:
+    '''
+    store gltf json of nodes and materials as selected by mode.
+
+    * NONE: nothing
+    * COMPACT: id_data['js'] without indent and mapped keys
+    * TEXT: id_data['gltf_index'] refers to one shared Text datablock
+    '''
+
+    def __init__(self, mode: str, name: str)->None:
+        self.mode = mode
+        self.name = name
+        self.text: bpy.types.Text = None
+        self._entries: Dict[str, Dict[int, Any]] = {}
+
+    def store(self, id_data: bpy.types.ID, kind: str, index: int,
+              js: dict, mapped: Set[str])->None:
+        if self.mode == 'NONE':
+            return
+
+        if self.mode == 'COMPACT':
+            unmapped = compact(js, mapped)
+            if unmapped:
+                id_data['js'] = json.dumps(unmapped, separators=(',', ':'))
+
+        elif self.mode == 'TEXT':
+            if js:
+                if not self.text:
+                    # blender makes the name unique here, e.g. foo.glb.json.001
+                    self.text = bpy.data.texts.new(self.name)
+                    self.name = self.text.name
+                self._entries.setdefault(kind, {})[index] = js
+                id_data['gltf_index'] = index
+                id_data['gltf_text'] = self.name
+
+        else:
+            raise NotImplementedError(self.mode)
+
+    def finish(self)->None:
+        '''
+        write the shared Text datablock once
+        '''
+        if self.mode != 'TEXT' or not self._entries:
+            return
+        self.text.write(json.dumps(self._entries, separators=(',', ':')))
+        logger.debug('metadata: %s', self.name)
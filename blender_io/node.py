@@ -1,5 +1,4 @@
-import json
-from typing import Optional, List, Iterable
+from typing import Optional, List, Iterable, Tuple, Any
 from contextlib import contextmanager
 
 import bpy
@@ -8,10 +7,21 @@ from progress_report import ProgressReport
 
 from . import gltftypes
 from . import import_manager
+from . import metadata
 
 from logging import getLogger  # pylint: disable=C0411
 logger = getLogger(__name__)
 
+GPU_INSTANCING = 'EXT_mesh_gpu_instancing'
+
+
+def escape_identifier(name: str)->str:
+    '''
+    name in a quoted rna path, like '["{name}"]'.
+    bpy.utils.escape_identifier needs 2.92
+    '''
+    return name.replace('\\', '\\\\').replace('"', '\\"')
+
 
 @contextmanager
 def tmp_mode(obj, tmp: str):
@@ -23,6 +33,31 @@ def tmp_mode(obj, tmp: str):
         obj.rotation_mode = mode
 
 
+@contextmanager
+def edit_mode(context, obj: bpy.types.Object):
+    '''
+    enter edit mode of obj once without depending on the UI context.
+    '''
+    view_layer = context.view_layer
+    active = view_layer.objects.active
+    view_layer.objects.active = obj
+    override = {
+        'scene': context.scene,
+        'view_layer': view_layer,
+        'active_object': obj,
+        'object': obj,
+        'edit_object': obj,
+        'selected_objects': [obj],
+        'selected_editable_objects': [obj],
+    }
+    bpy.ops.object.mode_set(override, mode='EDIT', toggle=False)
+    try:
+        yield obj.data.edit_bones
+    finally:
+        bpy.ops.object.mode_set(override, mode='OBJECT', toggle=False)
+        view_layer.objects.active = active
+
+
 class Node:
     def __init__(self, index: int, gltf_node: gltftypes.Node)->None:
         self.index = index
@@ -33,6 +68,9 @@ class Node:
         self.blender_armature: bpy.types.Object = None
         self.blender_bone: bpy.types.Bone = None
         self.bone_name: str = ''
+        # instances parented to blender_object (instancing.py)
+        self.instance_count = 0
+        self._world_matrix: Optional[mathutils.Matrix] = None
 
         self.name = self.gltf_node.name
         if not self.name:
@@ -56,11 +94,61 @@ class Node:
             for x in self.parent.get_ancestors():
                 yield x
 
+    def get_local_trs(self, manager: import_manager.ImportManager
+                      )->Tuple[Any, mathutils.Quaternion, Tuple[float, float, float]]:
+        '''
+        (location, rotation, scale) in blender space
+        '''
+        if self.gltf_node.matrix:
+            m = self.gltf_node.matrix
+            matrix = mathutils.Matrix((
+                (m[0], m[4], m[8], m[12]),
+                (m[1], m[5], m[9], m[13]),
+                (m[2], m[6], m[10], m[14]),
+                (m[3], m[7], m[11], m[15])
+            ))
+            t, q, s = matrix.decompose()
+            return manager.mod_v(t), manager.mod_q(q), (s[0], s[2], s[1])
+
+        t = (0, 0, 0)
+        if self.gltf_node.translation:
+            t = manager.mod_v(self.gltf_node.translation)
+
+        q = mathutils.Quaternion()
+        if self.gltf_node.rotation:
+            r = self.gltf_node.rotation
+            q = manager.mod_q(mathutils.Quaternion((r[3], r[0], r[1], r[2])))
+
+        s = (1, 1, 1)
+        if self.gltf_node.scale:
+            s = self.gltf_node.scale
+            s = (s[0], s[2], s[1])
+
+        return t, q, s
+
+    def get_world_matrix(self, manager: import_manager.ImportManager)->mathutils.Matrix:
+        '''
+        calculate matrix_world from gltf without depsgraph evaluation
+        '''
+        if self._world_matrix is None:
+            t, q, s = self.get_local_trs(manager)
+            local = (mathutils.Matrix.Translation(t)
+                     @ q.to_matrix().to_4x4()
+                     @ mathutils.Matrix.Diagonal((s[0], s[1], s[2], 1.0)))
+            if self.parent:
+                self._world_matrix = self.parent.get_world_matrix(
+                    manager) @ local
+            else:
+                self._world_matrix = local
+        return self._world_matrix
+
     def create_object(self, progress: ProgressReport,
                       collection: bpy.types.Collection,
                       manager: import_manager.ImportManager)->None:
         # create object
-        if self.gltf_node.mesh != -1:
+        if self.gltf_node.mesh in manager.selection.meshes \
+                and (GPU_INSTANCING not in self.gltf_node.extensions
+                     or manager.bounds_only):
             self.blender_object = bpy.data.objects.new(
                 self.name, manager.meshes[self.gltf_node.mesh][0])
         else:
@@ -71,39 +159,20 @@ class Node:
         collection.objects.link(self.blender_object)
         self.blender_object.select_set("SELECT")
 
-        self.blender_object['js'] = json.dumps(self.gltf_node.js, indent=2)
+        manager.metadata.store(self.blender_object, 'nodes', self.index,
+                               self.gltf_node.js, metadata.NODE_MAPPED_KEYS)
 
         # parent
         if self.parent:
             self.blender_object.parent = self.parent.blender_object
 
-        if self.gltf_node.translation:
-            self.blender_object.location = manager.mod_v(
-                self.gltf_node.translation)
-
-        if self.gltf_node.rotation:
-            r = self.gltf_node.rotation
-            q = mathutils.Quaternion((r[3], r[0], r[1], r[2]))
-            with tmp_mode(self.blender_object, 'QUATERNION'):
-                self.blender_object.rotation_quaternion = manager.mod_q(q)
-
-        if self.gltf_node.scale:
-            s = self.gltf_node.scale
-            self.blender_object.scale = (s[0], s[2], s[1])
-
-        if self.gltf_node.matrix:
-            m = self.gltf_node.matrix
-            matrix = mathutils.Matrix((
-                (m[0], m[4], m[8], m[12]),
-                (m[1], m[5], m[9], m[13]),
-                (m[2], m[6], m[10], m[14]),
-                (m[3], m[7], m[11], m[15])
-            ))
-            t, q, s = matrix.decompose()
-            self.blender_object.location = manager.mod_v(t)
+        if (self.gltf_node.translation or self.gltf_node.rotation
+                or self.gltf_node.scale or self.gltf_node.matrix):
+            t, q, s = self.get_local_trs(manager)
+            self.blender_object.location = t
             with tmp_mode(self.blender_object, 'QUATERNION'):
-                self.blender_object.rotation_quaternion = manager.mod_q(q)
-            self.blender_object.scale = (s[0], s[2], s[1])
+                self.blender_object.rotation_quaternion = q
+            self.blender_object.scale = s
 
         progress.step()
 
@@ -111,7 +180,8 @@ class Node:
             child.create_object(progress, collection, manager)
 
     # create armature
-    def create_armature(self, context, collection, view_layer,
+    def create_armature(self, context, collection,
+                        manager: import_manager.ImportManager,
                         skin: gltftypes.Skin)->bpy.types.Object:
         skin_name = skin.name
 
@@ -125,44 +195,64 @@ class Node:
 
         self.blender_armature.parent = self.blender_object.parent
 
-        # select
-        self.blender_armature.select_set("SELECT")
-        view_layer.objects.active = self.blender_armature
-        bpy.ops.object.mode_set(mode='OBJECT', toggle=False)
-
-        # set identity matrix_world to armature
-        m = mathutils.Matrix()
-        m.identity()
-        self.blender_armature.matrix_world = m
-        context.scene.update()  # recalc matrix_world
-
-        # edit mode
-        bpy.ops.object.mode_set(mode='EDIT', toggle=False)
-
-        self.create_bone(skin, armature, None, False)
-
-    def create_bone(self, skin: gltftypes.Skin, armature: bpy.types.Armature,
-                    parent_bone: bpy.types.Bone, is_connect: bool)->None:
-
-        self.blender_bone = armature.edit_bones.new(self.name)
-        self.bone_name = self.blender_bone.name
-        self.blender_bone.parent = parent_bone
-        if is_connect:
-            self.blender_bone.use_connect = True
-
-        object_pos = self.blender_object.matrix_world.to_translation()
-        self.blender_bone.head = object_pos
+        # identity matrix_world for armature.
+        # use gltf matrices instead of scene.update() to resolve parent.
+        if self.parent:
+            self.blender_armature.matrix_basis = self.parent.get_world_matrix(
+                manager).inverted_safe()
+
+        # bone layout
+        bones: List[Node] = []
+        heads: List[mathutils.Vector] = []
+        tails: List[mathutils.Vector] = []
+        parents: List[int] = []
+        connects: List[bool] = []
+        self._layout_bone(manager, -1, False,
+                          bones, heads, tails, parents, connects)
+
+        # one edit mode session for all bones
+        with edit_mode(context, self.blender_armature) as edit_bones:
+            edit_list = []
+            for node, head, tail in zip(bones, heads, tails):
+                edit_bone = edit_bones.new(node.name)
+                edit_bone.head = head
+                edit_bone.tail = tail
+                edit_bone.roll = 0.0
+                node.bone_name = edit_bone.name
+                edit_list.append(edit_bone)
+            for edit_bone, parent, is_connect in zip(edit_list, parents, connects):
+                if parent != -1:
+                    edit_bone.parent = edit_list[parent]
+                    if is_connect:
+                        edit_bone.use_connect = True
+
+        for node in bones:
+            node.blender_bone = armature.bones[node.bone_name]
+
+        return self.blender_armature
+
+    def _layout_bone(self, manager: import_manager.ImportManager,
+                     parent: int, is_connect: bool,
+                     bones: List['Node'], heads: List[mathutils.Vector],
+                     tails: List[mathutils.Vector], parents: List[int],
+                     connects: List[bool])->None:
+        index = len(bones)
+        bones.append(self)
+        parents.append(parent)
+        connects.append(is_connect)
+
+        head = self.get_world_matrix(manager).to_translation()
+        heads.append(head)
+        tails.append(None)
 
         if not is_connect:
-            if parent_bone and parent_bone.tail == (0, 0, 0):
-                tail_offset = (self.blender_bone.head -
-                               parent_bone.head).normalized() * 0.1
-                parent_bone.tail = parent_bone.head + tail_offset
+            if parent != -1 and tails[parent] is None:
+                tail_offset = (head - heads[parent]).normalized() * 0.1
+                tails[parent] = heads[parent] + tail_offset
 
         if not self.children:
-            if parent_bone:
-                self.blender_bone.tail = self.blender_bone.head + \
-                    (self.blender_bone.head - parent_bone.head)
+            if parent != -1:
+                tails[index] = head + (head - heads[parent])
         else:
             def get_child_is_connect(child_pos)->bool:
                 if len(self.children) == 1:
@@ -173,15 +263,23 @@ class Node:
 
                 return False
 
-            if parent_bone:
+            if parent != -1:
                 child_is_connect = 0
                 for i, child in enumerate(self.children):
                     if get_child_is_connect(
-                            child.blender_object.matrix_world.to_translation()):
+                            child.get_world_matrix(manager).to_translation()):
                         child_is_connect = i
             else:
                 child_is_connect = -1
 
             for i, child in enumerate(self.children):
-                child.create_bone(
-                    skin, armature, self.blender_bone, i == child_is_connect)
+                if i == child_is_connect:
+                    # connected child decides the tail
+                    tails[index] = child.get_world_matrix(
+                        manager).to_translation()
+                child._layout_bone(manager, index, i == child_is_connect,
+                                   bones, heads, tails, parents, connects)
+
+        # zero length bones are removed when leaving edit mode
+        if tails[index] is None or (tails[index] - head).length < 1e-5:
+            tails[index] = head + mathutils.Vector((0, 0, 0.1))
@@ -7,6 +7,7 @@ from progress_report import ProgressReport
 from . import gltftypes
 from .import_manager import ImportManager
 from .node import Node
+from .instancing import collect_instances, create_instances
 
 
 class Skin:
@@ -31,8 +32,9 @@ class Skin:
 
 
 def load_objects(context, progress: ProgressReport,
-                 manager: ImportManager)->Tuple[List[Node], Node]:
-    progress.enter_substeps(len(manager.gltf.nodes)+1, "Loading objects...")
+                 manager: ImportManager)->Tuple[List[Optional[Node]], Node]:
+    selected = manager.selection.nodes
+    progress.enter_substeps(len(selected)+1, "Loading objects...")
 
     # collection
     view_layer = context.view_layer
@@ -42,31 +44,38 @@ def load_objects(context, progress: ProgressReport,
         collection = context.scene.master_collection.new()
         view_layer.collections.link(collection)
 
-    # setup
-    nodes = [Node(i, gltf_node)
-             for i, gltf_node in enumerate(manager.gltf.nodes)]
+    # setup. indexed by gltf index, None if not reachable from the scene
+    nodes: List[Optional[Node]] = [Node(i, gltf_node) if i in selected else None
+                                   for i, gltf_node in enumerate(manager.gltf.nodes)]
 
     # set parents
     for gltf_node, node in zip(manager.gltf.nodes, nodes):
+        if not node:
+            continue
         for child_index in gltf_node.children:
-            child = nodes[child_index]
+            child = nodes[manager.selection.get_lod(child_index)]
+            if not child:
+                # filtered out
+                continue
             node.children.append(child)
             child.parent = node
 
     progress.step()
 
     # check root
-    roots = [node for node in enumerate(nodes) if not node[1].parent]
+    roots = [nodes[i] for i in manager.selection.roots]
     if len(roots) != 1:
         root = Node(len(nodes), gltftypes.Node({
             'name': '__root__'
         }))
-        for _, node in roots:
+        for node in roots:
             root.children.append(node)
             node.parent = root
     else:
-        root = nodes[0]
+        root = roots[0]
+    instance_sets = collect_instances(manager, nodes)
     root.create_object(progress, collection, manager)
+    create_instances(collection, manager, instance_sets)
 
     def get_root(skin: gltftypes.Skin)->Optional[Node]:
 
@@ -87,17 +96,17 @@ def load_objects(context, progress: ProgressReport,
         'name': 'skin'
     })
 
-    for skin in manager.gltf.skins:
+    for skin_index in sorted(manager.selection.skins):
+        skin = manager.gltf.skins[skin_index]
         for joint in skin.joints:
+            if not nodes[joint]:
+                continue
             if joint not in root_skin.joints:
                 root_skin.joints.append(joint)
     skeleton = get_root(root_skin)
 
     if skeleton:
-        skeleton.create_armature(context, collection,
-                                 view_layer, root_skin)
-
-    bpy.ops.object.mode_set(mode='OBJECT', toggle=False)
+        skeleton.create_armature(context, collection, manager, root_skin)
 
     progress.leave_substeps()
     return (nodes, root)
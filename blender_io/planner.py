@@ -0,0 +1,230 @@
+'''
+import cost from the json only. no bpy and no buffer is read.
+
+sizes are estimates from accessor counts and bufferView lengths. decoded
+pixels are guessed from the compressed size, because the image headers
+are in the buffers.
+'''
+import pathlib
+from typing import Dict, Any, Optional, Tuple
+
+from . import gltftypes
+from .selection import Selection
+
+from logging import getLogger  # pylint: disable=C0411
+logger = getLogger(__name__)
+
+# node.GPU_INSTANCING. node imports bpy
+GPU_INSTANCING = 'EXT_mesh_gpu_instancing'
+
+# proxy_size used when a budget needs smaller textures
+PROXY_SIZE = 512
+
+# rough bytes in blender memory
+VERTEX_BYTES = 44  # co, normal, flags, decoded VertexBuffer
+LOOP_BYTES = 36  # vertex, edge, uv, decoded index
+TRIANGLE_BYTES = 34  # polygon and 1.5 edges
+INFLUENCE_BYTES = 8  # vertex group weight
+SHAPE_KEY_VERTEX_BYTES = 12
+KEYFRAME_BYTES = 80  # BezTriple
+DATABLOCK_BYTES = 2048  # ID, object, material node tree
+
+# compressed to RGBA8
+DECODE_RATIO = {
+    'image/jpeg': 10,
+    'image/png': 3,
+}
+DEFAULT_DECODE_RATIO = 4
+
+COMPONENTS = {
+    'translation': 3,
+    'rotation': 4,
+    'scale': 3,
+}
+
+
+class Plan:
+    def __init__(self)->None:
+        self.vertices = 0
+        self.loops = 0
+        self.triangles = 0
+        self.bone_influences = 0
+        self.shape_key_vertices = 0
+        self.keyframes = 0
+        # compressed image bytes
+        self.texture_bytes = 0
+        # bytes read from the file and external buffers
+        self.buffer_bytes = 0
+        self.datablocks = 0
+        # stage to estimated bytes
+        self.stages: Dict[str, int] = {}
+
+    @property
+    def memory(self)->int:
+        return self.buffer_bytes + sum(self.stages.values())
+
+    def __str__(self)->str:
+        stages = ', '.join(f'{k} {v >> 20}MB' for k, v in self.stages.items())
+        return (f'<Plan {self.memory >> 20}MB ({stages}, buffers {self.buffer_bytes >> 20}MB)'
+                f' vertices:{self.vertices} loops:{self.loops}'
+                f' influences:{self.bone_influences} keyframes:{self.keyframes}'
+                f' datablocks:{self.datablocks}>')
+
+
+def _get_image_bytes(gltf: gltftypes.glTF, image: gltftypes.Image,
+                     base_dir: Optional[pathlib.Path])->int:
+    if image.bufferView != -1:
+        return gltf.bufferViews[image.bufferView].byteLength
+    if image.uri.startswith('data:'):
+        return len(image.uri) * 3 // 4
+    if image.uri and base_dir:
+        path = base_dir / image.uri
+        if path.exists():
+            return path.stat().st_size
+    return 0
+
+
+def _estimate_textures(plan: Plan, gltf: gltftypes.glTF, selection: Selection,
+                       proxy_size: int, lazy_textures: bool,
+                       base_dir: Optional[pathlib.Path])->None:
+    plan.datablocks += len(selection.images) + len(selection.materials)
+    if lazy_textures:
+        # placeholders. pixels are loaded later by LoadSourceTextures
+        return
+    decoded = 0
+    for i in selection.images:
+        image = gltf.images[i]
+        size = _get_image_bytes(gltf, image, base_dir)
+        plan.texture_bytes += size
+        mime = image.mimeType.value if image.mimeType else ''
+        pixels = size * DECODE_RATIO.get(mime, DEFAULT_DECODE_RATIO)
+        if proxy_size > 0:
+            pixels = min(pixels, proxy_size * proxy_size * 4)
+        decoded += pixels
+    plan.stages['textures'] = decoded
+
+
+def _estimate_meshes(plan: Plan, gltf: gltftypes.glTF, selection: Selection,
+                     bounds_only: bool)->None:
+    if bounds_only:
+        # 8 vertices each
+        plan.vertices = 8 * len(selection.meshes)
+        plan.stages['meshes'] = plan.vertices * VERTEX_BYTES
+        plan.datablocks += len(selection.meshes)
+        return
+
+    for i in selection.meshes:
+        for prim in gltf.meshes[i].primitives:
+            vertex_count = gltf.accessors[prim.attributes['POSITION']].count
+            index_count = gltf.accessors[prim.indices].count \
+                if prim.indices != -1 else vertex_count
+            plan.vertices += vertex_count
+            plan.loops += index_count
+            plan.triangles += index_count // 3
+            # 4 influences per JOINTS_n set
+            joint_sets = sum(1 for k in prim.attributes if k.startswith('JOINTS_'))
+            plan.bone_influences += vertex_count * 4 * joint_sets
+            plan.shape_key_vertices += vertex_count * len(prim.targets)
+    plan.stages['meshes'] = (plan.vertices * VERTEX_BYTES
+                             + plan.loops * LOOP_BYTES
+                             + plan.triangles * TRIANGLE_BYTES
+                             + plan.bone_influences * INFLUENCE_BYTES
+                             + plan.shape_key_vertices * SHAPE_KEY_VERTEX_BYTES)
+    plan.datablocks += len(selection.meshes)
+
+
+def _estimate_objects(plan: Plan, gltf: gltftypes.glTF, selection: Selection,
+                      bounds_only: bool)->None:
+    objects = len(selection.nodes)
+    if not bounds_only:
+        for i in selection.nodes:
+            ext = gltf.nodes[i].extensions.get(GPU_INSTANCING)
+            if ext:
+                # one object per instance at worst
+                accessor = next(iter(ext.get('attributes', {}).values()), -1)
+                if accessor != -1:
+                    objects += gltf.accessors[accessor].count
+    plan.datablocks += objects + (1 if selection.skins else 0)
+    plan.stages['objects'] = objects * DATABLOCK_BYTES
+
+
+def _estimate_animation(plan: Plan, gltf: gltftypes.glTF,
+                        selection: Selection)->None:
+    for animation in gltf.animations:
+        channels = [channel for channel in animation.channels
+                    if channel.target and channel.target.node in selection.nodes]
+        if not channels:
+            continue
+        plan.datablocks += 1
+        for channel in channels:
+            sampler = animation.samplers[channel.sampler]
+            times = gltf.accessors[sampler.input].count
+            path = channel.target.path.value
+            if path == 'weights':
+                components = gltf.accessors[sampler.output].count // max(times, 1)
+            else:
+                components = COMPONENTS.get(path, 1)
+            plan.keyframes += times * components
+    plan.stages['animation'] = plan.keyframes * KEYFRAME_BYTES
+
+
+def _get_buffer_bytes(gltf: gltftypes.glTF, body: bytes,
+                      base_dir: Optional[pathlib.Path])->int:
+    size = len(body)
+    for buffer in gltf.buffers:
+        if buffer.uri.startswith('data:'):
+            size += len(buffer.uri) * 3 // 4
+        elif buffer.uri and base_dir:
+            path = base_dir / buffer.uri
+            if path.exists():
+                size += path.stat().st_size
+    return size
+
+
+def estimate(gltf: gltftypes.glTF, selection: Selection, body: bytes = b'',
+             base_dir: Optional[pathlib.Path] = None,
+             import_animation: bool = True, proxy_size: int = 0,
+             lazy_textures: bool = False, bounds_only: bool = False)->Plan:
+    plan = Plan()
+    if not bounds_only:
+        plan.buffer_bytes = _get_buffer_bytes(gltf, body, base_dir)
+        _estimate_textures(plan, gltf, selection, proxy_size, lazy_textures,
+                           base_dir)
+    _estimate_meshes(plan, gltf, selection, bounds_only)
+    _estimate_objects(plan, gltf, selection, bounds_only)
+    if import_animation and not bounds_only:
+        _estimate_animation(plan, gltf, selection)
+    return plan
+
+
+def fit_budget(gltf: gltftypes.glTF, selection: Selection, budget: int,
+               options: Dict[str, Any], body: bytes = b'',
+               base_dir: Optional[pathlib.Path] = None
+               )->Tuple[Plan, Optional[Dict[str, Any]]]:
+    '''
+    options are import_animation, proxy_size, lazy_textures and bounds_only.
+    downgrade textures to proxies, then drop animation, until the plan
+    fits in budget bytes. the changed options, or None if it does not fit
+    '''
+    options = dict(options)
+    changed: Dict[str, Any] = {}
+    plan = estimate(gltf, selection, body, base_dir, **options)
+    downgrades = (
+        # lazy textures have no pixels to shrink
+        ('proxy_size', PROXY_SIZE,
+         lambda o: not o.get('lazy_textures')
+         and (o['proxy_size'] == 0 or o['proxy_size'] > PROXY_SIZE)),
+        ('import_animation', False, lambda o: o['import_animation']),
+    )
+    for key, value, applies in downgrades:
+        if plan.memory <= budget:
+            break
+        if not applies(options):
+            continue
+        options[key] = value
+        changed[key] = value
+        plan = estimate(gltf, selection, body, base_dir, **options)
+        logger.info('budget: %s=%s, %s', key, value, plan)
+    if plan.memory > budget:
+        return plan, None
+    return plan, changed
@@ -0,0 +1,233 @@
+import fnmatch
+from typing import Set, List, Iterable, Dict, Optional
+
+from . import gltftypes
+
+from logging import getLogger  # pylint: disable=C0411
+logger = getLogger(__name__)
+
+LOD = 'MSFT_lod'
+
+
+def get_material_textures(material: gltftypes.Material)->Iterable[int]:
+    if material.normalTexture:
+        yield material.normalTexture.index
+    if material.occlusionTexture:
+        yield material.occlusionTexture.index
+    if material.emissiveTexture:
+        yield material.emissiveTexture.index
+    pbr = material.pbrMetallicRoughness
+    if pbr:
+        if pbr.baseColorTexture:
+            yield pbr.baseColorTexture.index
+        if pbr.metallicRoughnessTexture:
+            yield pbr.metallicRoughnessTexture.index
+
+
+class Selection:
+    '''
+    gltf indices that are reachable from the imported nodes
+    '''
+
+    def __init__(self, gltf: gltftypes.glTF, lod_level: int = 0)->None:
+        self.gltf = gltf
+        # MSFT_lod level. 0 is the node itself
+        self.lod_level = lod_level
+        # node to the MSFT_lod node imported in its place
+        self.lods: Dict[int, int] = {}
+        self.roots: List[int] = []
+        self.nodes: Set[int] = set()
+        self.parents: Dict[int, int] = {}
+        self.meshes: Set[int] = set()
+        self.skins: Set[int] = set()
+        self.materials: Set[int] = set()
+        self.textures: Set[int] = set()
+        self.images: Set[int] = set()
+
+    def __str__(self)->str:
+        return (f'<Selection nodes:{len(self.nodes)}/{len(self.gltf.nodes)}'
+                f' meshes:{len(self.meshes)}/{len(self.gltf.meshes)}'
+                f' materials:{len(self.materials)}/{len(self.gltf.materials)}'
+                f' textures:{len(self.textures)}/{len(self.gltf.textures)}>')
+
+    def get_lod(self, index: int)->int:
+        '''
+        the node imported for gltf.nodes[index]
+        '''
+        if self.lod_level <= 0:
+            return index
+        lod = self.lods.get(index)
+        if lod is None:
+            ids = self.gltf.nodes[index].extensions.get(LOD, {}).get('ids', [])
+            # fewer levels than lod_level. the coarsest one
+            lod = ids[min(self.lod_level, len(ids)) - 1] if ids else index
+            self.lods[index] = lod
+        return lod
+
+    def add_tree(self, root: int)->None:
+        root = self.get_lod(root)
+        if root in self.nodes:
+            return
+        self.roots.append(root)
+        stack = [root]
+        while stack:
+            index = stack.pop()
+            if index in self.nodes:
+                continue
+            self.nodes.add(index)
+            for child in self.gltf.nodes[index].children:
+                child = self.get_lod(child)
+                self.parents[child] = index
+                stack.append(child)
+
+    def resolve(self, mesh_nodes: Optional[Iterable[int]] = None)->None:
+        '''
+        dependency closure of self.nodes.
+        only mesh_nodes load their meshes and skins. all nodes if None
+        '''
+        for index in self.nodes if mesh_nodes is None else mesh_nodes:
+            node = self.gltf.nodes[index]
+            if node.mesh != -1:
+                self.meshes.add(node.mesh)
+            if node.skin != -1:
+                self.skins.add(node.skin)
+
+        for index in self.meshes:
+            for prim in self.gltf.meshes[index].primitives:
+                if prim.material != -1:
+                    self.materials.add(prim.material)
+
+        for index in self.materials:
+            for texture_index in get_material_textures(self.gltf.materials[index]):
+                self.textures.add(texture_index)
+
+        for index in self.textures:
+            source = self.gltf.textures[index].source
+            if source != -1:
+                self.images.add(source)
+
+
+def from_meshes(gltf: gltftypes.glTF, meshes: Iterable[int])->Selection:
+    '''
+    meshes and their materials, without nodes
+    '''
+    selection = Selection(gltf)
+    selection.meshes.update(meshes)
+    selection.resolve()
+    return selection
+
+
+def parse_indices(text: str)->List[int]:
+    '''
+    '3, 17 20' to [3, 17, 20].
+    -1 for a word that is not an index, so the filter still matches nothing
+    '''
+    indices = []
+    for x in text.replace(',', ' ').split():
+        if x.isdigit():
+            indices.append(int(x))
+        else:
+            logger.warning('not a node index: %r', x)
+            indices.append(-1)
+    return indices
+
+
+def from_scene(gltf: gltftypes.glTF, scene_index: int = -1,
+               lod_level: int = 0)->Selection:
+    '''
+    nodes reachable from gltf.scenes[scene_index].
+    scene_index -1 means glTF.scene. out of range falls back to it
+    '''
+    if not -1 <= scene_index < len(gltf.scenes):
+        logger.warning('no scene %d in %d scenes, use the default scene',
+                       scene_index, len(gltf.scenes))
+        scene_index = -1
+    if scene_index == -1:
+        scene_index = gltf.scene
+    if scene_index >= len(gltf.scenes):
+        logger.warning('glTF.scene %d is out of range', scene_index)
+        scene_index = -1
+    if scene_index == -1 and gltf.scenes:
+        scene_index = 0
+
+    selection = Selection(gltf, lod_level)
+    if scene_index == -1:
+        # no scene. all parentless nodes
+        children: Set[int] = set()
+        for node in gltf.nodes:
+            children.update(node.children)
+        for i in range(len(gltf.nodes)):
+            if i not in children:
+                selection.add_tree(i)
+    else:
+        for i in gltf.scenes[scene_index].nodes:
+            selection.add_tree(i)
+    selection.resolve()
+    logger.debug('scene %d: %s', scene_index, selection)
+    return selection
+
+
+def from_filter(gltf: gltftypes.glTF, scene_index: int = -1, lod_level: int = 0,
+                node_pattern: str = '', mesh_pattern: str = '',
+                root_nodes: Iterable[int] = ())->Selection:
+    '''
+    part of the scene.
+
+    * nodes matching node_pattern (fnmatch) and root_nodes with their subtrees
+    * nodes whose mesh matches mesh_pattern
+
+    ancestors and skin joints of them are kept as empties to place them.
+    no filter is the whole scene. a filter that matches nothing is empty
+    '''
+    scene = from_scene(gltf, scene_index, lod_level)
+    root_nodes = list(root_nodes)
+    if not node_pattern and not mesh_pattern and not root_nodes:
+        return scene
+
+    for i in root_nodes:
+        if not 0 <= i < len(gltf.nodes):
+            logger.warning('node index out of range: %d', i)
+    root_nodes = [scene.get_lod(i) for i in root_nodes if 0 <= i < len(gltf.nodes)]
+
+    subtrees = [i for i in scene.nodes
+                if i in root_nodes
+                or (node_pattern
+                    and fnmatch.fnmatchcase(gltf.nodes[i].name, node_pattern))]
+    selected: Set[int] = set()
+    for root in subtrees:
+        stack = [root]
+        while stack:
+            index = stack.pop()
+            if index in selected:
+                continue
+            selected.add(index)
+            stack.extend(scene.get_lod(child)
+                         for child in gltf.nodes[index].children)
+    if mesh_pattern:
+        for i in scene.nodes:
+            mesh = gltf.nodes[i].mesh
+            if mesh != -1 and fnmatch.fnmatchcase(gltf.meshes[mesh].name,
+                                                  mesh_pattern):
+                selected.add(i)
+
+    # joints of the selected skins and every ancestor
+    nodes = set(selected)
+    for i in selected:
+        skin = gltf.nodes[i].skin
+        if skin != -1:
+            nodes.update(j for j in gltf.skins[skin].joints if j in scene.nodes)
+    for i in list(nodes):
+        while i in scene.parents and scene.parents[i] not in nodes:
+            i = scene.parents[i]
+            nodes.add(i)
+
+    selection = Selection(gltf, lod_level)
+    selection.lods = scene.lods
+    selection.parents = scene.parents
+    selection.nodes = nodes
+    selection.roots = [i for i in scene.roots if i in nodes]
+    selection.resolve(selected)
+    if not selected:
+        logger.warning('no node matches the filter')
+    logger.debug('filter: %s', selection)
+    return selection
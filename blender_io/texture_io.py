@@ -1,56 +1,399 @@
-from typing import List
+from typing import List, Optional, Dict, Set, Iterable, Tuple
+import os
+import base64
+import hashlib
 import pathlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy
 import bpy
 from bpy_extras.image_utils import load_image
 from progress_report import ProgressReport
 
 from . import gltftypes
+from . import glb
 from .import_manager import ImportManager
+from . import image_probe
+from . import user_cache
+from .selection import get_material_textures
 
 from logging import getLogger  # pylint: disable=C0411
 logger = getLogger(__name__)
 
 
-def _create_texture(progress: ProgressReport,
-                    manager: ImportManager,
-                    index: int,
-                    texture: gltftypes.Texture
-                    )->bpy.types.Texture:
-    image = manager.gltf.images[texture.source]
+def get_image_bytes(manager: ImportManager, image: gltftypes.Image)->bytes:
     if image.uri:
-        texture = load_image(image.uri, str(manager.base_dir))
+        if image.uri.startswith('data:'):
+            _, data = image.uri.split(',', 1)
+            return base64.b64decode(data)
+        path = manager.base_dir / image.uri
+        return path.read_bytes()
     elif image.bufferView != -1:
-        if not bpy.data.filepath:
-            # can not extract image files
-            #raise Exception('no bpy.data.filepath')
-            texture = bpy.data.images.new('image', 128, 128)
+        return manager.get_view_bytes(image.bufferView)
+    else:
+        raise Exception("invalid image")
+
+
+# enough for PNG IHDR/tRNS and JPEG SOF in common files
+HEADER_SIZE = 65536
+
+
+def read_image_header(manager: ImportManager, image: gltftypes.Image)->bytes:
+    '''
+    first bytes of the encoded image for image_probe
+    '''
+    if image.uri:
+        if image.uri.startswith('data:'):
+            _, data = image.uri.split(',', 1)
+            # multiple of 4 base64 chars
+            return base64.b64decode(data[:HEADER_SIZE // 3 * 4])
+        path = manager.base_dir / image.uri
+        with path.open('rb') as f:
+            return f.read(HEADER_SIZE)
+    elif image.bufferView != -1:
+        return manager.get_view_bytes(image.bufferView)[:HEADER_SIZE]
+    else:
+        raise Exception("invalid image")
+
+
+def get_image_ext(image: gltftypes.Image, data: bytes)->str:
+    if image.mimeType == gltftypes.Image_mimeType.image_png:
+        return '.png'
+    if image.mimeType == gltftypes.Image_mimeType.image_jpeg:
+        return '.jpg'
+    # no mimeType. check signature
+    if data[:8] == b'\x89PNG\r\n\x1a\n':
+        return '.png'
+    if data[:2] == b'\xff\xd8':
+        return '.jpg'
+    return pathlib.Path(image.uri).suffix if image.uri else '.png'
+
+
+def extract_image(image_dir: pathlib.Path, key: str, ext: str, data: bytes)->pathlib.Path:
+    '''
+    write data as {content hash}{ext}. skip if the same file exists
+    '''
+    image_path = image_dir / f'{key[:16]}{ext}'
+    if image_path.exists() and image_path.stat().st_size == len(data):
+        return image_path
+    image_dir.mkdir(parents=True, exist_ok=True)
+    # may be called from worker threads
+    tmp_path = image_path.with_name(
+        f'{image_path.name}.{threading.get_ident()}.tmp')
+    with tmp_path.open('wb') as w:
+        w.write(data)
+    os.replace(str(tmp_path), str(image_path))
+    return image_path
+
+
+def pack_image(name: str, ext: str, data: bytes,
+               info: Optional[image_probe.ImageInfo] = None)->bpy.types.Image:
+    '''
+    create image from encoded bytes without file
+    '''
+    # the generated pixels are replaced by the packed file. keep them small
+    blender_image = bpy.data.images.new(
+        name, 8, 8, alpha=info.has_alpha if info else False)
+    blender_image.filepath_raw = f'//{name}{ext}'
+    blender_image.file_format = 'JPEG' if ext == '.jpg' else 'PNG'
+    blender_image.pack(data=data, data_len=len(data))
+    # decode from packed file
+    blender_image.source = 'FILE'
+    return blender_image
 
+
+class PreparedImage:
+    '''
+    image bytes and header info that are ready before touching bpy
+    '''
+
+    def __init__(self, index: int, image: gltftypes.Image, data: bytes,
+                 key: str = '')->None:
+        self.index = index
+        self.image = image
+        self.data = data
+        self.key = key if key else hashlib.sha1(data).hexdigest()
+        self.ext = get_image_ext(image, data)
+        self.info = image_probe.probe(data)
+        self.path: Optional[pathlib.Path] = None
+
+    @property
+    def is_embedded(self)->bool:
+        return not self.image.uri or self.image.uri.startswith('data:')
+
+    @property
+    def name(self)->str:
+        if self.image.name:
+            return self.image.name
+        if not self.is_embedded:
+            return pathlib.Path(self.image.uri).name
+        return f'image_{self.index:0>2}'
+
+
+def _prepare_image(manager: ImportManager, image_dir: Optional[pathlib.Path],
+                   index: int)->PreparedImage:
+    '''
+    run in worker threads. no bpy access
+    '''
+    image = manager.gltf.images[index]
+    if manager.lazy_textures:
+        # identify by source instead of content
+        if image.uri:
+            key = hashlib.sha1(image.uri.encode('utf-8')).hexdigest()
         else:
+            key = f'bufferView:{image.bufferView}'
+        return PreparedImage(index, image, read_image_header(manager, image), key)
+
+    prepared = PreparedImage(index, image, get_image_bytes(manager, image))
+    if image_dir and prepared.is_embedded:
+        prepared.path = extract_image(
+            image_dir, prepared.key, prepared.ext, prepared.data)
+    return prepared
+
+
+def get_proxy_dir()->pathlib.Path:
+    # per user. files in it are loaded as textures
+    return user_cache.get_cache_dir('proxy')
+
+
+def get_proxy_size(info: image_probe.ImageInfo, max_size: int)->Tuple[int, int]:
+    '''
+    keep aspect. longer side is max_size
+    '''
+    scale = max_size / max(info.width, info.height)
+    return max(1, round(info.width * scale)), max(1, round(info.height * scale))
+
+
+def copy_pixels(src: bpy.types.Image, dst: bpy.types.Image)->None:
+    '''
+    same size images. through a float32 buffer instead of python floats
+    '''
+    buf = numpy.empty(len(src.pixels), numpy.float32)
+    try:
+        src.pixels.foreach_get(buf)
+        dst.pixels.foreach_set(buf)
+    except AttributeError:
+        # bpy_prop_array has no foreach_get before 2.83
+        dst.pixels = src.pixels[:]
+
+
+def _create_proxy_image(manager: ImportManager,
+                        prepared: PreparedImage)->bpy.types.Image:
+    '''
+    downscaled image cached as {content hash}_{size}{ext}
+    '''
+    info = prepared.info
+    ext = '.png' if info.has_alpha else prepared.ext
+    proxy_path = get_proxy_dir() / \
+        f'{prepared.key[:16]}_{manager.proxy_size}{ext}'
 
+    if not proxy_path.exists():
+        width, height = get_proxy_size(info, manager.proxy_size)
+        logger.debug('proxy %s: %dx%d => %dx%d', prepared.name,
+                     info.width, info.height, width, height)
+        full = _create_full_image(manager, prepared)
+        full.scale(width, height)
+        proxy = bpy.data.images.new(
+            prepared.name, width, height, alpha=info.has_alpha)
+        copy_pixels(full, proxy)
+        bpy.data.images.remove(full)
+
+        proxy.filepath_raw = str(proxy_path)
+        proxy.file_format = 'JPEG' if ext == '.jpg' else 'PNG'
+        proxy.save()
+        proxy.source = 'FILE'
+    else:
+        proxy = load_image(proxy_path.name, str(proxy_path.parent))
+        proxy.name = prepared.name
+
+    set_source(proxy, manager, prepared.index)
+    return proxy
+
+
+def _create_image(manager: ImportManager,
+                  prepared: PreparedImage)->bpy.types.Image:
+    info = prepared.info
+    if (manager.proxy_size > 0 and info
+            and max(info.width, info.height) > manager.proxy_size):
+        try:
+            return _create_proxy_image(manager, prepared)
+        except OSError as ex:
+            logger.warning('no proxy for %s: %s', prepared.name, ex)
+    return _create_full_image(manager, prepared)
+
+
+def _create_full_image(manager: ImportManager,
+                       prepared: PreparedImage)->bpy.types.Image:
+    image = prepared.image
+    if not prepared.is_embedded:
+        return load_image(image.uri, str(manager.base_dir))
+
+    # embedded
+    if prepared.path:
+        return load_image(prepared.path.name, str(prepared.path.parent))
+
+    return pack_image(prepared.name, prepared.ext, prepared.data, prepared.info)
+
+
+def _create_lazy_image(manager: ImportManager,
+                       prepared: PreparedImage)->bpy.types.Image:
+    '''
+    8x8 placeholder. nothing is decoded and the size of the source does not
+    matter. external files are decoded by blender on first draw, embedded
+    images are loaded by load_source_images
+    '''
+    info = prepared.info
+    blender_image = bpy.data.images.new(
+        prepared.name, 8, 8, alpha=info.has_alpha if info else False)
+    if not prepared.is_embedded:
+        blender_image.filepath = str(manager.base_dir / prepared.image.uri)
+        blender_image.source = 'FILE'
+        return blender_image
+
+    if info:
+        # probed size until the pixels are loaded
+        blender_image['gltf_width'] = info.width
+        blender_image['gltf_height'] = info.height
+    set_source(blender_image, manager, prepared.index)
+    return blender_image
+
+
+def set_source(blender_image: bpy.types.Image,
+               manager: ImportManager, index: int)->None:
+    '''
+    mark a lazy placeholder or proxy to be replaced by load_source_images
+    '''
+    blender_image['gltf_source_file'] = str(manager.path.absolute())
+    blender_image['gltf_source_image'] = index
+
+
+def has_source(blender_image: bpy.types.Image)->bool:
+    return 'gltf_source_file' in blender_image
+
+
+def load_source_images(images: Iterable[bpy.types.Image])->int:
+    '''
+    replace lazy placeholders and proxies with the full resolution source.
+    returns loaded count
+    '''
+    by_file: Dict[str, List[bpy.types.Image]] = {}
+    for blender_image in images:
+        if has_source(blender_image):
+            by_file.setdefault(
+                blender_image['gltf_source_file'], []).append(blender_image)
+
+    count = 0
+    for file, blender_images in by_file.items():
+        path = pathlib.Path(file)
+        gltf, body = glb.parse_path(path)
+        manager = ImportManager(path, gltf, body, True)
+        for blender_image in blender_images:
+            image = gltf.images[blender_image['gltf_source_image']]
+            if image.uri and not image.uri.startswith('data:'):
+                blender_image.filepath = str(manager.base_dir / image.uri)
+                blender_image.source = 'FILE'
+                blender_image.reload()
+            else:
+                data = get_image_bytes(manager, image)
+                ext = get_image_ext(image, data)
+                blender_image.filepath_raw = f'//{blender_image.name}{ext}'
+                blender_image.file_format = 'JPEG' if ext == '.jpg' else 'PNG'
+                blender_image.pack(data=data, data_len=len(data))
+                blender_image.source = 'FILE'
+            del blender_image['gltf_source_file']
+            del blender_image['gltf_source_image']
+            for key in ('gltf_width', 'gltf_height'):
+                if key in blender_image:
+                    del blender_image[key]
+            count += 1
+    logger.info('load %d source images', count)
+    return count
+
+
+def _get_non_color_images(manager: ImportManager)->Set[int]:
+    '''
+    images that are only used as data (normal, occlusion, metallicRoughness)
+    '''
+    color: Set[int] = set()
+    data: Set[int] = set()
+    for i in manager.selection.materials:
+        material = manager.gltf.materials[i]
+        color_textures: Set[int] = set()
+        if material.emissiveTexture:
+            color_textures.add(material.emissiveTexture.index)
+        pbr = material.pbrMetallicRoughness
+        if pbr and pbr.baseColorTexture:
+            color_textures.add(pbr.baseColorTexture.index)
+        for texture_index in get_material_textures(material):
+            source = manager.gltf.textures[texture_index].source
+            if texture_index in color_textures:
+                color.add(source)
+            else:
+                data.add(source)
+    return data - color
+
+
+def _get_worker_count()->int:
+    return min(8, os.cpu_count() or 1)
+
+
+def load_images(progress: ProgressReport,
+                manager: ImportManager)->List[Optional[bpy.types.Image]]:
+    '''
+    one blender image per gltf image, shared when the bytes are identical
+    '''
+    selected = manager.selection.images
+    progress.enter_substeps(len(selected), "Loading images...")
+
+    image_dir: Optional[pathlib.Path] = None
+    if manager.extract_images:
+        if bpy.data.filepath:
             image_dir = pathlib.Path(
                 bpy.data.filepath).absolute().parent / manager.path.stem
-            if not image_dir.exists():
-                image_dir.mkdir()
+        else:
+            logger.warning(
+                'can not extract images without bpy.data.filepath')
 
-            data = manager.get_view_bytes(image.bufferView)
-            image_path = image_dir / f'texture_{index:0>2}.png'
-            if not image_path.exists():
-                with image_path.open('wb') as w:
-                    w.write(data)
+    # read, hash, extract and probe concurrently
+    indices = sorted(selected)
+    with ThreadPoolExecutor(max_workers=_get_worker_count()) as pool:
+        prepared_list = list(pool.map(
+            lambda i: _prepare_image(manager, image_dir, i), indices))
 
-            texture = load_image(image_path.name, str(image_path.parent))
-    else:
-        raise Exception("invalid image")
-    progress.step()
-    return texture
+    # bpy side
+    create = _create_lazy_image if manager.lazy_textures else _create_image
+    non_color = _get_non_color_images(manager)
+    by_hash: Dict[str, bpy.types.Image] = {}
+    images: List[Optional[bpy.types.Image]] = [None] * len(manager.gltf.images)
+    for prepared in prepared_list:
+        logger.debug('image %d: %s', prepared.index, prepared.info)
+        blender_image = by_hash.get(prepared.key)
+        if not blender_image:
+            blender_image = create(manager, prepared)
+            if prepared.index in non_color:
+                blender_image.colorspace_settings.name = 'Non-Color'
+            by_hash[prepared.key] = blender_image
+        elif prepared.index not in non_color:
+            # shared with a color texture
+            blender_image.colorspace_settings.name = 'sRGB'
+        images[prepared.index] = blender_image
+        progress.step()
+    manager.stats['images'] = f'{len(by_hash)} unique of {len(selected)}'
+    progress.leave_substeps()
+    return images
 
 
 def load_textures(progress: ProgressReport,
-                  manager: ImportManager)->List[bpy.types.Texture]:
+                  manager: ImportManager)->List[Optional[bpy.types.Image]]:
+    '''
+    textures only refer to the shared images.
+    samplers are applied to the image nodes of each material.
+    '''
+    manager.images.extend(load_images(progress, manager))
 
-    progress.enter_substeps(len(manager.gltf.textures), "Loading textures...")
-    textures = [_create_texture(progress, manager, i, texture)
+    selected = manager.selection.textures
+    textures = [manager.images[texture.source]
+                if i in selected and texture.source != -1 else None
                 for i, texture in enumerate(manager.gltf.textures)]
-    progress.leave_substeps()
     return textures
@@ -0,0 +1,36 @@
+'''
+per user cache directories.
+
+files in them are loaded as code or as textures, so they are kept out of
+the shared temp dir and must not be writable by other users.
+'''
+import os
+import sys
+import pathlib
+
+
+def get_root()->pathlib.Path:
+    home = pathlib.Path.home()
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or home / 'AppData' / 'Local'
+    elif sys.platform == 'darwin':
+        base = home / 'Library' / 'Caches'
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or home / '.cache'
+    return pathlib.Path(base) / 'iogltf'
+
+
+def get_cache_dir(name: str)->pathlib.Path:
+    '''
+    create on first use. raises OSError if another user owns it
+    '''
+    path = get_root() / name
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if os.name != 'nt':
+        # mkdir does not change an existing directory
+        st = path.stat()
+        if st.st_uid != os.getuid():
+            raise OSError(f'{path} is owned by another user')
+        if st.st_mode & 0o077:
+            path.chmod(0o700)
+    return path
@@ -0,0 +1,113 @@
+'''
+read only view of glTF.extensions['VRM'] (VRM 0.x). no bpy.
+
+each part is parsed on first access, so an import that only needs the
+humanoid map does not walk blend shapes or spring bones.
+'''
+from typing import List, Dict, Any, Optional, Tuple
+
+from . import gltftypes
+
+Vector3 = Tuple[float, float, float]
+
+
+def _vector3(js: Optional[dict], default: Vector3 = (0.0, 0.0, 0.0))->Vector3:
+    if not js:
+        return default
+    return (js.get('x', 0.0), js.get('y', 0.0), js.get('z', 0.0))
+
+
+class BlendShapeBind:
+    def __init__(self, js: dict)->None:
+        self.mesh: int = js.get('mesh', -1)
+        # morph target index
+        self.index: int = js.get('index', -1)
+        # 0-100 in VRM. 0-1 here
+        self.weight: float = js.get('weight', 100.0) / 100.0
+
+
+class BlendShapeGroup:
+    def __init__(self, js: dict)->None:
+        self.js = js
+        self.name: str = js.get('name', '')
+        self.preset_name: str = js.get('presetName', 'unknown')
+        self.is_binary: bool = js.get('isBinary', False)
+        self.binds = [BlendShapeBind(x) for x in js.get('binds', [])]
+        self.material_values: List[dict] = js.get('materialValues', [])
+
+
+class ColliderGroup:
+    def __init__(self, js: dict)->None:
+        self.node: int = js.get('node', -1)
+        # (offset, radius) in node space
+        self.colliders: List[Tuple[Vector3, float]] = [
+            (_vector3(x.get('offset')), x.get('radius', 0.0))
+            for x in js.get('colliders', [])]
+
+
+class SpringBoneGroup:
+    def __init__(self, js: dict)->None:
+        self.comment: str = js.get('comment', '')
+        # misspelled in the VRM 0.x schema
+        self.stiffness: float = js.get('stiffiness', js.get('stiffness', 1.0))
+        self.gravity_power: float = js.get('gravityPower', 0.0)
+        self.gravity_dir = _vector3(js.get('gravityDir'), (0.0, -1.0, 0.0))
+        self.drag_force: float = js.get('dragForce', 0.4)
+        self.center: int = js.get('center', -1)
+        self.hit_radius: float = js.get('hitRadius', 0.02)
+        self.bones: List[int] = js.get('bones', [])
+        self.collider_groups: List[int] = js.get('colliderGroups', [])
+
+
+class VRM:
+    def __init__(self, js: dict)->None:
+        self.js = js
+        self._humanoid: Optional[Dict[str, int]] = None
+        self._blend_shape_groups: Optional[List[BlendShapeGroup]] = None
+        self._spring_bone_groups: Optional[List[SpringBoneGroup]] = None
+        self._collider_groups: Optional[List[ColliderGroup]] = None
+
+    @property
+    def meta(self)->Dict[str, Any]:
+        return self.js.get('meta', {})
+
+    @property
+    def humanoid(self)->Dict[str, int]:
+        '''
+        human bone name to node index
+        '''
+        if self._humanoid is None:
+            self._humanoid = {
+                x['bone']: x['node']
+                for x in self.js.get('humanoid', {}).get('humanBones', [])
+                if 'bone' in x and x.get('node', -1) != -1}
+        return self._humanoid
+
+    @property
+    def blend_shape_groups(self)->List[BlendShapeGroup]:
+        if self._blend_shape_groups is None:
+            self._blend_shape_groups = [
+                BlendShapeGroup(x) for x in
+                self.js.get('blendShapeMaster', {}).get('blendShapeGroups', [])]
+        return self._blend_shape_groups
+
+    @property
+    def spring_bone_groups(self)->List[SpringBoneGroup]:
+        if self._spring_bone_groups is None:
+            self._spring_bone_groups = [
+                SpringBoneGroup(x) for x in
+                self.js.get('secondaryAnimation', {}).get('boneGroups', [])]
+        return self._spring_bone_groups
+
+    @property
+    def collider_groups(self)->List[ColliderGroup]:
+        if self._collider_groups is None:
+            self._collider_groups = [
+                ColliderGroup(x) for x in
+                self.js.get('secondaryAnimation', {}).get('colliderGroups', [])]
+        return self._collider_groups
+
+
+def from_gltf(gltf: gltftypes.glTF)->Optional[VRM]:
+    js = gltf.extensions.get('VRM') if gltf.extensions else None
+    return VRM(js) if js else None
@@ -0,0 +1,168 @@
+import json
+from typing import List, Optional, Dict, Tuple
+
+import bpy
+from progress_report import ProgressReport
+
+from .import_manager import ImportManager
+from .node import Node, escape_identifier
+from . import vrm
+
+from logging import getLogger  # pylint: disable=C0411
+logger = getLogger(__name__)
+
+
+def _node_name(nodes: List[Optional[Node]], index: int)->str:
+    '''
+    bone name for joints, object name for others. '' if not imported
+    '''
+    if index < 0 or index >= len(nodes) or not nodes[index]:
+        return ''
+    node = nodes[index]
+    if node.bone_name:
+        return node.bone_name
+    if node.blender_object:
+        return node.blender_object.name
+    return ''
+
+
+def _dumps(js)->str:
+    return json.dumps(js, separators=(',', ':'))
+
+
+def _load_humanoid(ext: vrm.VRM, owner: bpy.types.Object,
+                   nodes: List[Optional[Node]])->int:
+    humanoid = {bone: _node_name(nodes, node)
+                for bone, node in ext.humanoid.items()}
+    humanoid = {k: v for k, v in humanoid.items() if v}
+    if humanoid:
+        owner['vrm_humanoid'] = humanoid
+    return len(humanoid)
+
+
+def _get_key_block(manager: ImportManager,
+                   bind: vrm.BlendShapeBind)->Optional[Tuple[bpy.types.Key, str]]:
+    if bind.mesh < 0 or bind.mesh >= len(manager.meshes):
+        return None
+    mesh = manager.meshes[bind.mesh]
+    if not mesh:
+        return None
+    shape_keys = mesh[0].shape_keys
+    # key_blocks[0] is basis
+    if not shape_keys or bind.index + 1 >= len(shape_keys.key_blocks):
+        return None
+    return shape_keys, shape_keys.key_blocks[bind.index + 1].name
+
+
+def _add_driver(owner: bpy.types.Object, shape_keys: bpy.types.Key,
+                key_name: str, inputs: List[Tuple[str, float]])->None:
+    fcurve = shape_keys.driver_add(f'key_blocks["{escape_identifier(key_name)}"].value')
+    driver = fcurve.driver
+    driver.type = 'SCRIPTED'
+    terms = []
+    for i, (prop, weight) in enumerate(inputs):
+        var = driver.variables.new()
+        var.name = f'g{i}'
+        var.type = 'SINGLE_PROP'
+        target = var.targets[0]
+        target.id_type = 'OBJECT'
+        target.id = owner
+        target.data_path = f'["{escape_identifier(prop)}"]'
+        terms.append(f'g{i} * {weight:g}')
+    driver.expression = ' + '.join(terms)
+
+
+def _load_blend_shapes(manager: ImportManager, ext: vrm.VRM,
+                       owner: bpy.types.Object)->Tuple[int, int]:
+    groups = ext.blend_shape_groups
+    if not groups:
+        return 0, 0
+
+    # group weights as properties on the owner, set in one pass
+    rna_ui = owner.get('_RNA_UI')
+    if rna_ui is None:
+        owner['_RNA_UI'] = {}
+        rna_ui = owner['_RNA_UI']
+
+    # (key, key block name) to the group properties that drive it
+    inputs: Dict[Tuple[bpy.types.Key, str], List[Tuple[str, float]]] = {}
+    bound = {}
+    for group in groups:
+        prop = f'vrm_{group.name}'
+        owner[prop] = 0.0
+        rna_ui[prop] = {'min': 0.0, 'max': 1.0, 'soft_min': 0.0, 'soft_max': 1.0,
+                        'description': f'VRM blend shape {group.preset_name}'}
+        binds = []
+        for bind in group.binds:
+            key_block = _get_key_block(manager, bind)
+            if not key_block:
+                continue
+            inputs.setdefault(key_block, []).append((prop, bind.weight))
+            binds.append((key_block[0].user.name, key_block[1], bind.weight))
+        bound[group.name] = {
+            'preset': group.preset_name,
+            'binary': group.is_binary,
+            'binds': binds,
+            'materialValues': group.material_values,
+        }
+    owner['vrm_blend_shapes'] = _dumps(bound)
+
+    if manager.vrm_blend_shapes != 'DRIVERS':
+        return len(groups), 0
+    # one driver per shape key, however many groups use it
+    for (shape_keys, key_name), key_inputs in inputs.items():
+        _add_driver(owner, shape_keys, key_name, key_inputs)
+    return len(groups), len(inputs)
+
+
+def _load_spring_bones(manager: ImportManager, ext: vrm.VRM,
+                       owner: bpy.types.Object,
+                       nodes: List[Optional[Node]])->int:
+    groups = ext.spring_bone_groups
+    colliders = ext.collider_groups
+    if not groups and not colliders:
+        return 0
+
+    owner['vrm_spring_bones'] = _dumps([{
+        'comment': group.comment,
+        'stiffness': group.stiffness,
+        'gravity_power': group.gravity_power,
+        'gravity_dir': manager.mod_v(group.gravity_dir),
+        'drag_force': group.drag_force,
+        'center': _node_name(nodes, group.center),
+        'hit_radius': group.hit_radius,
+        'bones': [_node_name(nodes, bone) for bone in group.bones],
+        'collider_groups': group.collider_groups,
+    } for group in groups])
+    owner['vrm_colliders'] = _dumps([{
+        'node': _node_name(nodes, collider_group.node),
+        'colliders': [{'offset': manager.mod_v(offset), 'radius': radius}
+                      for offset, radius in collider_group.colliders],
+    } for collider_group in colliders])
+    return len(groups)
+
+
+def load_vrm(progress: ProgressReport, manager: ImportManager,
+             nodes: List[Optional[Node]], root: Node)->None:
+    '''
+    VRM data is stored on the armature object, or the root if there is none
+    '''
+    ext = vrm.from_gltf(manager.gltf)
+    if not ext:
+        return
+    owner = next((node.blender_armature for node in nodes
+                  if node and node.blender_armature), root.blender_object)
+    progress.enter_substeps(3, "Loading VRM...")
+
+    if ext.meta:
+        owner['vrm_meta'] = _dumps(ext.meta)
+    human_bones = _load_humanoid(ext, owner, nodes)
+    progress.step()
+    groups, drivers = _load_blend_shapes(manager, ext, owner)
+    progress.step()
+    spring_bones = _load_spring_bones(manager, ext, owner, nodes)
+    progress.step()
+
+    manager.stats['vrm'] = (f'{human_bones} human bones, {groups} blend shape groups,'
+                            f' {drivers} drivers, {spring_bones} spring bone groups')
+    progress.leave_substeps()
@@ -0,0 +1,14 @@
+'''
+blender_io/__init__ imports bpy. register blender_io as a bare package so
+that the bpy free modules can be imported outside blender.
+'''
+import sys
+import types
+import pathlib
+
+ROOT = pathlib.Path(__file__).absolute().parent.parent
+
+if 'blender_io' not in sys.modules:
+    package = types.ModuleType('blender_io')
+    package.__path__ = [str(ROOT / 'blender_io')]  # type: ignore
+    sys.modules['blender_io'] = package
@@ -0,0 +1,96 @@
+'''
+write meshopt.npz with the reference encoder.
+
+    $ pip install meshoptimizer
+    $ python tests/fixtures/make_meshopt.py
+
+* vertex_{n}x{stride}: source (n, stride) uint8 and its encoded bytes
+* index_v{version}_{name}: source triangles and encoded bytes
+* sequence: source indices and encoded bytes
+* {filter}_{stride}: encoded filtered input and the reference decode_filter output
+'''
+import pathlib
+
+import numpy
+import meshoptimizer
+
+PATH = pathlib.Path(__file__).absolute().parent / 'meshopt.npz'
+
+
+def smooth(rng, count: int, stride: int)->numpy.ndarray:
+    values = numpy.cumsum(rng.normal(0, 0.01, (count, stride // 4)), 0)
+    return values.astype(numpy.float32).view(numpy.uint8).reshape(count, stride)
+
+
+def grid(triangles: int)->numpy.ndarray:
+    w = int(numpy.sqrt(triangles)) + 2
+    indices = []
+    for y in range(w - 1):
+        for x in range(w - 1):
+            a = y * w + x
+            indices += [a, a + 1, a + w, a + 1, a + w + 1, a + w]
+    return numpy.array(indices[:triangles * 3], numpy.uint32)
+
+
+def main()->None:
+    rng = numpy.random.default_rng(1)
+    arrays = {}
+
+    def add(name: str, source: numpy.ndarray, encoded)->None:
+        arrays[f'{name}_source'] = source
+        arrays[f'{name}_encoded'] = numpy.frombuffer(bytes(encoded), numpy.uint8)
+
+    meshoptimizer.encode_vertex_version(0)
+    for count, stride, random in ((1, 4, True), (17, 12, False),
+                                  (1000, 12, False), (200, 32, True),
+                                  (1500, 16, False)):
+        source = rng.integers(0, 256, (count, stride), dtype=numpy.uint8) \
+            if random else smooth(rng, count, stride)
+        add(f'vertex_{count}x{stride}', source,
+            meshoptimizer.encode_vertex_buffer(source, count, stride))
+
+    for version in (0, 1):
+        meshoptimizer.encode_index_version(version)
+        for triangles in (1, 10, 500):
+            source = grid(triangles)
+            vertex_count = int(source.max()) + 1
+            add(f'index_v{version}_grid{triangles}', source,
+                meshoptimizer.encode_index_buffer(source, len(source), vertex_count))
+            # free indices
+            shuffled = rng.permutation(vertex_count).astype(numpy.uint32)[source]
+            add(f'index_v{version}_shuffled{triangles}', shuffled,
+                meshoptimizer.encode_index_buffer(shuffled, len(shuffled), vertex_count))
+
+    source = rng.integers(0, 70000, 1000).astype(numpy.uint32)
+    add('sequence', source, meshoptimizer.encode_index_sequence(source, len(source), 70000))
+
+    def add_filter(name: str, source: numpy.ndarray, stride: int, decode_filter)->None:
+        count = len(source) // stride
+        arrays[f'{name}_{stride}_reference'] = numpy.frombuffer(
+            bytes(decode_filter(source.copy(), count, stride)), numpy.uint8)
+        arrays[f'{name}_{stride}_encoded'] = numpy.frombuffer(bytes(
+            meshoptimizer.encode_vertex_buffer(source.reshape(count, stride), count, stride)),
+            numpy.uint8)
+
+    count = 256
+    for stride in (4, 8):
+        dtype = numpy.int8 if stride == 4 else numpy.int16
+        # x, y anywhere in the octahedral square. z encodes 1.0
+        one = 127 if stride == 4 else 32767
+        source = rng.integers(-one, one + 1, (count, 4))
+        source[:, 2] = one
+        source = source.astype(dtype).view(numpy.uint8).ravel()
+        add_filter('octahedral', source, stride, meshoptimizer.decode_filter_oct)
+    source = rng.integers(-30000, 30000, (count, 4)).astype(numpy.int16).view(numpy.uint8).ravel()
+    add_filter('quaternion', source, 8, meshoptimizer.decode_filter_quat)
+    mantissa = rng.integers(-2**23, 2**23, count) & 0xffffff
+    exponent = rng.integers(-20, 20, count) << 24
+    source = (mantissa | exponent).astype(numpy.uint32).view(numpy.uint8)
+    add_filter('exponential', source, 4, meshoptimizer.decode_filter_exp)
+
+    numpy.savez_compressed(PATH, **arrays)
+    print(PATH, PATH.stat().st_size)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+import math
+
+import numpy
+
+from blender_io.gltftypes import AnimationSampler_interpolation as Interpolation
+from blender_io.animation_math import hermite, quat_slerp
+from blender_io.animation_sampler import Track, evaluate, frame_times, resample
+
+
+def quat_z(degrees):
+    # (w, x, y, z) around z
+    half = math.radians(degrees) / 2
+    return (math.cos(half), 0, 0, math.sin(half))
+
+
+def test_step():
+    track = Track(numpy.array([0, 1, 2], numpy.float32),
+                  numpy.array([[0], [10], [20]], numpy.float32), Interpolation.STEP)
+    t = [-1, 0, 0.5, 0.999, 1, 1.5, 2, 3]
+    assert evaluate(track, t).ravel().tolist() == [0, 0, 0, 0, 10, 10, 20, 20]
+
+
+def test_linear():
+    track = Track(numpy.array([0, 1, 3], numpy.float32),
+                  numpy.array([[0, 4], [10, 4], [20, 0]], numpy.float32),
+                  Interpolation.LINEAR)
+    values = evaluate(track, [-1, 0.25, 1, 2, 2.5, 5])
+    assert numpy.allclose(values, [[0, 4], [2.5, 4], [10, 4], [15, 2], [17.5, 1], [20, 0]])
+
+
+def test_single_key():
+    track = Track(numpy.array([1], numpy.float32),
+                  numpy.array([[3, 4]], numpy.float32), Interpolation.LINEAR)
+    assert evaluate(track, [0, 1, 2]).tolist() == [[3, 4]] * 3
+
+
+def test_rotation_slerp():
+    track = Track(numpy.array([0, 1], numpy.float32),
+                  numpy.array([quat_z(0), quat_z(90)]), Interpolation.LINEAR)
+    values = evaluate(track, [0.25, 0.5], rotation=True)
+    assert numpy.allclose(values, [quat_z(22.5), quat_z(45)])
+    # nlerp is exact only at the middle
+    nlerp = evaluate(track, [0.25, 0.5], rotation=True, spherical=False)
+    assert numpy.allclose(nlerp[1], quat_z(45))
+    assert not numpy.allclose(nlerp[0], quat_z(22.5), atol=1e-3)
+
+
+def test_rotation_shorter_arc():
+    # -q is the same rotation. interpolate from 0 to 90, not through 180
+    track = Track(numpy.array([0, 1], numpy.float32),
+                  numpy.array([quat_z(0), numpy.negative(quat_z(90))]),
+                  Interpolation.LINEAR)
+    value = evaluate(track, [0.5], rotation=True)[0]
+    assert numpy.allclose(value, quat_z(45)) or numpy.allclose(-value, quat_z(45))
+
+
+def test_slerp_parallel():
+    a = numpy.array([quat_z(10)])
+    assert numpy.allclose(quat_slerp(a, a, numpy.array([[0.3]])), a)
+
+
+def test_hermite():
+    # flat tangents. smoothstep 3s^2 - 2s^3
+    assert hermite(0, 0, 1, 0, 1, 0.5) == 0.5
+    assert hermite(0, 0, 1, 0, 1, 0.25) == 0.15625
+    # tangents are per second. (s^3 - 2s^2 + s) * dt * m0 + p1 term
+    assert hermite(0, 1, 1, 0, 2, 0.5) == 0.75
+
+
+def test_cubicspline():
+    # per key (in tangent, value, out tangent)
+    times = numpy.array([0, 2], numpy.float32)
+    output = numpy.array([0, 0, 1, 0, 1, 0], numpy.float32)
+    track = Track.from_output(times, output, Interpolation.CUBICSPLINE)
+    assert track.values.ravel().tolist() == [0, 1]
+    assert track.out_tangents.ravel().tolist() == [1, 0]
+    values = evaluate(track, [0, 1, 2, 3]).ravel()
+    assert numpy.allclose(values, [0, 0.75, 1, 1])
+
+
+def test_cubicspline_rotation_is_normalized():
+    times = numpy.array([0, 1], numpy.float32)
+    zero = (0, 0, 0, 0)
+    output = numpy.array([zero, quat_z(0), zero, zero, quat_z(90), zero])
+    track = Track.from_output(times, output, Interpolation.CUBICSPLINE)
+    values = evaluate(track, numpy.linspace(0, 1, 5), rotation=True)
+    assert numpy.allclose(numpy.linalg.norm(values, axis=1), 1)
+    assert numpy.allclose(values[2], quat_z(45))
+
+
+def test_frame_times():
+    times = numpy.array([0.01, 0.1], numpy.float32)
+    result = frame_times(times, 30)
+    assert numpy.allclose(result, [0.01, 1 / 30, 2 / 30, 0.1])
+    assert result.dtype == numpy.float32
+    assert len(frame_times(numpy.array([0, 1], numpy.float32), 30)) == 31
+
+
+def test_resample():
+    track = Track(numpy.array([0, 1], numpy.float32),
+                  numpy.array([[0], [1]], numpy.float32), Interpolation.CUBICSPLINE,
+                  numpy.zeros((2, 1), numpy.float32), numpy.zeros((2, 1), numpy.float32))
+    baked = resample(track, numpy.array([0, 0.5, 1], numpy.float32))
+    assert baked.interpolation == Interpolation.LINEAR
+    assert baked.values.ravel().tolist() == [0, 0.5, 1]
+    step = Track(track.times, track.values, Interpolation.STEP)
+    assert resample(step, baked.times).interpolation == Interpolation.STEP
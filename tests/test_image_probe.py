@@ -0,0 +1,77 @@
+import struct
+import zlib
+
+from blender_io import image_probe
+
+
+def chunk(chunk_type, data):
+    crc = zlib.crc32(chunk_type + data)
+    return struct.pack('>I', len(data)) + chunk_type + data + struct.pack('>I', crc)
+
+
+def make_png(width, height, color_type, trns=False):
+    ihdr = struct.pack('>IIBBBBB', width, height, 8, color_type, 0, 0, 0)
+    data = image_probe.PNG_SIGNATURE + chunk(b'IHDR', ihdr)
+    if color_type == 3:
+        data += chunk(b'PLTE', b'\0\0\0\xff\xff\xff')
+    if trns:
+        data += chunk(b'tRNS', b'\0')
+    data += chunk(b'IDAT', zlib.compress(b'\0' * (width + 1) * height))
+    return data + chunk(b'IEND', b'')
+
+
+def segment(marker, payload):
+    return bytes((0xFF, marker)) + struct.pack('>H', len(payload) + 2) + payload
+
+
+def make_jpeg(width, height, sof=0xC0):
+    return (b'\xff\xd8'
+            + segment(0xE0, b'JFIF\0\x01\x01\0\0\x01\0\x01\0\0')
+            + segment(0xDB, b'\0' + bytes(64))
+            # padding before a marker is allowed
+            + b'\xff'
+            + segment(sof, struct.pack('>BHHB', 8, height, width, 1) + b'\x01\x11\0')
+            + segment(0xC4, b'\0' + bytes(16))
+            + segment(0xDA, b'\x01\x01\0\0\x3f\0')
+            + b'\0' * 16 + b'\xff\xd9')
+
+
+def test_png():
+    info = image_probe.probe(make_png(300, 200, 2))
+    assert (info.format, info.width, info.height, info.has_alpha) == ('PNG', 300, 200, False)
+    assert image_probe.probe(make_png(4, 4, 6)).has_alpha
+    assert image_probe.probe(make_png(4, 4, 4)).has_alpha
+
+
+def test_png_trns():
+    assert image_probe.probe(make_png(4, 4, 3, trns=True)).has_alpha
+    assert not image_probe.probe(make_png(4, 4, 3)).has_alpha
+
+
+def test_jpeg():
+    info = image_probe.probe(make_jpeg(1920, 1080))
+    assert (info.format, info.width, info.height, info.has_alpha) == ('JPEG', 1920, 1080, False)
+
+
+def test_progressive_jpeg():
+    info = image_probe.probe(make_jpeg(640, 480, sof=0xC2))
+    assert (info.width, info.height) == (640, 480)
+
+
+def test_truncated():
+    png = make_png(300, 200, 2)
+    jpeg = make_jpeg(1920, 1080)
+    for data in (png, jpeg):
+        for size in range(len(data) // 2):
+            # no exception
+            image_probe.probe(data[:size])
+    assert image_probe.probe(png[:20]) is None
+    # header cut before SOF
+    assert image_probe.probe(jpeg[:30]) is None
+
+
+def test_unknown():
+    assert image_probe.probe(b'') is None
+    assert image_probe.probe(b'GIF89a' + bytes(32)) is None
+    # DHT is not a start of frame
+    assert image_probe.probe(b'\xff\xd8' + segment(0xC4, bytes(20))) is None
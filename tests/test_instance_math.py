@@ -0,0 +1,33 @@
+import numpy
+
+from blender_io.instance_math import FACE, compose, face_corners, is_similarity
+
+
+def test_face_centered():
+    assert numpy.allclose(FACE.mean(axis=0), 0, atol=1e-7)
+    # area 1, normal +Z
+    normal = numpy.cross(FACE[1] - FACE[0], FACE[2] - FACE[0])
+    assert numpy.allclose(normal, (0, 0, 2), atol=1e-6)
+
+
+def test_face_corners_centroid_is_translation():
+    t = numpy.array([(1, 2, 3), (-4, 0.5, 7)], numpy.float32)
+    # 90 degrees around x, 45 degrees around y
+    q = numpy.array([(numpy.sqrt(0.5), 0, 0, numpy.sqrt(0.5)),
+                     (0, numpy.sin(numpy.pi / 8), 0, numpy.cos(numpy.pi / 8))],
+                    numpy.float32)
+    s = numpy.array([(2, 2, 2), (0.5, 0.5, 0.5)], numpy.float32)
+    m = compose(t, q, s)
+    corners = face_corners(m)
+    assert numpy.allclose(corners.mean(axis=1), t, atol=1e-5)
+    # uniform scale is the sqrt of the face area
+    edges = numpy.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    area = numpy.linalg.norm(edges, axis=1) / 2
+    assert numpy.allclose(numpy.sqrt(area), s[:, 0], atol=1e-5)
+
+
+def test_is_similarity():
+    t = numpy.zeros((3, 3), numpy.float32)
+    q = numpy.tile(numpy.array((0, 0, 0, 1), numpy.float32), (3, 1))
+    s = numpy.array([(2, 2, 2), (1, 2, 1), (-1, -1, -1)], numpy.float32)
+    assert is_similarity(compose(t, q, s)).tolist() == [True, False, False]
@@ -0,0 +1,63 @@
+import numpy
+
+from blender_io.gltftypes import AnimationSampler_interpolation as Interpolation
+from blender_io.keyframe_reduction import reduce_keys
+
+
+def test_short_or_zero_tolerance_keeps_all():
+    times = numpy.arange(5, dtype=numpy.float32)
+    values = numpy.zeros(5, numpy.float32)
+    assert reduce_keys(Interpolation.LINEAR, times, values, 0).tolist() == [0, 1, 2, 3, 4]
+    assert reduce_keys(Interpolation.LINEAR, times[:2], values[:2], 1).tolist() == [0, 1]
+
+
+def test_linear_even_position():
+    # key 2 is only a candidate on the even pass
+    times = numpy.arange(5, dtype=numpy.float32)
+    values = numpy.array([0, 1, 1, 1, 0], numpy.float32)
+    assert reduce_keys(Interpolation.LINEAR, times, values, 1e-5).tolist() == [0, 1, 3, 4]
+
+
+def test_linear_line():
+    times = numpy.arange(10, dtype=numpy.float32)
+    values = times * 2 + 1
+    assert reduce_keys(Interpolation.LINEAR, times, values, 1e-5).tolist() == [0, 9]
+
+
+def test_linear_tolerance():
+    times = numpy.arange(3, dtype=numpy.float32)
+    values = numpy.array([0, 0.1, 0], numpy.float32)
+    assert reduce_keys(Interpolation.LINEAR, times, values, 0.05).tolist() == [0, 1, 2]
+    assert reduce_keys(Interpolation.LINEAR, times, values, 0.2).tolist() == [0, 2]
+
+
+def test_step():
+    times = numpy.arange(6, dtype=numpy.float32)
+    values = numpy.array([0, 0, 0, 1, 1, 1], numpy.float32)
+    kept = reduce_keys(Interpolation.STEP, times, values, 1e-5)
+    # the jump at key 3 stays
+    assert kept.tolist() == [0, 3, 5]
+
+
+def test_cubic_spline_exact():
+    # one hermite segment reproduces t^3 with tangents 3t^2
+    times = numpy.arange(5, dtype=numpy.float64)
+    values = times ** 3
+    tangents = 3 * times ** 2
+    kept = reduce_keys(Interpolation.CUBICSPLINE, times, values, 1e-6,
+                       tangents, tangents)
+    assert kept.tolist() == [0, 4]
+
+
+def test_cubic_spline_bulge():
+    # equal values, but the tangents at key 2 bulge the curve between keys
+    times = numpy.arange(5, dtype=numpy.float64)
+    values = numpy.zeros(5)
+    tangents = numpy.array([0, 0, 1, 0, 0], numpy.float64)
+    kept = reduce_keys(Interpolation.CUBICSPLINE, times, values, 1e-3,
+                       tangents, tangents)
+    assert 2 in kept.tolist()
+    # without the tangents everything goes
+    flat = numpy.zeros(5)
+    assert reduce_keys(Interpolation.CUBICSPLINE, times, values, 1e-3,
+                       flat, flat).tolist() == [0, 4]
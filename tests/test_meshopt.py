@@ -0,0 +1,113 @@
+'''
+decoder against data from the reference encoder (fixtures/make_meshopt.py)
+'''
+import pathlib
+
+import numpy
+import pytest
+
+from blender_io import meshopt
+
+FIXTURE = numpy.load(pathlib.Path(__file__).absolute().parent / 'fixtures' / 'meshopt.npz')
+
+
+def _names(prefix: str):
+    return sorted(name[:-len('_encoded')] for name in FIXTURE.files
+                  if name.startswith(prefix) and name.endswith('_encoded'))
+
+
+@pytest.mark.parametrize('name', _names('vertex_'))
+def test_vertex_buffer(name):
+    source = FIXTURE[f'{name}_source']
+    count, stride = source.shape
+    encoded = FIXTURE[f'{name}_encoded'].tobytes()
+    decoded = meshopt.decode('ATTRIBUTES', 'NONE', count, stride, encoded)
+    assert decoded == source.tobytes()
+
+
+def _rotations(triangles: numpy.ndarray):
+    # the encoder may rotate a triangle, keeping its winding
+    return [{tuple(numpy.roll(t, k)) for k in range(3)} for t in triangles]
+
+
+@pytest.mark.parametrize('name', _names('index_'))
+@pytest.mark.parametrize('stride', (2, 4))
+def test_index_buffer(name, stride):
+    source = FIXTURE[f'{name}_source']
+    encoded = FIXTURE[f'{name}_encoded'].tobytes()
+    data = meshopt.decode('TRIANGLES', 'NONE', len(source), stride, encoded)
+    decoded = numpy.frombuffer(data, numpy.uint16 if stride == 2 else numpy.uint32)
+    assert len(decoded) == len(source)
+    for triangle, rotations in zip(decoded.reshape(-1, 3),
+                                   _rotations(source.reshape(-1, 3))):
+        assert tuple(triangle) in rotations
+
+
+def test_index_sequence():
+    source = FIXTURE['sequence_source']
+    encoded = FIXTURE['sequence_encoded'].tobytes()
+    data = meshopt.decode('INDICES', 'NONE', len(source), 4, encoded)
+    assert numpy.array_equal(numpy.frombuffer(data, numpy.uint32), source)
+
+
+@pytest.mark.parametrize('name, filter_name, dtype', (
+    ('octahedral_4', 'OCTAHEDRAL', numpy.int8),
+    ('octahedral_8', 'OCTAHEDRAL', numpy.int16),
+    ('quaternion_8', 'QUATERNION', numpy.int16),
+    ('exponential_4', 'EXPONENTIAL', numpy.float32),
+))
+def test_filter(name, filter_name, dtype):
+    stride = int(name.rsplit('_', 1)[1])
+    reference = FIXTURE[f'{name}_reference']
+    count = len(reference) // stride
+    encoded = FIXTURE[f'{name}_encoded'].tobytes()
+    decoded = numpy.frombuffer(
+        meshopt.decode('ATTRIBUTES', filter_name, count, stride, encoded), dtype)
+    expected = reference.view(dtype)
+    if dtype == numpy.float32:
+        assert numpy.array_equal(decoded, expected)
+    else:
+        # the reference rounds with SIMD float math
+        diff = numpy.abs(decoded.astype(numpy.int32) - expected.astype(numpy.int32))
+        assert diff.max() <= 1
+
+
+@pytest.mark.parametrize('name', ('index_v1_grid500', 'index_v0_shuffled500',
+                                  'index_v1_shuffled10'))
+def test_index_buffer_truncated(name):
+    source = FIXTURE[f'{name}_source']
+    encoded = FIXTURE[f'{name}_encoded'].tobytes()
+    for size in range(1, len(encoded)):
+        with pytest.raises(meshopt.MeshoptError):
+            meshopt.decode_index_buffer(encoded[:size], len(source))
+
+
+def test_index_buffer_corrupt():
+    source = FIXTURE['index_v1_shuffled500_source']
+    encoded = bytearray(FIXTURE['index_v1_shuffled500_encoded'].tobytes())
+    rng = numpy.random.default_rng(0)
+    for _ in range(200):
+        data = bytearray(encoded)
+        for i in rng.integers(1, len(data), 4):
+            data[i] = int(rng.integers(0, 256))
+        try:
+            meshopt.decode_index_buffer(bytes(data), len(source))
+        except meshopt.MeshoptError:
+            pass
+
+
+def test_vertex_buffer_truncated():
+    source = FIXTURE['vertex_1000x12_source']
+    encoded = FIXTURE['vertex_1000x12_encoded'].tobytes()
+    for size in range(0, len(encoded), 7):
+        with pytest.raises(meshopt.MeshoptError):
+            meshopt.decode_vertex_buffer(encoded[:size], len(source), 12)
+
+
+def test_benchmark():
+    source = FIXTURE['vertex_1500x16_source']
+    encoded = FIXTURE['vertex_1500x16_encoded'].tobytes()
+    decoded, copied = meshopt.benchmark('ATTRIBUTES', 'NONE', len(source), 16,
+                                        encoded, repeat=3)
+    print(f'vertex decode {decoded:.1f} MB/s, copy {copied:.1f} MB/s')
+    assert decoded > 0 and copied > 0
@@ -0,0 +1,125 @@
+from blender_io import gltftypes, planner, selection
+
+VERTEX_COUNT = 1000
+INDEX_COUNT = 3000
+IMAGE_BYTES = 1 << 20
+KEY_COUNT = 100
+
+
+def make_gltf(animation=True):
+    js = {
+        'asset': {'version': '2.0'},
+        'scene': 0,
+        'scenes': [{'nodes': [0]}],
+        'nodes': [{'name': 'body', 'mesh': 0}],
+        'meshes': [{'primitives': [{'attributes': {'POSITION': 0},
+                                    'indices': 1, 'material': 0}]}],
+        'materials': [{'pbrMetallicRoughness': {'baseColorTexture': {'index': 0}}}],
+        'textures': [{'source': 0}],
+        'images': [{'bufferView': 2, 'mimeType': 'image/png'}],
+        'buffers': [{'byteLength': 0}],
+        'bufferViews': [
+            {'buffer': 0, 'byteLength': VERTEX_COUNT * 12},
+            {'buffer': 0, 'byteLength': INDEX_COUNT * 4},
+            {'buffer': 0, 'byteLength': IMAGE_BYTES},
+        ],
+        'accessors': [
+            {'bufferView': 0, 'componentType': 5126, 'count': VERTEX_COUNT, 'type': 'VEC3'},
+            {'bufferView': 1, 'componentType': 5125, 'count': INDEX_COUNT, 'type': 'SCALAR'},
+            {'componentType': 5126, 'count': KEY_COUNT, 'type': 'SCALAR'},
+            {'componentType': 5126, 'count': KEY_COUNT, 'type': 'VEC4'},
+        ],
+    }
+    if animation:
+        js['animations'] = [{
+            'channels': [{'sampler': 0, 'target': {'node': 0, 'path': 'rotation'}}],
+            'samplers': [{'input': 2, 'output': 3}],
+        }]
+    return gltftypes.from_json(js)
+
+
+def test_estimate():
+    gltf = make_gltf()
+    plan = planner.estimate(gltf, selection.from_scene(gltf))
+    assert plan.vertices == VERTEX_COUNT
+    assert plan.loops == INDEX_COUNT
+    assert plan.triangles == INDEX_COUNT // 3
+    assert plan.texture_bytes == IMAGE_BYTES
+    assert plan.stages['textures'] == IMAGE_BYTES * planner.DECODE_RATIO['image/png']
+    assert plan.keyframes == KEY_COUNT * 4
+    assert plan.memory == sum(plan.stages.values())
+
+
+def test_estimate_options():
+    gltf = make_gltf()
+    s = selection.from_scene(gltf)
+    full = planner.estimate(gltf, s)
+    proxy = planner.estimate(gltf, s, proxy_size=256)
+    assert proxy.stages['textures'] == 256 * 256 * 4
+    lazy = planner.estimate(gltf, s, lazy_textures=True)
+    assert 'textures' not in lazy.stages
+    assert lazy.datablocks == full.datablocks
+    assert 'animation' not in planner.estimate(gltf, s, import_animation=False).stages
+    bounds = planner.estimate(gltf, s, bounds_only=True)
+    assert bounds.vertices == 8
+    assert bounds.memory < full.memory
+
+
+def test_estimate_empty_selection():
+    gltf = make_gltf()
+    plan = planner.estimate(gltf, selection.Selection(gltf))
+    assert plan.vertices == 0
+    assert plan.stages['textures'] == 0
+
+
+OPTIONS = {
+    'import_animation': True,
+    'proxy_size': 0,
+    'lazy_textures': False,
+    'bounds_only': False,
+}
+
+
+def fit(gltf, budget, **kw):
+    return planner.fit_budget(gltf, selection.from_scene(gltf), budget,
+                              dict(OPTIONS, **kw))
+
+
+def test_fit_budget_unchanged():
+    gltf = make_gltf()
+    plan, changed = fit(gltf, 1 << 30)
+    assert changed == {}
+    assert plan.memory <= 1 << 30
+
+
+def test_fit_budget_proxy_size():
+    gltf = make_gltf()
+    full, _ = fit(gltf, 1 << 30)
+    # just too much for full resolution textures
+    plan, changed = fit(gltf, full.memory - 1)
+    assert changed == {'proxy_size': planner.PROXY_SIZE}
+    assert plan.memory < full.memory
+
+
+def test_fit_budget_animation():
+    gltf = make_gltf()
+    proxy, _ = fit(gltf, 1 << 30, proxy_size=planner.PROXY_SIZE)
+    plan, changed = fit(gltf, proxy.memory - 1)
+    assert changed == {'proxy_size': planner.PROXY_SIZE, 'import_animation': False}
+    assert 'animation' not in plan.stages
+
+
+def test_fit_budget_lazy_textures():
+    gltf = make_gltf()
+    lazy, _ = fit(gltf, 1 << 30, lazy_textures=True)
+    # no proxy downgrade for lazy textures, animation goes first
+    plan, changed = fit(gltf, lazy.memory - 1, lazy_textures=True)
+    assert changed == {'import_animation': False}
+    assert 'textures' not in plan.stages
+
+
+def test_fit_budget_does_not_fit():
+    gltf = make_gltf()
+    plan, changed = fit(gltf, 1)
+    assert changed is None
+    assert plan.memory > 1
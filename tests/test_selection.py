@@ -0,0 +1,84 @@
+from blender_io import gltftypes, selection
+
+
+def make_gltf():
+    # scene: 0 -> (1 -> 2, 3), 4 is outside of the scene
+    return gltftypes.from_json({
+        'asset': {'version': '2.0'},
+        'scene': 0,
+        'scenes': [{'nodes': [0]}],
+        'nodes': [
+            {'name': 'root', 'children': [1, 3]},
+            {'name': 'body', 'children': [2], 'mesh': 0},
+            {'name': 'hat', 'mesh': 1},
+            {'name': 'shoe', 'mesh': 1},
+            {'name': 'extra', 'mesh': 0},
+        ],
+        'meshes': [
+            {'name': 'body_mesh', 'primitives': [{'attributes': {'POSITION': 0}}]},
+            {'name': 'item_mesh', 'primitives': [{'attributes': {'POSITION': 0}}]},
+        ],
+    })
+
+
+def test_parse_indices():
+    assert selection.parse_indices('3, 17 20') == [3, 17, 20]
+    assert selection.parse_indices('') == []
+    assert selection.parse_indices('2 x') == [2, -1]
+
+
+def test_no_filter_is_scene():
+    gltf = make_gltf()
+    s = selection.from_filter(gltf)
+    assert s.nodes == {0, 1, 2, 3}
+    assert s.meshes == {0, 1}
+
+
+def test_root_nodes():
+    s = selection.from_filter(make_gltf(), root_nodes=[1])
+    # root is kept to place the subtree
+    assert s.nodes == {0, 1, 2}
+    assert s.roots == [0]
+    assert s.meshes == {0, 1}
+
+
+def test_patterns():
+    gltf = make_gltf()
+    s = selection.from_filter(gltf, node_pattern='sh*')
+    assert s.nodes == {0, 3}
+    assert s.meshes == {1}
+    s = selection.from_filter(gltf, mesh_pattern='body_*')
+    assert s.nodes == {0, 1}
+    assert s.meshes == {0}
+
+
+def test_invalid_root_nodes_are_empty(caplog):
+    gltf = make_gltf()
+    s = selection.from_filter(gltf, root_nodes=[5, 99])
+    assert not s.nodes and not s.meshes and not s.roots
+    assert 'out of range: 99' in caplog.text
+    s = selection.from_filter(gltf, root_nodes=selection.parse_indices('x'))
+    assert not s.nodes
+
+
+def test_unmatched_filter_is_empty():
+    gltf = make_gltf()
+    assert not selection.from_filter(gltf, node_pattern='nothing').nodes
+    assert not selection.from_filter(gltf, mesh_pattern='nothing').nodes
+    # outside of the scene
+    assert not selection.from_filter(gltf, root_nodes=[4]).nodes
+
+
+def test_scene_index_out_of_range(caplog):
+    gltf = make_gltf()
+    s = selection.from_filter(gltf, scene_index=3)
+    assert s.nodes == {0, 1, 2, 3}
+    assert 'no scene 3' in caplog.text
+    assert selection.from_scene(gltf, -5).nodes == {0, 1, 2, 3}
+
+
+def test_default_scene_out_of_range():
+    gltf = make_gltf()
+    gltf.scene = 7
+    # first scene
+    assert selection.from_scene(gltf).nodes == {0, 1, 2, 3}